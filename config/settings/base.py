@@ -47,6 +47,8 @@ DJANGO_APPS = [
     'django.contrib.sites',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    # PostgreSQL specific features, e.g. trigram index operator classes
+    'django.contrib.postgres',
     # Useful template tags
     # 'django.contrib.humanize',
     # Admin
@@ -112,6 +114,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'projectroles.middleware.RoleMemoMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'axes.middleware.AxesMiddleware',  # Should be the last one on the list
@@ -686,6 +689,18 @@ PROJECTROLES_SIDEBAR_ICON_SIZE = env.int('PROJECTROLES_SIDEBAR_ICON_SIZE', 36)
 # PROJECTROLES_SECRET_LENGTH = 32
 # PROJECTROLES_HELP_HIGHLIGHT_DAYS = 7
 # PROJECTROLES_SEARCH_PAGINATION = 5
+# Concurrent plugin search workers (if 0, search plugins sequentially)
+PROJECTROLES_SEARCH_MAX_WORKERS = env.int('PROJECTROLES_SEARCH_MAX_WORKERS', 4)
+# Timeout for plugin search in seconds
+PROJECTROLES_SEARCH_TIMEOUT = env.int('PROJECTROLES_SEARCH_TIMEOUT', 30)
+# Timeout for cached search results in seconds (if 0, cache is disabled)
+PROJECTROLES_SEARCH_CACHE_TIMEOUT = env.int(
+    'PROJECTROLES_SEARCH_CACHE_TIMEOUT', 60
+)
+# Plugins for which search results are not cached
+PROJECTROLES_SEARCH_CACHE_EXCLUDE = env.list(
+    'PROJECTROLES_SEARCH_CACHE_EXCLUDE', None, []
+)
 # Role list pagination
 PROJECTROLES_ROLE_PAGINATION = env.int('PROJECTROLES_ROLE_PAGINATION', 15)
 # Support for viewing the site in "kiosk mode" (experimental)
@@ -706,6 +721,15 @@ PROJECTROLES_HIDE_PROJECT_APPS = env.list(
     'PROJECTROLES_HIDE_PROJECT_APPS', None, []
 )
 
+# Timeout for cross-request project permission cache (if 0, cache is disabled)
+PROJECTROLES_PERM_CACHE_TIMEOUT = env.int(
+    'PROJECTROLES_PERM_CACHE_TIMEOUT', 300
+)
+# Timeout for cross-request app setting value cache (if 0, cache is disabled)
+PROJECTROLES_APP_SETTING_CACHE_TIMEOUT = env.int(
+    'PROJECTROLES_APP_SETTING_CACHE_TIMEOUT', 300
+)
+
 # Set limit for delegate roles per project (if 0, no limit is applied)
 PROJECTROLES_DELEGATE_LIMIT = env.int('PROJECTROLES_DELEGATE_LIMIT', 1)
 
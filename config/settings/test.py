@@ -209,4 +209,11 @@ PROJECTROLES_TEST_UI_WAIT_TIME = 30
 PROJECTROLES_TEST_UI_LEGACY_LOGIN = env.bool(
     'PROJECTROLES_TEST_UI_LEGACY_LOGIN', False
 )
+
+# Search plugins in the test thread to access test database transactions
+PROJECTROLES_SEARCH_MAX_WORKERS = 0
+
+# Benchmark test settings
+PROJECTROLES_TEST_BENCHMARK = env.bool('PROJECTROLES_TEST_BENCHMARK', False)
+
 PROJECTROLES_APP_SETTINGS_TEST = None
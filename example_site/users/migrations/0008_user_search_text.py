@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:14
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0049_project_trigram_indexes'),
+        ('users', '0007_user_enable_update'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='search_text',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Concat(
+                    'username',
+                    models.Value(' '),
+                    'name',
+                    models.Value(' '),
+                    'first_name',
+                    models.Value(' '),
+                    'last_name',
+                    models.Value(' '),
+                    'email',
+                    output_field=models.TextField(),
+                ),
+                help_text='User names and email for search (auto-generated)',
+                output_field=models.TextField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('search_text'),
+                    name='gin_trgm_ops',
+                ),
+                name='user_search_trgm',
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:54
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('filesfolders', '0006_alter_file_unique_together_and_more'),
+        ('projectroles', '0049_project_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='folder',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('name'),
+                    name='gin_trgm_ops',
+                ),
+                name='folder_name_trgm',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='folder',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('description'),
+                    name='gin_trgm_ops',
+                ),
+                name='folder_description_trgm',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('name'),
+                    name='gin_trgm_ops',
+                ),
+                name='file_name_trgm',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='file',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('description'),
+                    name='gin_trgm_ops',
+                ),
+                name='file_description_trgm',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='hyperlink',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('name'),
+                    name='gin_trgm_ops',
+                ),
+                name='hyperlink_name_trgm',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='hyperlink',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('description'),
+                    name='gin_trgm_ops',
+                ),
+                name='hyperlink_description_trgm',
+            ),
+        ),
+    ]
@@ -5,8 +5,10 @@ import uuid
 from typing import Optional
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db.models import Q, QuerySet
+from django.db.models.functions import Upper
 
 from db_file_storage.model_utils import delete_file, delete_file_if_needed
 
@@ -70,7 +72,8 @@ class FilesfoldersManager(models.Manager):
         keywords: Optional[dict] = None,
     ) -> QuerySet:
         """
-        Return files, folders and/or hyperlinks matching the query.
+        Return files, folders and/or hyperlinks matching the query. Partial
+        matches are looked up using trigram indexes.
 
         :param search_terms: Search terms (list of strings)
         :param projects: QuerySet of projects where the terms are searched
@@ -177,6 +180,16 @@ class Folder(BaseFilesfoldersClass):
                 name='unique_project_folder_name',
             ),
         ]
+        indexes = [
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='folder_name_trgm',
+            ),
+            GinIndex(
+                OpClass(Upper('description'), name='gin_trgm_ops'),
+                name='folder_description_trgm',
+            ),
+        ]
 
     def __str__(self):
         return '{}: {}{}'.format(
@@ -298,6 +311,16 @@ class File(BaseFilesfoldersClass):
                 name='unique_project_file_name',
             ),
         ]
+        indexes = [
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='file_name_trgm',
+            ),
+            GinIndex(
+                OpClass(Upper('description'), name='gin_trgm_ops'),
+                name='file_description_trgm',
+            ),
+        ]
 
     def __str__(self):
         return '{}: {}{}'.format(
@@ -341,6 +364,16 @@ class HyperLink(BaseFilesfoldersClass):
                 name='unique_project_hyperlink_name',
             ),
         ]
+        indexes = [
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='hyperlink_name_trgm',
+            ),
+            GinIndex(
+                OpClass(Upper('description'), name='gin_trgm_ops'),
+                name='hyperlink_description_trgm',
+            ),
+        ]
 
     def __str__(self):
         return '{}: {}{}'.format(
@@ -5,13 +5,13 @@ from uuid import UUID
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import QuerySet
+from django.db.models import Count, QuerySet
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
 
 # Projectroles dependency
 from projectroles.app_settings import AppSettingAPI
-from projectroles.models import Project, SODAR_CONSTANTS, CAT_DELIMITER
+from projectroles.models import Project, SODAR_CONSTANTS
 from projectroles.plugins import (
     ProjectAppPluginPoint,
     PluginAppSettingDef,
@@ -359,9 +359,8 @@ class ProjectAppPlugin(ProjectAppPluginPoint):
         :param category: Project object of CATEGORY type
         :return: List of PluginCategoryStatistic objects
         """
-        children = Project.objects.filter(
-            type=PROJECT_TYPE_PROJECT,
-            full_title__startswith=category.full_title + CAT_DELIMITER,
+        children = Project.objects.descendants_of(category).filter(
+            type=PROJECT_TYPE_PROJECT
         )
         val = File.objects.filter(project__in=children).count()
         desc = 'Files uploaded to {} in this {}'.format(
@@ -390,14 +389,41 @@ class ProjectAppPlugin(ProjectAppPluginPoint):
         :param user: User object (current user)
         :return: String (may contain HTML), integer or None
         """
-        count = 0
-        if column_id == 'files':
-            count = File.objects.filter(project=project).count()
-        elif column_id == 'links':
-            count = HyperLink.objects.filter(project=project).count()
-        if count > 0:
-            url = reverse(
-                'filesfolders:list', kwargs={'project': project.sodar_uuid}
+        return self.get_project_list_values(column_id, [project], user)[
+            project.sodar_uuid
+        ]
+
+    def get_project_list_values(
+        self, column_id: str, projects: list[Project], user: User
+    ) -> dict[UUID, Union[str, int, None]]:
+        """
+        Return values for the optional additional project list column for
+        multiple projects.
+
+        :param column_id: ID of the column (string)
+        :param projects: List of Project objects
+        :param user: User object (current user)
+        :return: Dict of strings (may contain HTML), integers or None with
+                 project UUIDs as keys
+        """
+        counts = {}
+        if column_id in ['files', 'links']:
+            model = File if column_id == 'files' else HyperLink
+            counts = dict(
+                model.objects.filter(project__in=projects)
+                .order_by()
+                .values('project__sodar_uuid')
+                .annotate(count=Count('pk'))
+                .values_list('project__sodar_uuid', 'count')
             )
-            return f'<a href="{url}">{count}</a>'
-        return count
+        ret = {}
+        for p in projects:
+            count = counts.get(p.sodar_uuid, 0)
+            if count > 0:
+                url = reverse(
+                    'filesfolders:list', kwargs={'project': p.sodar_uuid}
+                )
+                ret[p.sodar_uuid] = f'<a href="{url}">{count}</a>'
+            else:
+                ret[p.sodar_uuid] = count
+        return ret
@@ -244,3 +244,35 @@ class TestPlugin(
         self.assertEqual(ret[0].title, 'Files, Folders and Links')
         self.assertEqual(ret[0].search_types, ['file', 'folder', 'link'])
         self.assertEqual(len(ret[0].rows), 0)
+
+    def test_get_project_list_value(self):
+        """Test get_project_list_value()"""
+        url = reverse(
+            PLUGIN_URL_ID, kwargs={'project': self.project.sodar_uuid}
+        )
+        self.assertEqual(
+            self.plugin.get_project_list_value(
+                'files', self.project, self.user
+            ),
+            f'<a href="{url}">1</a>',
+        )
+
+    def test_get_project_list_values(self):
+        """Test get_project_list_values()"""
+        new_project = self.make_project(
+            'NewProject', PROJECT_TYPE_PROJECT, self.category
+        )
+        url = reverse(
+            PLUGIN_URL_ID, kwargs={'project': self.project.sodar_uuid}
+        )
+        with self.assertNumQueries(1):
+            ret = self.plugin.get_project_list_values(
+                'links', [self.project, new_project], self.user
+            )
+        self.assertEqual(
+            ret,
+            {
+                self.project.sodar_uuid: f'<a href="{url}">1</a>',
+                new_project.sodar_uuid: 0,
+            },
+        )
@@ -1,17 +1,34 @@
 """Projectroles app settings API"""
 
+import copy
 import json
 import logging
 
+from types import MappingProxyType
 from typing import Any, Optional, Union
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
 
 from djangoplugins.point import Plugin
 
+from projectroles.cache import (
+    PERM_GEN_GLOBAL,
+    PERM_GEN_PROJECT,
+    PERM_GEN_USER,
+    bump_perm_generation,
+    clear_app_setting_cache,
+    memoize_app_setting,
+    memoize_app_setting_default,
+    memoize_app_settings,
+)
 from projectroles.models import AppSetting, Project, SODARUser, SODAR_CONSTANTS
-from projectroles.plugins import PluginAppSettingDef, PluginAPI
+from projectroles.plugins import (
+    APP_SETTING_SCOPES,
+    PluginAppSettingDef,
+    PluginAPI,
+)
 from projectroles.utils import get_display_name
 
 
@@ -245,7 +262,60 @@ PROJECTROLES_APP_SETTINGS = [
 ]
 
 
+class AppSettingDefRegistry:
+    """
+    Immutable registry of app setting definitions for projectroles and active
+    app plugins, indexed by plugin name and by scope.
+    """
+
+    __slots__ = ('by_plugin', 'by_scope', 'duplicates')
+
+    def __init__(self, plugin_defs: dict):
+        """
+        Initialize AppSettingDefRegistry.
+
+        :param plugin_defs: Dict of PluginAppSettingDef lists with plugin name
+                            as key
+        """
+        by_plugin = {}
+        duplicates = []
+        for plugin_name, s_defs in plugin_defs.items():
+            by_plugin[plugin_name] = MappingProxyType(
+                {d.name: d for d in s_defs}
+            )
+            if len(by_plugin[plugin_name]) != len(s_defs):
+                duplicates.append(plugin_name)
+        by_scope = {
+            scope: MappingProxyType(
+                {
+                    p: MappingProxyType(
+                        {n: d for n, d in defs.items() if d.scope == scope}
+                    )
+                    for p, defs in by_plugin.items()
+                }
+            )
+            for scope in APP_SETTING_SCOPES
+        }
+        #: Definitions with plugin name and setting name as keys
+        object.__setattr__(self, 'by_plugin', MappingProxyType(by_plugin))
+        #: Definitions with scope, plugin name and setting name as keys
+        object.__setattr__(self, 'by_scope', MappingProxyType(by_scope))
+        #: Names of plugins with repeated setting names
+        object.__setattr__(self, 'duplicates', tuple(duplicates))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError('AppSettingDefRegistry is immutable')
+
+    def __repr__(self):
+        return 'AppSettingDefRegistry({})'.format(
+            ', '.join(self.by_plugin.keys())
+        )
+
+
 class AppSettingAPI:
+    #: Definition registry, built on first access
+    _registry = None
+
     @classmethod
     def _validate_project_and_user(
         cls, scope: str, project: Project, user: User
@@ -341,8 +411,11 @@ class AppSettingAPI:
         """
         if not plugin and not plugin_name:
             raise ValueError('Plugin object and name both unset')
-        if plugin_name == APP_NAME:
-            return cls.get_projectroles_defs()
+        registry = cls.get_registry()
+        name = plugin.name if plugin else plugin_name
+        if name in registry.by_plugin:
+            return registry.by_plugin[name]
+        # Plugin not in registry, e.g. inactive
         if not plugin:
             plugin = cls._get_app_plugin(plugin_name)
         return {s.name: s for s in plugin.app_settings}
@@ -400,6 +473,147 @@ class AppSettingAPI:
             f'{log_value}{log_args}'
         )
 
+    @classmethod
+    def _get_value(
+        cls,
+        plugin_name: str,
+        setting_name: str,
+        project: Optional[Project] = None,
+        user: Optional[User] = None,
+    ) -> tuple[bool, Any]:
+        """
+        Return set value of an app setting from the request scoped memo, the
+        Django cache or the database. Cached values are invalidated on
+        AppSetting updates.
+
+        :param plugin_name: App plugin name (string, equals "name" in plugin)
+        :param setting_name: Setting name (string)
+        :param project: Project object (optional)
+        :param user: User object (optional)
+        :return: Tuple of boolean (True if value is set) and value
+        """
+
+        def _get_db_value():
+            try:
+                return True, AppSetting.objects.get_setting_value(
+                    plugin_name, setting_name, project=project, user=user
+                )
+            except AppSetting.DoesNotExist:
+                return False, None
+
+        found, val = memoize_app_setting(
+            plugin_name,
+            setting_name,
+            getattr(project, 'pk', project),
+            getattr(user, 'pk', user),
+            _get_db_value,
+        )
+        # Avoid modifying memoized values in place
+        if isinstance(val, (dict, list)):
+            val = copy.deepcopy(val)
+        return found, val
+
+    @classmethod
+    def _get_values(
+        cls,
+        settings_keys: list[tuple[str, str]],
+        project: Optional[Project] = None,
+        user: Optional[User] = None,
+    ) -> dict:
+        """
+        Return set values of multiple app settings from the request scoped
+        memo, the Django cache or the database. Values missing from the caches
+        are retrieved in a single database query.
+
+        :param settings_keys: List of (plugin_name, setting_name) tuples
+        :param project: Project object (optional)
+        :param user: User object (optional)
+        :return: Dict of set values with (plugin_name, setting_name) as keys
+        """
+
+        def _get_db_values(missing: list[tuple[str, str]]) -> dict:
+            db_values = AppSetting.objects.get_setting_values(
+                project=project,
+                user=user,
+                setting_names=list({k[1] for k in missing}),
+            )
+            return {
+                k: (True, db_values[k]) if k in db_values else (False, None)
+                for k in missing
+            }
+
+        values = memoize_app_settings(
+            settings_keys,
+            getattr(project, 'pk', project),
+            getattr(user, 'pk', user),
+            _get_db_values,
+        )
+        ret = {}
+        for k, (found, val) in values.items():
+            if not found:
+                continue
+            # Avoid modifying memoized values in place
+            if isinstance(val, (dict, list)):
+                val = copy.deepcopy(val)
+            ret[k] = val
+        return ret
+
+    @classmethod
+    def _validate_set(
+        cls,
+        s_def: PluginAppSettingDef,
+        value: Any,
+        project: Optional[Project] = None,
+        user: Optional[User] = None,
+        validate: bool = True,
+    ) -> Any:
+        """
+        Validate setting value and arguments for set() and set_many().
+
+        :param s_def: PluginAppSettingDef object
+        :param value: Value to be set
+        :param project: Project object (optional)
+        :param user: User object (optional)
+        :param validate: Validate value (bool, default=True)
+        :return: Value to be set, JSON values returned as dict
+        :raise: ValueError if validating and value is not accepted for setting
+                type
+        :raise: ValueError if project or user are not valid for setting
+        """
+        cls._validate_project_and_user(s_def.scope, project, user)
+        # Check project type
+        if project and project.type not in s_def.project_types:
+            raise ValueError(
+                f'Project type {project.type} not allowed for setting '
+                f'{s_def.name}'
+            )
+        # Prevent updating global setting on target site
+        if s_def.global_edit:
+            if project and project.is_remote():
+                raise ValueError(GLOBAL_PROJECT_ERR_MSG)
+            if (
+                user
+                and not project
+                and settings.PROJECTROLES_SITE_MODE == SITE_MODE_TARGET
+            ):
+                raise ValueError(GLOBAL_USER_ERR_MSG)
+
+        # Validate
+        v = (
+            cls._get_json_value(value)
+            if s_def.type == APP_SETTING_TYPE_JSON
+            else value
+        )
+        if validate:
+            cls.validate(
+                s_def.type,
+                v,
+                s_def.options,
+                project=project,
+                user=user,
+            )
+        return v
+
     @classmethod
     def get_default(
         cls,
@@ -421,10 +635,7 @@ class AppSettingAPI:
         :raise: ValueError if app plugin is not found
         :raise: ValueError if nothing is found with setting_name
         """
-        if plugin_name == APP_NAME:
-            s_defs = cls.get_projectroles_defs()
-        else:
-            s_defs = cls._get_defs(plugin_name=plugin_name)
+        s_defs = cls._get_defs(plugin_name=plugin_name)
         if setting_name not in s_defs:
             raise ValueError(
                 f'Setting "{setting_name}" not found in app plugin '
@@ -433,7 +644,19 @@ class AppSettingAPI:
         s_def = s_defs[setting_name]
         if callable(s_def.default):
             try:
-                return s_def.default(project, user)
+                if not s_def.cache_default:
+                    return s_def.default(project, user)
+                ret = memoize_app_setting_default(
+                    plugin_name,
+                    setting_name,
+                    getattr(project, 'pk', project),
+                    getattr(user, 'pk', user),
+                    lambda: s_def.default(project, user),
+                )
+                # Avoid modifying memoized values in place
+                if isinstance(ret, (dict, list)):
+                    ret = copy.deepcopy(ret)
+                return ret
             except Exception:
                 logger.error(
                     f'Error in callable setting "{setting_name}" for plugin '
@@ -476,20 +699,12 @@ class AppSettingAPI:
                 name=setting_name, plugin_name=plugin_name
             )
             cls._validate_project_and_user(s_def.scope, project, user)
+        found = False
         if not user or user.is_authenticated:
-            try:
-                val = AppSetting.objects.get_setting_value(
-                    plugin_name, setting_name, project=project, user=user
-                )
-            except AppSetting.DoesNotExist:
-                val = cls.get_default(
-                    plugin_name,
-                    setting_name,
-                    project=project,
-                    user=user,
-                    post_safe=post_safe,
-                )
-        else:  # Anonymous user
+            found, val = cls._get_value(
+                plugin_name, setting_name, project=project, user=user
+            )
+        if not found:  # Not set or anonymous user
             val = cls.get_default(
                 plugin_name,
                 setting_name,
@@ -502,6 +717,52 @@ class AppSettingAPI:
             return json.dumps(val)
         return val
 
+    @classmethod
+    def get_many(
+        cls,
+        settings_keys: list[tuple[str, str]],
+        project: Optional[Project] = None,
+        user: Optional[User] = None,
+        post_safe: bool = False,
+        validate: bool = True,
+    ) -> dict:
+        """
+        Return values of multiple app settings for a project or a user. Set
+        values are retrieved in a single database query. If a value is not
+        set, return default.
+
+        :param settings_keys: List of (plugin_name, setting_name) tuples
+        :param project: Project object (optional)
+        :param user: User object (optional)
+        :param post_safe: Whether POST safe values should be returned (bool)
+        :param validate: Validate project and user args (bool, default=True)
+        :return: Dict with (plugin_name, setting_name) tuples as keys
+        :raise: ValueError if nothing is found with a setting name
+        :raise: ValueError if project and user args are invalid for a setting
+        """
+        if validate:
+            for plugin_name, setting_name in settings_keys:
+                s_def = cls.get_definition(
+                    name=setting_name, plugin_name=plugin_name
+                )
+                cls._validate_project_and_user(s_def.scope, project, user)
+        values = {}
+        if not user or user.is_authenticated:
+            values = cls._get_values(settings_keys, project=project, user=user)
+        ret = {}
+        for k in settings_keys:
+            if k in values:
+                val = values[k]
+            else:  # Not set or anonymous user
+                val = cls.get_default(
+                    k[0], k[1], project=project, user=user, post_safe=post_safe
+                )
+            # Handle post_safe for dict values (JSON)
+            if post_safe and isinstance(val, (dict, list)):
+                val = json.dumps(val)
+            ret[k] = val
+        return ret
+
     @classmethod
     def get_all_by_scope(
         cls,
@@ -511,8 +772,8 @@ class AppSettingAPI:
         post_safe: bool = False,
     ) -> dict:
         """
-        Return all setting values by scope. If a value is not set, return the
-        default.
+        Return all setting values by scope. Set values are retrieved in a
+        single database query. If a value is not set, return the default.
 
         :param scope: String
         :param project: Project object (optional)
@@ -523,14 +784,16 @@ class AppSettingAPI:
         """
         PluginAppSettingDef.validate_scope(scope)
         cls._validate_project_and_user(scope, project, user)
-        ret = {}
-        all_defs = cls.get_all_defs()
-        for plugin_name, s_defs in all_defs.items():
-            for s_def in [d for d in s_defs.values() if d.scope == scope]:
-                ret[f'settings.{plugin_name}.{s_def.name}'] = cls.get(
-                    plugin_name, s_def.name, project, user, post_safe
-                )
-        return ret
+        settings_keys = [
+            (plugin_name, s_def.name)
+            for plugin_name, s_defs in cls.get_all_defs().items()
+            for s_def in s_defs.values()
+            if s_def.scope == scope
+        ]
+        values = cls.get_many(
+            settings_keys, project, user, post_safe=post_safe, validate=False
+        )
+        return {f'settings.{p}.{n}': v for (p, n), v in values.items()}
 
     @classmethod
     def get_defaults(
@@ -602,39 +865,7 @@ class AppSettingAPI:
         :raise: ValueError if setting name is not found in plugin specification
         """
         s_def = cls.get_definition(name=setting_name, plugin_name=plugin_name)
-        cls._validate_project_and_user(s_def.scope, project, user)
-        # Check project type
-        if project and project.type not in s_def.project_types:
-            raise ValueError(
-                f'Project type {project.type} not allowed for setting '
-                f'{setting_name}'
-            )
-        # Prevent updating global setting on target site
-        if s_def.global_edit:
-            if project and project.is_remote():
-                raise ValueError(GLOBAL_PROJECT_ERR_MSG)
-            if (
-                user
-                and not project
-                and settings.PROJECTROLES_SITE_MODE == SITE_MODE_TARGET
-            ):
-                raise ValueError(GLOBAL_USER_ERR_MSG)
-
-        # Validate
-        v = (
-            cls._get_json_value(value)
-            if s_def.type == APP_SETTING_TYPE_JSON
-            else value
-        )
-        if validate:
-            cls.validate(
-                s_def.type,
-                v,
-                s_def.options,
-                project=project,
-                user=user,
-            )
-
+        v = cls._validate_set(s_def, value, project, user, validate)
         try:  # Update existing setting
             q_kwargs = {'name': setting_name, 'project': project, 'user': user}
             if not plugin_name == APP_NAME:
@@ -678,6 +909,110 @@ class AppSettingAPI:
             )
             return True
 
+    @classmethod
+    def set_many(
+        cls,
+        values: dict,
+        project: Optional[Project] = None,
+        user: Optional[User] = None,
+        validate: bool = True,
+    ) -> list[tuple[str, str]]:
+        """
+        Set values of multiple project or user settings. All values are
+        validated before writing. Existing settings are retrieved in a single
+        query, after which changed settings are updated and missing settings
+        created in bulk within a transaction.
+
+        :param values: Dict of values with (plugin_name, setting_name) tuples as
+                       keys
+        :param project: Project object (optional)
+        :param user: User object (optional)
+        :param validate: Validate values (bool, default=True)
+        :return: List of (plugin_name, setting_name) tuples for changed settings
+        :raise: ValueError if validating and a value is not accepted for
+                setting type
+        :raise: ValueError if project or user are not valid for a setting
+        :raise: ValueError if setting name is not found in plugin specification
+        """
+        s_defs = {}
+        set_values = {}
+        for k, value in values.items():
+            s_defs[k] = cls.get_definition(name=k[1], plugin_name=k[0])
+            set_values[k] = cls._validate_set(
+                s_defs[k], value, project, user, validate
+            )
+        existing = {
+            (s.app_plugin.name if s.app_plugin else APP_NAME, s.name): s
+            for s in AppSetting.objects.filter(
+                project=project, user=user, name__in={k[1] for k in values}
+            ).select_related('app_plugin')
+        }
+        plugin_models = {}
+        update_objs = []
+        create_objs = []
+        for k, value in values.items():
+            v = set_values[k]
+            setting = existing.get(k)
+            if setting:
+                if cls.compare_value(setting, value):
+                    continue
+                update_objs.append(setting)
+            else:
+                plugin_name = k[0]
+                if plugin_name != APP_NAME and plugin_name not in plugin_models:
+                    plugin_models[plugin_name] = cls._get_app_plugin(
+                        plugin_name
+                    ).get_model()
+                setting = AppSetting(
+                    app_plugin=plugin_models.get(plugin_name),
+                    project=project,
+                    user=user,
+                    name=k[1],
+                    type=s_defs[k].type,
+                )
+                create_objs.append(setting)
+            if setting.type == APP_SETTING_TYPE_JSON:
+                setting.value_json = v
+            else:
+                setting.value = v
+                setting.convert_value()
+        if not update_objs and not create_objs:
+            return []
+
+        with transaction.atomic():
+            if update_objs:
+                AppSetting.objects.bulk_update(
+                    update_objs, ['value', 'value_json']
+                )
+            if create_objs:
+                AppSetting.objects.bulk_create(create_objs)
+        # Bulk operations do not send model signals, invalidate caches here
+        ret = []
+        for s in update_objs + create_objs:
+            k = (s.app_plugin.name if s.app_plugin else APP_NAME, s.name)
+            clear_app_setting_cache(
+                k[0],
+                k[1],
+                getattr(project, 'pk', None),
+                getattr(user, 'pk', None),
+            )
+            cls._log_debug(
+                'update' if s in update_objs else 'create',
+                k[0],
+                k[1],
+                values[k],
+                project,
+                user,
+            )
+            ret.append(k)
+        if project:
+            bump_perm_generation(PERM_GEN_PROJECT, [project.pk])
+        if user:
+            bump_perm_generation(PERM_GEN_USER, [user.pk])
+        if not project and not user:
+            bump_perm_generation(PERM_GEN_GLOBAL)
+        return ret
+
     @classmethod
     def is_set(
         cls,
@@ -848,7 +1183,14 @@ class AppSettingAPI:
         """
         if scope:
             PluginAppSettingDef.validate_scope(scope)
-        defs = cls._get_defs(plugin, plugin_name)
+            name = plugin.name if plugin else plugin_name
+            scope_defs = cls.get_registry().by_scope[scope]
+            if name in scope_defs:
+                defs = scope_defs[name]
+            else:
+                defs = cls._get_defs(plugin, plugin_name)
+        else:
+            defs = cls._get_defs(plugin, plugin_name)
         return {
             k: v
             for k, v in defs.items()
@@ -856,6 +1198,44 @@ class AppSettingAPI:
             and (not user_modifiable or v.user_modifiable)
         }
 
+    @classmethod
+    def get_registry(cls) -> AppSettingDefRegistry:
+        """
+        Return app setting definition registry. The registry is built on first
+        access and rebuilt after clear_registry() is called on plugin or
+        settings changes.
+
+        :return: AppSettingDefRegistry object
+        """
+        registry = cls._registry
+        if registry is None:
+            try:
+                app_settings = (
+                    settings.PROJECTROLES_APP_SETTINGS_TEST
+                    or PROJECTROLES_APP_SETTINGS
+                )
+            except AttributeError:
+                app_settings = PROJECTROLES_APP_SETTINGS
+            plugin_defs = {APP_NAME: app_settings}
+            plugins = (
+                []
+                + (plugin_api.get_active_plugins('project_app') or [])
+                + (plugin_api.get_active_plugins('site_app') or [])
+            )
+            for p in plugins:
+                plugin_defs[p.name] = p.app_settings
+            registry = AppSettingDefRegistry(plugin_defs)
+            cls._registry = registry
+        return registry
+
+    @classmethod
+    def clear_registry(cls):
+        """
+        Clear app setting definition registry. Should be called when plugins
+        are modified.
+        """
+        cls._registry = None
+
     @classmethod
     def get_projectroles_defs(cls) -> dict:
         """
@@ -864,14 +1244,7 @@ class AppSettingAPI:
 
         :return: Dict
         """
-        try:
-            app_settings = (
-                settings.PROJECTROLES_APP_SETTINGS_TEST
-                or PROJECTROLES_APP_SETTINGS
-            )
-        except AttributeError:
-            app_settings = PROJECTROLES_APP_SETTINGS
-        return {s.name: s for s in app_settings}
+        return cls.get_registry().by_plugin[APP_NAME]
 
     @classmethod
     def get_all_defs(cls) -> dict:
@@ -881,15 +1254,7 @@ class AppSettingAPI:
 
         :return: Dict
         """
-        ret = {APP_NAME: cls.get_projectroles_defs()}
-        plugins = (
-            []
-            + plugin_api.get_active_plugins('project_app')
-            + plugin_api.get_active_plugins('site_app')
-        )
-        for p in plugins:
-            ret[p.name] = cls._get_defs(p)
-        return ret
+        return cls.get_registry().by_plugin
 
     @classmethod
     def compare_value(cls, obj: AppSetting, input_value: Any) -> bool:
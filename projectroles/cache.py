@@ -0,0 +1,733 @@
+"""Role and permission caching for the projectroles app"""
+
+import hashlib
+import json
+import uuid
+
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Optional, Union
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.http import HttpRequest
+
+
+# Local constants
+ROLE_MEMO_VAR = ContextVar('projectroles_role_memo', default=None)
+APP_SETTING_MEMO_VAR = ContextVar('projectroles_app_setting_memo', default=None)
+APP_SETTING_CACHE_PREFIX = 'sodar_app_setting'
+APP_SETTING_CACHE_TIMEOUT = 300
+PERM_CACHE_PREFIX = 'sodar_perm'
+PERM_CACHE_TIMEOUT = 300
+PERM_GEN_GLOBAL = 'global'
+PERM_GEN_PROJECT = 'project'
+PERM_GEN_PROJECT_LIST = 'project_list'
+PERM_GEN_USER = 'user'
+SEARCH_CACHE_PREFIX = 'sodar_search'
+SEARCH_CACHE_TIMEOUT = 60
+SEARCH_GEN = 'search'
+
+#: Process level counters for the shared app setting cache
+app_setting_cache_stats = Counter()
+
+
+class RoleMemo:
+    """
+    Request scoped memo for resolved user roles in projects. Activated by
+    RoleMemoMiddleware for the duration of each request.
+    """
+
+    def __init__(self):
+        self.values = {}
+        #: Number of values returned from the memo
+        self.hits = 0
+        #: Number of values resolved and stored in the memo
+        self.misses = 0
+
+    def __repr__(self):
+        return f'RoleMemo(hits={self.hits}, misses={self.misses})'
+
+    def get(self, key: tuple, func: Callable) -> Any:
+        """
+        Return memoized value for key. If not found, call func and store its
+        return value.
+
+        :param key: Hashable key (tuple)
+        :param func: Callable for resolving the value
+        :return: Value returned by func
+        """
+        if key in self.values:
+            self.hits += 1
+            return self.values[key]
+        self.misses += 1
+        ret = func()
+        self.values[key] = ret
+        return ret
+
+    def set(self, key: tuple, value: Any):
+        """
+        Store a value resolved outside of the memo, e.g. in a bulk query.
+
+        :param key: Hashable key (tuple)
+        :param value: Value to be stored
+        """
+        self.values[key] = value
+
+    def clear(self):
+        """Clear memoized values. Does not reset counters."""
+        self.values.clear()
+
+
+def get_role_memo() -> Optional[RoleMemo]:
+    """
+    Return role memo for the current context.
+
+    :return: RoleMemo object or None if memo is not active
+    """
+    return ROLE_MEMO_VAR.get()
+
+
+def start_role_memo() -> Token:
+    """
+    Activate a new role memo in the current context.
+
+    :return: Token for resetting the context with end_role_memo()
+    """
+    return ROLE_MEMO_VAR.set(RoleMemo())
+
+
+def end_role_memo(token: Token):
+    """
+    Deactivate role memo started with start_role_memo().
+
+    :param token: Token returned by start_role_memo()
+    """
+    ROLE_MEMO_VAR.reset(token)
+
+
+def clear_role_memo():
+    """
+    Clear role memo in the current context if active. Should be called when
+    roles or project hierarchy are modified.
+    """
+    memo = ROLE_MEMO_VAR.get()
+    if memo:
+        memo.clear()
+
+
+def memoize_role(key: tuple, func: Callable) -> Any:
+    """
+    Return value from the active role memo, or call func directly if memo is
+    not active.
+
+    :param key: Hashable key (tuple)
+    :param func: Callable for resolving the value
+    :return: Value returned by func
+    """
+    memo = ROLE_MEMO_VAR.get()
+    if not memo:
+        return func()
+    return memo.get(key, func)
+
+
+def prime_role_memo(values: dict):
+    """
+    Store values resolved in bulk in the active role memo. Does nothing if memo
+    is not active.
+
+    :param values: Dict of values with memo keys (tuple) as keys
+    """
+    memo = ROLE_MEMO_VAR.get()
+    if not memo:
+        return
+    for k, v in values.items():
+        memo.set(k, v)
+
+
+# Transaction helpers ----------------------------------------------------------
+
+
+class OnCommitInvalidation:
+    """
+    Cache invalidation callback to be run on transaction commit. Marks the
+    transaction as having pending invalidations until called.
+    """
+
+    def __init__(self, func: Callable, *args):
+        self.func = func
+        self.args = args
+        self.pending = True
+
+    def __call__(self):
+        self.pending = False
+        self.func(*self.args)
+
+
+def invalidate_on_commit(func: Callable, *args):
+    """
+    Call cache invalidation function immediately and, if in a transaction,
+    again after the transaction is committed. The second call discards values
+    cached by concurrent requests from data committed before the transaction.
+
+    :param func: Invalidation function
+    :param args: Arguments for the function
+    """
+    func(*args)
+    if connection.in_atomic_block:
+        transaction.on_commit(OnCommitInvalidation(func, *args))
+
+
+def has_pending_invalidation() -> bool:
+    """
+    Return True if the current transaction has modified data affecting cached
+    values and has not yet been committed. Values read in such a transaction
+    may not have been committed, so they must not be read from or written to
+    the shared cache.
+
+    :return: Boolean
+    """
+    if not connection.in_atomic_block:
+        return False
+    return any(
+        isinstance(c[1], OnCommitInvalidation) and c[1].pending
+        for c in connection.run_on_commit
+    )
+
+
+# App setting cache ------------------------------------------------------------
+
+
+class AppSettingMemo(RoleMemo):
+    """
+    Request scoped memo for app setting values. Activated by
+    RoleMemoMiddleware for the duration of each request.
+    """
+
+    def delete(self, key: tuple):
+        """
+        Remove value from the memo if set.
+
+        :param key: Hashable key (tuple)
+        """
+        self.values.pop(key, None)
+
+
+def get_app_setting_memo() -> Optional[AppSettingMemo]:
+    """
+    Return app setting memo for the current context.
+
+    :return: AppSettingMemo object or None if memo is not active
+    """
+    return APP_SETTING_MEMO_VAR.get()
+
+
+def start_app_setting_memo() -> Token:
+    """
+    Activate a new app setting memo in the current context.
+
+    :return: Token for resetting the context with end_app_setting_memo()
+    """
+    return APP_SETTING_MEMO_VAR.set(AppSettingMemo())
+
+
+def end_app_setting_memo(token: Token):
+    """
+    Deactivate app setting memo started with start_app_setting_memo().
+
+    :param token: Token returned by start_app_setting_memo()
+    """
+    APP_SETTING_MEMO_VAR.reset(token)
+
+
+def get_app_setting_cache_timeout() -> int:
+    """
+    Return timeout for app setting values cached across requests in seconds.
+    If 0, only the request scoped memo is used.
+
+    :return: Integer
+    """
+    return getattr(
+        settings,
+        'PROJECTROLES_APP_SETTING_CACHE_TIMEOUT',
+        APP_SETTING_CACHE_TIMEOUT,
+    )
+
+
+def _get_app_setting_key(
+    plugin_name: str,
+    setting_name: str,
+    project_pk: Optional[int],
+    user_pk: Optional[int],
+) -> tuple:
+    return ('app_setting', plugin_name, setting_name, project_pk, user_pk)
+
+
+def _get_app_setting_gen_hash(
+    project_pk: Optional[int], user_pk: Optional[int]
+) -> Optional[str]:
+    """
+    Return hash of site-wide, project and user generations for app setting
+    cache keys, or None if the shared cache should not be used.
+    """
+    if not get_app_setting_cache_timeout() or has_pending_invalidation():
+        return None
+    gen_keys = [_get_generation_key(PERM_GEN_GLOBAL)]
+    if project_pk:
+        gen_keys.append(_get_generation_key(PERM_GEN_PROJECT, project_pk))
+    if user_pk:
+        gen_keys.append(_get_generation_key(PERM_GEN_USER, user_pk))
+    gens = _get_generations(gen_keys)
+    if None in gens:  # Cache not in use
+        return None
+    return hashlib.sha256('|'.join(gens).encode()).hexdigest()
+
+
+def _get_app_setting_cache_key(key: tuple, gen_hash: str) -> str:
+    return '{}_{}_{}'.format(
+        APP_SETTING_CACHE_PREFIX, '_'.join(str(k) for k in key[1:]), gen_hash
+    )
+
+
+def memoize_app_setting(
+    plugin_name: str,
+    setting_name: str,
+    project_pk: Optional[int],
+    user_pk: Optional[int],
+    func: Callable,
+) -> Any:
+    """
+    Return app setting value from the request scoped memo or the Django cache.
+    If not found, call func and store its return value in both. Cached values
+    are invalidated when the project or the user are modified, or on site-wide
+    changes. The Django cache is bypassed in transactions with uncommitted
+    changes.
+
+    :param plugin_name: App plugin name (string)
+    :param setting_name: Setting name (string)
+    :param project_pk: Project primary key or None
+    :param user_pk: User primary key or None
+    :param func: Callable for resolving the value, must not return None
+    :return: Value returned by func
+    """
+    key = _get_app_setting_key(plugin_name, setting_name, project_pk, user_pk)
+    memo = APP_SETTING_MEMO_VAR.get()
+    if memo and key in memo.values:
+        memo.hits += 1
+        return memo.values[key]
+    gen_hash = _get_app_setting_gen_hash(project_pk, user_pk)
+    cache_key = _get_app_setting_cache_key(key, gen_hash) if gen_hash else None
+    ret = cache.get(cache_key) if cache_key else None
+    if ret is not None:
+        app_setting_cache_stats['hits'] += 1
+    else:
+        app_setting_cache_stats['misses'] += 1
+        ret = func()
+        if cache_key:
+            cache.set(cache_key, ret, timeout=get_app_setting_cache_timeout())
+    if memo:
+        memo.misses += 1
+        memo.set(key, ret)
+    return ret
+
+
+def memoize_app_settings(
+    settings_keys: list[tuple[str, str]],
+    project_pk: Optional[int],
+    user_pk: Optional[int],
+    func: Callable,
+) -> dict:
+    """
+    Return multiple app setting values from the request scoped memo or the
+    Django cache. Values not found are resolved with a single call to func and
+    stored in both. The Django cache is bypassed in transactions with
+    uncommitted changes.
+
+    :param settings_keys: List of (plugin_name, setting_name) tuples
+    :param project_pk: Project primary key or None
+    :param user_pk: User primary key or None
+    :param func: Callable receiving a list of missing (plugin_name,
+                 setting_name) tuples and returning a dict of values for each
+    :return: Dict with (plugin_name, setting_name) tuples as keys
+    """
+    memo = APP_SETTING_MEMO_VAR.get()
+    ret = {}
+    keys = {}
+    for s_key in settings_keys:
+        key = _get_app_setting_key(*s_key, project_pk, user_pk)
+        if memo and key in memo.values:
+            memo.hits += 1
+            ret[s_key] = memo.values[key]
+        else:
+            keys[key] = s_key
+    if not keys:
+        return ret
+    gen_hash = _get_app_setting_gen_hash(project_pk, user_pk)
+    # Without gen_hash, the keys are only used for mapping missing values
+    cache_keys = {
+        _get_app_setting_cache_key(k, gen_hash or ''): v
+        for k, v in keys.items()
+    }
+    cached = cache.get_many(list(cache_keys.keys())) if gen_hash else {}
+    values = {cache_keys[k]: v for k, v in cached.items()}
+    app_setting_cache_stats['hits'] += len(values)
+    missing = [v for k, v in cache_keys.items() if k not in cached]
+    if missing:
+        app_setting_cache_stats['misses'] += len(missing)
+        db_values = func(missing)
+        values.update(db_values)
+        if gen_hash:
+            cache.set_many(
+                {
+                    k: db_values[v]
+                    for k, v in cache_keys.items()
+                    if k not in cached
+                },
+                timeout=get_app_setting_cache_timeout(),
+            )
+    if memo:
+        memo.misses += len(cache_keys)
+        for s_key, v in values.items():
+            memo.set(_get_app_setting_key(*s_key, project_pk, user_pk), v)
+    ret.update(values)
+    return ret
+
+
+def memoize_app_setting_default(
+    plugin_name: str,
+    setting_name: str,
+    project_pk: Optional[int],
+    user_pk: Optional[int],
+    func: Callable,
+) -> Any:
+    """
+    Return value of a callable app setting default from the request scoped
+    memo or the Django cache. If not found, call func and store its return
+    value in both. Cached values are invalidated when the project or the user
+    are modified, or on site-wide changes. The Django cache is bypassed in
+    transactions with uncommitted changes.
+
+    :param plugin_name: App plugin name (string)
+    :param setting_name: Setting name (string)
+    :param project_pk: Project primary key or None
+    :param user_pk: User primary key or None
+    :param func: Callable for resolving the value
+    :return: Value returned by func
+    """
+    key = (
+        'app_setting_default',
+        plugin_name,
+        setting_name,
+        project_pk,
+        user_pk,
+    )
+    memo = APP_SETTING_MEMO_VAR.get()
+    if memo and key in memo.values:
+        memo.hits += 1
+        return memo.values[key]
+    gen_hash = _get_app_setting_gen_hash(project_pk, user_pk)
+    cache_key = None
+    if gen_hash:
+        cache_key = '{}_default_{}_{}'.format(
+            APP_SETTING_CACHE_PREFIX,
+            '_'.join(str(k) for k in key[1:]),
+            gen_hash,
+        )
+    ret = cache.get(cache_key) if cache_key else None
+    if ret is not None:
+        app_setting_cache_stats['hits'] += 1
+    else:
+        app_setting_cache_stats['misses'] += 1
+        ret = func()
+        if cache_key:
+            cache.set(cache_key, ret, timeout=get_app_setting_cache_timeout())
+    if memo:
+        memo.misses += 1
+        memo.set(key, ret)
+    return ret
+
+
+def clear_app_setting_cache(
+    plugin_name: str,
+    setting_name: str,
+    project_pk: Optional[int],
+    user_pk: Optional[int],
+):
+    """
+    Remove app setting value from the request scoped memo. Should be called
+    when the setting is modified. Values in the Django cache are invalidated
+    by bumping the generations of the project, the user or the whole site,
+    which is also done on transaction commit.
+
+    :param plugin_name: App plugin name (string)
+    :param setting_name: Setting name (string)
+    :param project_pk: Project primary key or None
+    :param user_pk: User primary key or None
+    """
+    key = _get_app_setting_key(plugin_name, setting_name, project_pk, user_pk)
+    memo = APP_SETTING_MEMO_VAR.get()
+    if memo:
+        memo.delete(key)
+
+
+def get_app_setting_cache_stats() -> dict:
+    """
+    Return hit and miss counters for app setting values in the current request
+    and in the shared Django cache since process start.
+
+    :return: Dict
+    """
+    memo = APP_SETTING_MEMO_VAR.get()
+    return {
+        'request_hits': memo.hits if memo else 0,
+        'request_misses': memo.misses if memo else 0,
+        'cache_hits': app_setting_cache_stats['hits'],
+        'cache_misses': app_setting_cache_stats['misses'],
+    }
+
+
+# Permission cache -------------------------------------------------------------
+
+
+def get_perm_cache_timeout() -> int:
+    """
+    Return timeout for cached permissions in seconds. If 0, the permission
+    cache is disabled.
+
+    :return: Integer
+    """
+    return getattr(
+        settings, 'PROJECTROLES_PERM_CACHE_TIMEOUT', PERM_CACHE_TIMEOUT
+    )
+
+
+def _get_generation_key(
+    scope: str, pk: Optional[Union[int, str]] = None
+) -> str:
+    return f'{PERM_CACHE_PREFIX}_gen_{scope}_{pk}'
+
+
+def bump_perm_generation(scope: str, pks: Optional[list[int]] = None):
+    """
+    Invalidate cached permissions by bumping generations for users, projects
+    or the whole site. Cached permissions referring to a previous generation
+    are no longer returned. If called in a transaction, generations are bumped
+    again on commit.
+
+    Bumping project generations also bumps the site-wide project list
+    generation.
+
+    :param scope: Generation scope ("global", "project" or "user")
+    :param pks: List of user or project primary keys (ignored for "global")
+    """
+    if scope == PERM_GEN_GLOBAL:
+        keys = [_get_generation_key(scope)]
+    else:
+        keys = [_get_generation_key(scope, pk) for pk in pks]
+    if scope == PERM_GEN_PROJECT:
+        keys.append(_get_generation_key(PERM_GEN_PROJECT_LIST))
+    invalidate_on_commit(_set_generations, keys)
+
+
+def _set_generations(keys: list[str]):
+    """Set new generations for keys"""
+    cache.set_many({k: uuid.uuid4().hex for k in keys}, timeout=None)
+
+
+def _get_generations(keys: list[str]) -> list[str]:
+    """
+    Return current generations for keys. Generations are initialized if not
+    set or evicted from the cache.
+    """
+    gens = cache.get_many(keys)
+    for k in keys:
+        if k not in gens:
+            cache.add(k, uuid.uuid4().hex, timeout=None)
+            gens[k] = cache.get(k)
+    return [gens[k] for k in keys]
+
+
+def get_perm_cache_key(
+    user: AbstractUser, perm: str, project: Any
+) -> Optional[str]:
+    """
+    Return cache key for a permission of user in a project. The key changes
+    when the user, the project or any of its parents are modified, or on
+    site-wide changes.
+
+    :param user: User object
+    :param perm: Permission name (string)
+    :param project: Project object
+    :return: String or None if generations are not available in the cache
+    """
+    project_pks = list(
+        project.ancestor_links.order_by('-depth').values_list(
+            'ancestor', flat=True
+        )
+    )
+    gen_keys = [
+        _get_generation_key(PERM_GEN_GLOBAL),
+        _get_generation_key(PERM_GEN_USER, user.pk),
+    ] + [_get_generation_key(PERM_GEN_PROJECT, pk) for pk in project_pks]
+    gens = _get_generations(gen_keys)
+    if None in gens:  # Cache not in use
+        return None
+    key_data = '|'.join(
+        [perm, str(user.pk), str(user.is_superuser), str(user.is_active)]
+        + [str(pk) for pk in project_pks]
+        + gens
+    )
+    return '{}_{}'.format(
+        PERM_CACHE_PREFIX, hashlib.sha256(key_data.encode()).hexdigest()
+    )
+
+
+def has_perm_cached(user: AbstractUser, perm: str, project: Any) -> bool:
+    """
+    Return result of user.has_perm() for a project, cached across requests in
+    the Django cache. The cached result is invalidated when the user, the
+    project or any of its parents are modified, or on site-wide changes. The
+    cache is bypassed in transactions with uncommitted changes.
+
+    :param user: User object
+    :param perm: Permission name (string)
+    :param project: Project object
+    :return: Boolean
+    """
+    timeout = get_perm_cache_timeout()
+    if not timeout or has_pending_invalidation():
+        return user.has_perm(perm, project)
+    key = get_perm_cache_key(user, perm, project)
+    if not key:
+        return user.has_perm(perm, project)
+    ret = cache.get(key)
+    if ret is None:
+        ret = bool(user.has_perm(perm, project))
+        cache.set(key, ret, timeout=timeout)
+    return ret
+
+
+def get_project_list_etag(
+    request: HttpRequest, *args, **kwargs
+) -> Optional[str]:
+    """
+    Return ETag for project list views based on the requesting user and
+    request, site-wide generations and generations of the user. The ETag
+    changes when any project, role or app setting visible to the user is
+    modified. Intended to be used as etag_func with Django's condition().
+
+    No ETag is returned in a transaction with uncommitted changes, as the
+    response may contain data which is rolled back. Generations are bumped
+    again on commit, so lists computed by concurrent requests before the commit
+    are not returned with the ETag of committed data.
+
+    :param request: HttpRequest object
+    :return: String or None if generations are not available in the cache or
+             the transaction has uncommitted changes
+    """
+    if has_pending_invalidation():
+        return None
+    user = request.user
+    gen_keys = [
+        _get_generation_key(PERM_GEN_GLOBAL),
+        _get_generation_key(PERM_GEN_PROJECT_LIST),
+    ]
+    if user.is_authenticated:
+        gen_keys.append(_get_generation_key(PERM_GEN_USER, user.pk))
+    gens = _get_generations(gen_keys)
+    if None in gens:  # Cache not in use
+        return None
+    key_data = '|'.join(
+        [
+            request.path,
+            request.META.get('QUERY_STRING', ''),
+            request.META.get('HTTP_ACCEPT', ''),
+            str(user.pk),
+            str(user.is_superuser),
+        ]
+        + gens
+    )
+    return hashlib.sha256(key_data.encode()).hexdigest()
+
+
+# Search result cache ----------------------------------------------------------
+
+
+def get_search_cache_timeout(plugin_name: Optional[str] = None) -> int:
+    """
+    Return timeout for cached search results in seconds. If 0, the search
+    result cache is disabled.
+
+    :param plugin_name: Return timeout for specific plugin if set (string)
+    :return: Integer
+    """
+    if plugin_name and plugin_name in getattr(
+        settings, 'PROJECTROLES_SEARCH_CACHE_EXCLUDE', []
+    ):
+        return 0
+    return getattr(
+        settings, 'PROJECTROLES_SEARCH_CACHE_TIMEOUT', SEARCH_CACHE_TIMEOUT
+    )
+
+
+def bump_search_generation(app_label: str):
+    """
+    Invalidate cached search results of plugins for an app. If called in a
+    transaction, the generation is bumped again on commit.
+
+    :param app_label: Django app label (string)
+    """
+    invalidate_on_commit(
+        _set_generations, [_get_generation_key(SEARCH_GEN, app_label)]
+    )
+
+
+def get_search_cache_key(
+    user: AbstractUser,
+    plugin_name: str,
+    app_label: str,
+    search_terms: list[str],
+    keywords: dict,
+) -> Optional[str]:
+    """
+    Return cache key for search results of a plugin. The key changes when
+    projects, roles or app settings visible to the user or models in the app
+    of the plugin are modified.
+
+    :param user: User object
+    :param plugin_name: Plugin name (string)
+    :param app_label: Label of app containing the plugin (string)
+    :param search_terms: Search terms (list of strings)
+    :param keywords: Search keywords (dict)
+    :return: String or None if generations are not available in the cache or
+             the transaction has uncommitted changes
+    """
+    if has_pending_invalidation():
+        return None
+    gen_keys = [
+        _get_generation_key(PERM_GEN_GLOBAL),
+        _get_generation_key(PERM_GEN_PROJECT_LIST),
+        _get_generation_key(SEARCH_GEN, app_label),
+    ]
+    if user.is_authenticated:
+        gen_keys.append(_get_generation_key(PERM_GEN_USER, user.pk))
+    gens = _get_generations(gen_keys)
+    if None in gens:  # Cache not in use
+        return None
+    # Terms are OR'ed in search, so their order and duplicates are ignored
+    terms = sorted({' '.join(t.split()) for t in search_terms})
+    key_data = '|'.join(
+        [
+            plugin_name,
+            json.dumps(terms),
+            json.dumps(keywords, sort_keys=True, default=str),
+            str(user.pk),
+            str(user.is_superuser),
+        ]
+        + gens
+    )
+    return '{}_{}'.format(
+        SEARCH_CACHE_PREFIX, hashlib.sha256(key_data.encode()).hexdigest()
+    )
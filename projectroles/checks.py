@@ -5,7 +5,6 @@ from django.core.checks import Error, Warning, register
 from django.db import connection
 
 from projectroles import app_settings
-from projectroles.plugins import PluginAPI
 
 
 # Local constants
@@ -43,7 +42,8 @@ def check_auth_methods(app_configs, **kwargs):
 def check_app_setting_defs(app_configs, **kwargs):
     """
     Check provided plugin app setting definitions to ensure the name of each
-    definition is unique within its app plugin.
+    definition is unique within its app plugin. Builds the app setting
+    definition registry on startup.
 
     This check will be skipped if a database connection is not available.
     """
@@ -51,18 +51,12 @@ def check_app_setting_defs(app_configs, **kwargs):
         connection.ensure_connection()
     except Exception:
         return []
-    plugin_api = PluginAPI()
-    err_plugins = []
-    for p in plugin_api.get_active_plugins():
-        s_defs = p.app_settings
-        if isinstance(s_defs, list):
-            s_names = [d.name for d in s_defs]
-            if len(set(s_names)) != len(s_names) and p.name not in err_plugins:
-                err_plugins.append(p.name)
-    if err_plugins:
+    app_settings.AppSettingAPI.clear_registry()
+    registry = app_settings.AppSettingAPI.get_registry()
+    if registry.duplicates:
         return [
             Error(
-                E001_MSG.format(plugin_names=', '.join(err_plugins)),
+                E001_MSG.format(plugin_names=', '.join(registry.duplicates)),
                 obj=app_settings,
                 id='projectroles.E001',
             )
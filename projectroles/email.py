@@ -3,12 +3,14 @@
 import logging
 import re
 
+from collections import defaultdict
 from typing import Optional
 
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMessage
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils.timezone import localtime
@@ -17,6 +19,7 @@ from projectroles.app_settings import AppSettingAPI
 from projectroles.models import (
     Project,
     Role,
+    RoleAssignment,
     ProjectInvite,
     SODARUserAdditionalEmail,
     SODAR_CONSTANTS,
@@ -102,6 +105,21 @@ the following link:
 {project_url}
 """.lstrip()
 
+SUBJECT_ROLE_CREATE_BULK = 'Membership granted for {count} {project_label}'
+
+MESSAGE_ROLE_CREATE_BULK = r"""
+{issuer} has granted you the following memberships:
+
+{roles}
+To access the {project_label} in {site_title}, please click on
+the links above.
+""".lstrip()
+
+MESSAGE_ROLE_CREATE_BULK_ROLE = r"""
+- {project_label} "{project}" with the role of "{role}":
+  {project_url}
+""".lstrip()
+
 MESSAGE_ROLE_DELETE = r"""
 {issuer} has removed your membership from {project_label} "{project}".
 """.lstrip()
@@ -452,6 +470,60 @@ def get_role_change_body(
     return body
 
 
+def get_role_bulk_create_body(
+    role_assignments: list[RoleAssignment],
+    user_name: str,
+    issuer: User,
+    request: HttpRequest,
+) -> str:
+    """
+    Return email body for multiple roles created in bulk for a user.
+
+    :param role_assignments: List of RoleAssignment objects for user
+    :param user_name: Name of target user
+    :param issuer: User object for issuing user
+    :param request: HttpRequest object
+    :return: String
+    """
+    body = get_email_header(
+        MESSAGE_HEADER.format(recipient=user_name, site_title=SITE_TITLE)
+    )
+    roles = ''
+    for a in role_assignments:
+        roles += MESSAGE_ROLE_CREATE_BULK_ROLE.format(
+            project_label=get_display_name(a.project.type, title=True),
+            project=a.project.title,
+            role=a.role.name,
+            project_url=request.build_absolute_uri(
+                reverse(
+                    'projectroles:detail',
+                    kwargs={'project': a.project.sodar_uuid},
+                )
+            ),
+        )
+    body += MESSAGE_ROLE_CREATE_BULK.format(
+        issuer=get_email_user(issuer),
+        roles=roles,
+        project_label=_get_bulk_project_label(role_assignments),
+        site_title=SITE_TITLE,
+    )
+    if not issuer.email and not settings.PROJECTROLES_EMAIL_SENDER_REPLY:
+        body += NO_REPLY_NOTE
+    body += get_email_footer(request)
+    return body
+
+
+def _get_bulk_project_label(role_assignments: list[RoleAssignment]) -> str:
+    """
+    Return plural display name for project types of role assignments.
+
+    :param role_assignments: List of RoleAssignment objects
+    :return: String
+    """
+    p_types = sorted({a.project.type for a in role_assignments})
+    return ' and '.join(get_display_name(t, plural=True) for t in p_types)
+
+
 def get_user_addr(user: User) -> list[str]:
     """
     Return all the email addresses for a user as a list. Verified emails set as
@@ -496,6 +568,7 @@ def send_mail(
     reply_to: Optional[list] = None,
     cc: Optional[list] = None,
     bcc: Optional[list] = None,
+    connection: Optional[BaseEmailBackend] = None,
 ) -> int:
     """
     Wrapper for send_mail() with logging and error messaging.
@@ -507,6 +580,7 @@ def send_mail(
     :param reply_to: List of emails for the "reply-to" header (optional)
     :param cc: List of emails for "cc" field (optional)
     :param bcc: List of emails for "bcc" field (optional)
+    :param connection: Email backend connection (optional)
     :return: Amount of sent email (int)
     """
     try:
@@ -518,6 +592,7 @@ def send_mail(
             reply_to=reply_to if isinstance(reply_to, list) else [],
             cc=cc if isinstance(cc, list) else [],
             bcc=bcc if isinstance(bcc, list) else [],
+            connection=connection,
         )
         ret = e.send(fail_silently=False)
         logger.debug(
@@ -571,6 +646,60 @@ def send_role_change_mail(
     )
 
 
+def send_role_bulk_create_mail(
+    role_assignments: list[RoleAssignment], request: HttpRequest
+) -> int:
+    """
+    Send email to users when roles have been created for them in bulk. Each
+    user receives a single email for all their new roles. Emails are sent
+    using a single connection to the email backend.
+
+    :param role_assignments: List of RoleAssignment objects
+    :param request: HttpRequest object
+    :return: Amount of sent email (int)
+    """
+    user_roles = defaultdict(list)
+    for a in role_assignments:
+        user_roles[a.user].append(a)
+    issuer_emails = get_user_addr(request.user)
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as ex:
+        logger.error(f'Error opening email connection: {ex}')
+        connection = None  # Fall back to connection per email
+    ret = 0
+    for user, roles in user_roles.items():
+        if len(roles) == 1:
+            subject = get_role_change_subject('create', roles[0].project)
+            message = get_role_change_body(
+                change_type='create',
+                project=roles[0].project,
+                user_name=user.get_full_name(),
+                role_name=roles[0].role.name,
+                issuer=request.user,
+                request=request,
+            )
+        else:
+            subject = SUBJECT_PREFIX + SUBJECT_ROLE_CREATE_BULK.format(
+                count=len(roles), project_label=_get_bulk_project_label(roles)
+            )
+            message = get_role_bulk_create_body(
+                roles, user.get_full_name(), request.user, request
+            )
+        ret += send_mail(
+            subject,
+            message,
+            get_user_addr(user),
+            request,
+            issuer_emails,
+            connection=connection,
+        )
+    if connection:
+        connection.close()
+    return ret
+
+
 def send_project_leave_mail(
     project: Project, user: User, request: Optional[HttpRequest] = None
 ) -> int:
@@ -119,8 +119,25 @@ class SODARFormMixin:
 class SODARAppSettingFormMixin:
     """Helpers for app settings handling in forms"""
 
+    def get_app_setting_scope_kwargs(self, scope: str) -> dict:
+        """
+        Return project and user kwargs for retrieving app setting values.
+
+        :param scope: App setting scope (string)
+        :return: Dict
+        """
+        if scope == APP_SETTING_SCOPE_PROJECT:
+            return {'project': self.instance if self.instance.pk else None}
+        elif scope == APP_SETTING_SCOPE_USER:
+            return {'user': self.user}  # NOTE: Requires self.user
+        return {}
+
     def set_app_setting_field(
-        self, plugin_name: str, s_field: str, s_def: PluginAppSettingDef
+        self,
+        plugin_name: str,
+        s_field: str,
+        s_def: PluginAppSettingDef,
+        value: Any,
     ):
         """
         Helper for setting app setting field, widget and value.
@@ -128,13 +145,9 @@ class SODARAppSettingFormMixin:
         :param plugin_name: App plugin name
         :param s_field: Form field name
         :param s_def: PluginAppSettingDef object
+        :param value: Current setting value
         """
         scope = s_def.scope
-        scope_kw = {}
-        if scope == APP_SETTING_SCOPE_PROJECT:
-            scope_kw = {'project': self.instance if self.instance.pk else None}
-        elif scope == APP_SETTING_SCOPE_USER:
-            scope_kw = {'user': self.user}  # NOTE: Requires self.user
         s_widget_attrs = s_def.widget_attrs
         if scope == APP_SETTING_SCOPE_PROJECT:
             s_project_types = s_def.project_types or [PROJECT_TYPE_PROJECT]
@@ -151,7 +164,7 @@ class SODARAppSettingFormMixin:
 
         # Option
         if s_def.options and callable(s_def.options):
-            values = s_def.options(**scope_kw)
+            values = s_def.options(**self.get_app_setting_scope_kwargs(scope))
             self.fields[s_field] = forms.ChoiceField(
                 choices=[
                     (
@@ -203,12 +216,6 @@ class SODARAppSettingFormMixin:
         # Add optional attributes from plugin (#404)
         self.fields[s_field].widget.attrs.update(s_widget_attrs)
         # Set initial value
-        value = app_settings.get(
-            plugin_name=plugin_name,
-            setting_name=s_def.name,
-            validate=False,
-            **scope_kw,
-        )
         if s_def.type == APP_SETTING_TYPE_JSON:
             value = json.dumps(value)
         self.initial[s_field] = value
@@ -266,6 +273,7 @@ class SODARAppSettingFormMixin:
         :param scope: App setting scope (string)
         :param user_mod: Only include user modifiable settings if True (boolean)
         """
+        plugin_defs = []
         for plugin in app_plugins + [None]:  # No plugin for projectroles
             if plugin:
                 plugin_name = plugin.name
@@ -281,10 +289,23 @@ class SODARAppSettingFormMixin:
                     plugin_name=plugin_name,
                     user_modifiable=user_mod,
                 )
+            plugin_defs.append((plugin, plugin_name, s_defs))
+        # Get current values in a single query
+        values = app_settings.get_many(
+            [(p_name, n) for _, p_name, s_defs in plugin_defs for n in s_defs],
+            validate=False,
+            **self.get_app_setting_scope_kwargs(scope),
+        )
+        for plugin, plugin_name, s_defs in plugin_defs:
             for s_def in s_defs.values():
                 s_field = f'settings.{plugin_name}.{s_def.name}'
                 # Set field, widget and value
-                self.set_app_setting_field(plugin_name, s_field, s_def)
+                self.set_app_setting_field(
+                    plugin_name,
+                    s_field,
+                    s_def,
+                    values[(plugin_name, s_def.name)],
+                )
                 # Set label notes
                 self.set_app_setting_notes(plugin, s_field, s_def)
 
@@ -0,0 +1,132 @@
+"""IP address based project access restriction for the projectroles app"""
+
+import logging
+
+from bisect import bisect_right
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
+from typing import Optional, Union
+
+from django.http import HttpRequest
+
+from projectroles.app_settings import AppSettingAPI
+from projectroles.models import Project
+
+
+app_settings = AppSettingAPI()
+logger = logging.getLogger(__name__)
+
+
+# Local constants
+APP_NAME = 'projectroles'
+CLIENT_ADDRESS_META_KEYS = (
+    'HTTP_X_FORWARDED_FOR',
+    'X_FORWARDED_FOR',
+    'FORWARDED',
+    'REMOTE_ADDR',
+)
+ALLOW_LIST_CACHE_SIZE = 1024
+
+
+class IPAllowList:
+    """
+    Compiled IP allow list. Addresses and networks are merged into sorted,
+    non-overlapping address ranges per IP version, so each lookup is a single
+    binary search regardless of list size.
+    """
+
+    def __init__(self, value: str):
+        """
+        Initialize IPAllowList.
+
+        :param value: Comma-separated list of IP addresses and networks
+                      (string)
+        """
+        ranges = {4: [], 6: []}
+        for ip in [s.strip() for s in (value or '').split(',')]:
+            if not ip:
+                continue
+            try:
+                network = ip_network(ip)
+            except ValueError as ex:
+                logger.warning(f'Skipping invalid IP allow list entry: {ex}')
+                continue
+            ranges[network.version].append(
+                (int(network.network_address), int(network.broadcast_address))
+            )
+        self.starts = {}
+        self.ends = {}
+        for version, v_ranges in ranges.items():
+            merged = []
+            for start, end in sorted(v_ranges):
+                if merged and start <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            self.starts[version] = [r[0] for r in merged]
+            self.ends[version] = [r[1] for r in merged]
+
+    def __contains__(self, address: Union[IPv4Address, IPv6Address]) -> bool:
+        address_int = int(address)
+        i = bisect_right(self.starts[address.version], address_int) - 1
+        return i >= 0 and address_int <= self.ends[address.version][i]
+
+    def __len__(self):
+        return sum(len(s) for s in self.starts.values())
+
+    def __repr__(self):
+        return f'IPAllowList(ranges={len(self)})'
+
+
+@lru_cache(maxsize=ALLOW_LIST_CACHE_SIZE)
+def get_ip_allow_list(value: str) -> IPAllowList:
+    """
+    Return compiled IP allow list. Compiled lists are cached in the process
+    keyed by the setting value, so modifying the setting invalidates the
+    cached list.
+
+    :param value: Comma-separated list of IP addresses and networks (string)
+    :return: IPAllowList object
+    """
+    return IPAllowList(value)
+
+
+def get_client_address(
+    request: HttpRequest,
+) -> Optional[Union[IPv4Address, IPv6Address]]:
+    """
+    Return client IP address for request.
+
+    :param request: HttpRequest object
+    :return: IPv4Address or IPv6Address object, None if not found
+    """
+    for k in CLIENT_ADDRESS_META_KEYS:
+        v = request.META.get(k)
+        if v:
+            return ip_address(v.split(',')[0].strip())
+    return None
+
+
+def check_ip_access(request: HttpRequest, project: Project) -> bool:
+    """
+    Check if client IP address is allowed to access project. Returns True if
+    IP restriction is not enabled for the project.
+
+    :param request: HttpRequest object
+    :param project: Project object
+    :return: Boolean
+    """
+    values = app_settings.get_many(
+        [(APP_NAME, 'ip_restrict'), (APP_NAME, 'ip_allow_list')],
+        project=project,
+        validate=False,
+    )
+    if not values[(APP_NAME, 'ip_restrict')]:
+        return True
+    client_address = get_client_address(request)
+    if not client_address:  # Can't fetch client IP address
+        return False
+    allow_list = values[(APP_NAME, 'ip_allow_list')]
+    if not allow_list:
+        return False
+    return client_address in get_ip_allow_list(allow_list)
@@ -0,0 +1,88 @@
+"""
+Checkpublicchildren management command for verifying and optionally repairing
+public children counts of categories.
+"""
+
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from projectroles.cache import bump_perm_generation, PERM_GEN_GLOBAL
+from projectroles.management.logging import ManagementCommandLogger
+from projectroles.models import Project, ProjectAncestor
+
+
+logger = ManagementCommandLogger(__name__)
+
+
+# Local constants
+START_MSG = 'Checking public children counts..'
+INVALID_MSG = (
+    'Invalid public children count for project "{title}" ({uuid}): '
+    '{count} (expected {expected})'
+)
+REPAIR_MSG = 'Repaired {count} project{plural}'
+END_MSG = 'Found {count} project{plural} with invalid public children count'
+
+
+class Command(BaseCommand):
+    help = (
+        'Verify public children counts for categories and report invalid '
+        'values. Counts can optionally be repaired. Only needed if projects '
+        'have been altered without using the model API.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-r',
+            '--repair',
+            dest='repair',
+            action='store_true',
+            required=False,
+            help='Repair invalid counts',
+        )
+
+    def handle(self, *args, **options):
+        logger.info(START_MSG)
+        with transaction.atomic():
+            counts = Counter(
+                ProjectAncestor.objects.filter(
+                    depth__gte=1, descendant__public_access__isnull=False
+                ).values_list('ancestor', flat=True)
+            )
+            invalid = []
+            for project in Project.objects.all().order_by('full_title'):
+                expected = counts[project.pk]
+                if (
+                    project.public_children_count == expected
+                    and project.has_public_children == (expected > 0)
+                ):
+                    continue
+                logger.warning(
+                    INVALID_MSG.format(
+                        title=project.full_title,
+                        uuid=project.sodar_uuid,
+                        count=project.public_children_count,
+                        expected=expected,
+                    )
+                )
+                project.public_children_count = expected
+                project.has_public_children = expected > 0
+                invalid.append(project)
+            if invalid and options.get('repair'):
+                Project.objects.bulk_update(
+                    invalid, ['public_children_count', 'has_public_children']
+                )
+                bump_perm_generation(PERM_GEN_GLOBAL)
+                logger.info(
+                    REPAIR_MSG.format(
+                        count=len(invalid),
+                        plural='s' if len(invalid) != 1 else '',
+                    )
+                )
+        logger.info(
+            END_MSG.format(
+                count=len(invalid), plural='s' if len(invalid) != 1 else ''
+            )
+        )
@@ -0,0 +1,34 @@
+"""
+Rebuildroles management command for rebuilding effective roles used for role
+resolution.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from projectroles.management.logging import ManagementCommandLogger
+from projectroles.models import EffectiveRole
+
+
+logger = ManagementCommandLogger(__name__)
+
+
+# Local constants
+START_MSG = 'Rebuilding effective roles..'
+END_MSG = 'Rebuilt {count} effective role{plural}'
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds effective local and inherited roles for all projects from '
+        'role assignments. Only needed if roles have been altered without '
+        'using the model API.'
+    )
+
+    def handle(self, *args, **options):
+        logger.info(START_MSG)
+        with transaction.atomic():
+            count = EffectiveRole.objects.rebuild()
+        logger.info(
+            END_MSG.format(count=count, plural='s' if count != 1 else '')
+        )
@@ -1,4 +1,5 @@
 import cProfile
+import logging
 import sys
 
 from io import StringIO
@@ -6,6 +7,25 @@ from io import StringIO
 from django.conf import settings
 from django.utils.deprecation import MiddlewareMixin
 
+from projectroles.cache import (
+    start_role_memo,
+    end_role_memo,
+    get_role_memo,
+    start_app_setting_memo,
+    end_app_setting_memo,
+    get_app_setting_memo,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Local constants
+ROLE_MEMO_MSG = 'Role memo for {method} {path}: {hits} hits, {misses} misses'
+APP_SETTING_MEMO_MSG = (
+    'App setting memo for {method} {path}: {hits} hits, {misses} misses'
+)
+
 
 class ProfilerMiddleware(MiddlewareMixin):
     """
@@ -28,3 +48,39 @@ class ProfilerMiddleware(MiddlewareMixin):
             sys.stdout = old_stdout
             response.content = f'<pre>{out.getvalue()}</pre>'
         return response
+
+
+class RoleMemoMiddleware:
+    """
+    Middleware for memoizing resolved user roles in projects and app setting
+    values for the duration of a request. The memos are available in
+    request.role_memo and request.app_setting_memo for accessing hit and miss
+    counters.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = start_role_memo()
+        setting_token = start_app_setting_memo()
+        request.role_memo = get_role_memo()
+        request.app_setting_memo = get_app_setting_memo()
+        try:
+            response = self.get_response(request)
+        finally:
+            end_app_setting_memo(setting_token)
+            end_role_memo(token)
+        for msg, memo in [
+            (ROLE_MEMO_MSG, request.role_memo),
+            (APP_SETTING_MEMO_MSG, request.app_setting_memo),
+        ]:
+            logger.debug(
+                msg.format(
+                    method=request.method,
+                    path=request.path,
+                    hits=memo.hits,
+                    misses=memo.misses,
+                )
+            )
+        return response
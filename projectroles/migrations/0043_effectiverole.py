@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0042_remove_project__readme_rendered_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EffectiveRole',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'rank',
+                    models.IntegerField(help_text='Rank of the assigned role'),
+                ),
+                (
+                    'inherited',
+                    models.BooleanField(
+                        default=False,
+                        help_text='Whether the role is inherited from a parent category',
+                    ),
+                ),
+                (
+                    'project',
+                    models.ForeignKey(
+                        help_text='Project in which the role is effective',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_roles',
+                        to='projectroles.project',
+                    ),
+                ),
+                (
+                    'role_assignment',
+                    models.ForeignKey(
+                        help_text='Local or inherited role assignment',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_roles',
+                        to='projectroles.roleassignment',
+                    ),
+                ),
+                (
+                    'user',
+                    models.ForeignKey(
+                        help_text='User for whom the role is effective',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='effective_roles',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['project__full_title', 'rank', 'user__username'],
+                'indexes': [
+                    models.Index(
+                        fields=['user', 'project', 'rank'],
+                        name='effective_role_user_idx',
+                    )
+                ],
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('project', 'role_assignment'),
+                        name='unique_effective_role',
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:02
+
+from collections import defaultdict
+
+from django.db import migrations
+
+
+def populate_effective_roles(apps, schema_editor):
+    """Populate EffectiveRole objects for existing role assignments"""
+    Project = apps.get_model('projectroles', 'Project')
+    RoleAssignment = apps.get_model('projectroles', 'RoleAssignment')
+    EffectiveRole = apps.get_model('projectroles', 'EffectiveRole')
+    local_roles = defaultdict(list)
+    for a in RoleAssignment.objects.all().select_related('role'):
+        local_roles[a.project_id].append(a)
+    chains = {}
+    objects = []
+    for p in Project.objects.all().order_by('full_title'):
+        chains[p.pk] = chains.get(p.parent_id, []) + local_roles[p.pk]
+        for a in chains[p.pk]:
+            if p.type not in a.role.project_types:
+                continue
+            objects.append(
+                EffectiveRole(
+                    project=p,
+                    user_id=a.user_id,
+                    role_assignment=a,
+                    rank=a.role.rank,
+                    inherited=a.project_id != p.pk,
+                )
+            )
+    EffectiveRole.objects.bulk_create(objects)
+
+
+def delete_effective_roles(apps, schema_editor):
+    """Delete all EffectiveRole objects"""
+    EffectiveRole = apps.get_model('projectroles', 'EffectiveRole')
+    EffectiveRole.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0043_effectiverole'),
+    ]
+    operations = [
+        migrations.RunPython(
+            code=populate_effective_roles,
+            reverse_code=delete_effective_roles,
+        ),
+    ]
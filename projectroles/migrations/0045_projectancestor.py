@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0044_populate_effectiverole'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectAncestor',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'depth',
+                    models.IntegerField(
+                        help_text='Distance between ancestor and descendant in the project tree'
+                    ),
+                ),
+                (
+                    'ancestor',
+                    models.ForeignKey(
+                        help_text='Parent category or the project itself',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='descendant_links',
+                        to='projectroles.project',
+                    ),
+                ),
+                (
+                    'descendant',
+                    models.ForeignKey(
+                        help_text='Nested category or project',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='ancestor_links',
+                        to='projectroles.project',
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['ancestor__full_title', 'depth'],
+                'indexes': [
+                    models.Index(
+                        fields=['descendant', 'depth'],
+                        name='project_ancestor_desc_idx',
+                    )
+                ],
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('ancestor', 'descendant'),
+                        name='unique_project_ancestor',
+                    )
+                ],
+            },
+        ),
+    ]
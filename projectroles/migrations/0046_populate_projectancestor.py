@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:14
+
+from django.db import migrations
+
+
+def populate_project_ancestors(apps, schema_editor):
+    """Populate ProjectAncestor objects for existing projects"""
+    Project = apps.get_model('projectroles', 'Project')
+    ProjectAncestor = apps.get_model('projectroles', 'ProjectAncestor')
+    parents = dict(Project.objects.values_list('pk', 'parent_id'))
+    objects = []
+    for pk in parents.keys():
+        ancestor_pk = pk
+        depth = 0
+        while ancestor_pk:
+            objects.append(
+                ProjectAncestor(
+                    ancestor_id=ancestor_pk, descendant_id=pk, depth=depth
+                )
+            )
+            ancestor_pk = parents[ancestor_pk]
+            depth += 1
+    ProjectAncestor.objects.bulk_create(objects)
+
+
+def delete_project_ancestors(apps, schema_editor):
+    """Delete all ProjectAncestor objects"""
+    ProjectAncestor = apps.get_model('projectroles', 'ProjectAncestor')
+    ProjectAncestor.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0045_projectancestor'),
+    ]
+    operations = [
+        migrations.RunPython(
+            code=populate_project_ancestors,
+            reverse_code=delete_project_ancestors,
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0046_populate_projectancestor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='public_children_count',
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text='Number of children with public access (auto-generated)',
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:38
+
+from collections import Counter
+
+from django.db import migrations
+
+
+def populate_public_children_count(apps, schema_editor):
+    """Populate public_children_count for existing categories"""
+    Project = apps.get_model('projectroles', 'Project')
+    ProjectAncestor = apps.get_model('projectroles', 'ProjectAncestor')
+    counts = Counter(
+        ProjectAncestor.objects.filter(
+            depth__gte=1, descendant__public_access__isnull=False
+        ).values_list('ancestor', flat=True)
+    )
+    projects = list(Project.objects.filter(pk__in=counts.keys()))
+    for project in projects:
+        project.public_children_count = counts[project.pk]
+        project.has_public_children = True
+    Project.objects.bulk_update(
+        projects, ['public_children_count', 'has_public_children']
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0047_project_public_children_count'),
+    ]
+    operations = [
+        migrations.RunPython(
+            code=populate_public_children_count,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:52
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0048_populate_public_children_count'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('full_title'),
+                    name='gin_trgm_ops',
+                ),
+                name='project_full_title_trgm',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('description'),
+                    name='gin_trgm_ops',
+                ),
+                name='project_description_trgm',
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0049_project_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(
+                fields=['full_title', 'id'], name='project_full_title_idx'
+            ),
+        ),
+    ]
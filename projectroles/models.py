@@ -3,6 +3,7 @@
 import logging
 import uuid
 
+from collections import defaultdict
 from datetime import datetime
 from typing import Any, Optional, Union
 
@@ -10,9 +11,12 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, Group
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q, QuerySet
+from django.db.models import F, Q, QuerySet, Value
+from django.db.models.functions import Concat, Substr, Upper
+from django.db.models.lookups import GreaterThan
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils import timezone
@@ -21,6 +25,14 @@ from django.utils.translation import gettext_lazy as _
 from djangoplugins.models import Plugin
 from martor.models import MartorField
 
+from projectroles.cache import (
+    bump_perm_generation,
+    clear_role_memo,
+    memoize_role,
+    prime_role_memo,
+    PERM_GEN_GLOBAL,
+    PERM_GEN_PROJECT,
+)
 from projectroles.constants import get_sodar_constants
 
 
@@ -78,6 +90,7 @@ REMOTE_PROJECT_UNIQUE_MSG = (
     'RemoteProject with the same project UUID and site anready exists'
 )
 AUTH_PROVIDER_OIDC = 'oidc'
+EFFECTIVE_ROLE_BATCH_SIZE = 5000
 
 
 # Project ----------------------------------------------------------------------
@@ -96,7 +109,8 @@ class ProjectManager(models.Manager):
         """
         Return projects with a partial match in full title or, including titles
         of parent Project objects, or the description of the current object.
-        Restrict to project type if project_type is set.
+        Restrict to project type if project_type is set. Partial matches are
+        looked up using trigram indexes.
 
         :param search_terms: Search terms (list)
         :param projects: QuerySet of projects where the terms are searched
@@ -119,6 +133,47 @@ class ProjectManager(models.Manager):
                 pass
         return objects.filter(term_query).order_by('full_title')
 
+    def ancestors_of(
+        self, project: 'Project', include_self: bool = False
+    ) -> QuerySet:
+        """
+        Return parent categories of a project in inheritance order, starting
+        from the top level category.
+
+        :param project: Project object
+        :param include_self: Include project itself if True (bool)
+        :return: QuerySet of Project objects
+        """
+        return (
+            super()
+            .get_queryset()
+            .filter(
+                descendant_links__descendant=project,
+                descendant_links__depth__gte=0 if include_self else 1,
+            )
+            .order_by('-descendant_links__depth')
+        )
+
+    def descendants_of(
+        self, project: 'Project', include_self: bool = False
+    ) -> QuerySet:
+        """
+        Return all categories and projects nested under a category at any
+        depth.
+
+        :param project: Project object
+        :param include_self: Include project itself if True (bool)
+        :return: QuerySet of Project objects
+        """
+        return (
+            super()
+            .get_queryset()
+            .filter(
+                ancestor_links__ancestor=project,
+                ancestor_links__depth__gte=0 if include_self else 1,
+            )
+        )
+
 
 class Project(models.Model):
     """
@@ -199,6 +254,12 @@ class Project(models.Model):
         '(auto-generated)',
     )
 
+    #: Number of children with public access (auto-generated)
+    public_children_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Number of children with public access (auto-generated)',
+    )
+
     #: Project SODAR UUID
     sodar_uuid = models.UUIDField(
         default=uuid.uuid4, unique=True, help_text='Project SODAR UUID'
@@ -213,6 +274,21 @@ class Project(models.Model):
                 fields=['title', 'parent'], name='unique_project_path'
             ),
         ]
+        # Trigram indexes for case-insensitive partial matching in find()
+        indexes = [
+            GinIndex(
+                OpClass(Upper('full_title'), name='gin_trgm_ops'),
+                name='project_full_title_trgm',
+            ),
+            GinIndex(
+                OpClass(Upper('description'), name='gin_trgm_ops'),
+                name='project_description_trgm',
+            ),
+            # B-tree index for keyset pagination in project list API
+            models.Index(
+                fields=['full_title', 'id'], name='project_full_title_idx'
+            ),
+        ]
         ordering = ['parent__title', 'title']
 
     def __str__(self):
@@ -289,18 +365,80 @@ class Project(models.Model):
         self._validate_parent_type()
         self._validate_public_access()
         self._validate_archive()
-        # Update full title of self and children
+        # Check if hierarchy or roles need to be updated for project and children
+        old = (
+            Project.objects.filter(pk=self.pk)
+            .values(
+                'parent',
+                'type',
+                'full_title',
+                'public_access',
+                'public_children_count',
+            )
+            .first()
+            if not self._state.adding
+            else None
+        )
+        moved = not old or old['parent'] != self.parent_id
+        update_roles = moved or old['type'] != self.type
+        # Update full title of self
         self.full_title = self._get_full_title()
-        # TODO: Save with commit=False with other args to avoid double save()?
+        # Update public children, count is only modified in the database
+        if old:
+            self.public_children_count = old['public_children_count']
+        self.has_public_children = self.public_children_count > 0
+        old_public = (
+            int(old['public_access'] is not None) + self.public_children_count
+            if old
+            else 0
+        )
+        new_public = (
+            int(self.public_access_id is not None) + self.public_children_count
+        )
         super().save(*args, **kwargs)
-        if self.is_category():
-            for child in self.children.all():
-                child.save()
-        # Update public children
-        # NOTE: Parents will be updated in ProjectModifyMixin.modify_project()
-        if self._has_public_children():
-            self.has_public_children = True
-            super().save(*args, **kwargs)
+        if moved and old_public:
+            self._update_public_children(-old_public)  # Update old parents
+        if moved:
+            ProjectAncestor.objects.update_project(self)
+        delta = new_public if moved else new_public - old_public
+        if delta:
+            self._update_public_children(delta)
+        # Update children in bulk if full title has changed
+        if old and old['full_title'] != self.full_title:
+            self._update_subtree(old['full_title'])
+        if update_roles:
+            EffectiveRole.objects.update_project(self)
+        clear_role_memo()
+        # Invalidate cached permissions for project and current or old parents
+        perm_pks = list(
+            ProjectAncestor.objects.filter(descendant=self).values_list(
+                'ancestor', flat=True
+            )
+        )
+        if moved and old and old['parent']:
+            perm_pks += ProjectAncestor.objects.filter(
+                descendant=old['parent']
+            ).values_list('ancestor', flat=True)
+        bump_perm_generation(PERM_GEN_PROJECT, perm_pks)
+
+    def delete(self, *args, **kwargs):
+        """Custom deletion for Project, updating public children of parents"""
+        public_count = (
+            Project.objects.descendants_of(self, include_self=True)
+            .filter(public_access__isnull=False)
+            .count()
+        )
+        if public_count:
+            self._update_public_children(-public_count)
+        bump_perm_generation(
+            PERM_GEN_PROJECT,
+            ProjectAncestor.objects.filter(descendant=self).values_list(
+                'ancestor', flat=True
+            ),
+        )
+        ret = super().delete(*args, **kwargs)
+        clear_role_memo()
+        return ret
 
     def get_absolute_url(self) -> str:
         return reverse(
@@ -319,35 +457,54 @@ class Project(models.Model):
         )
         return ret + self.title
 
-    def _has_public_children(self) -> bool:
+    def _update_subtree(self, old_full_title: str):
         """
-        Return True if the project has any children with public read-only
-        access.
+        Update full titles of all children of the project in bulk. Called after
+        the project has been renamed or moved, instead of saving each child
+        separately.
+
+        :param old_full_title: Full title of project before the change (string)
         """
         if self.is_project():
-            return False
-        for child in self.get_children():
-            if child.public_access:
-                return True
-            ret = child._has_public_children()
-            if ret:
-                return True
+            return
+        # Replace old full title prefix, as it is shared by all children
+        Project.objects.descendants_of(self).update(
+            full_title=Concat(
+                Value(self.full_title + CAT_DELIMITER),
+                Substr('full_title', len(old_full_title + CAT_DELIMITER) + 1),
+                output_field=models.CharField(),
+            )
+        )
+
+    def _has_role_in_children(self, user: AbstractUser) -> bool:
+        """
+        Return True if user has a local role in any of the children in the
+        project, or if any child has public access.
+        """
+        children = self.get_children(flat=True)
+        if (
+            any([c.public_access is not None for c in children])
+            or RoleAssignment.objects.filter(
+                user=user, project__in=children
+            ).count()
+            > 0
+        ):
+            return True
         return False
 
-    def _update_public_children(self):
-        """Update has_public_children for this project's parents"""
-        if self.parent:
-            parent = self.parent
-            public_found = False
-            while parent:
-                if public_found:
-                    parent.has_public_children = True
-                else:
-                    parent.has_public_children = parent._has_public_children()
-                parent.save()
-                if not public_found and parent.has_public_children:
-                    public_found = True
-                parent = parent.parent
+    def _update_public_children(self, delta: int):
+        """
+        Update public children count and has_public_children for all parents of
+        the project.
+
+        :param delta: Change in number of public projects (int)
+        """
+        Project.objects.ancestors_of(self).update(
+            public_children_count=F('public_children_count') + delta,
+            has_public_children=GreaterThan(
+                F('public_children_count') + delta, 0
+            ),
+        )
 
     # Custom row-level functions
 
@@ -367,13 +524,9 @@ class Project(models.Model):
         """
         if not self.parent:
             return []
-        ret = []
-        parent = self.parent
-        while parent:
-            ret.append(parent)
-            parent = parent.parent
-        ret.reverse()
-        return ret
+        return list(
+            Project.objects.ancestors_of(self.parent, include_self=True)
+        )
 
     def get_children(self, flat: bool = False) -> QuerySet:
         """
@@ -385,9 +538,7 @@ class Project(models.Model):
         if self.is_project():
             return Project.objects.none()
         if flat:
-            return Project.objects.filter(
-                full_title__startswith=self.full_title + CAT_DELIMITER
-            ).order_by('full_title')
+            return Project.objects.descendants_of(self).order_by('full_title')
         return self.children.all().order_by('title')
 
     def get_depth(self) -> int:
@@ -418,18 +569,42 @@ class Project(models.Model):
         """
         if not user or user.is_anonymous:
             return None
-        projects = [self] if not inherited_only else []
-        projects += list(self.get_parents())
-        return (
-            RoleAssignment.objects.filter(
-                project__in=projects,
-                user=user,
-                role__project_types__contains=[self.type],
-            )
-            .order_by('role__rank', '-project__full_title')
-            .first()
+        q_kwargs = {'effective_roles__project': self, 'user': user}
+        if inherited_only:
+            q_kwargs['effective_roles__inherited'] = True
+        return memoize_role(
+            ('role', self.pk, user.pk, inherited_only),
+            lambda: (
+                RoleAssignment.objects.filter(**q_kwargs)
+                .select_related('role')
+                .order_by('role__rank', '-project__full_title')
+                .first()
+            ),
         )
 
+    def _get_prefetched_roles(
+        self, user: Optional[AbstractUser], inherited_only: bool
+    ) -> list['RoleAssignment']:
+        """
+        Return role assignments from prefetched effective roles, ordered as in
+        the get_roles() query. Expects the project, role and user of each role
+        assignment to be included in the prefetch.
+
+        :param user: Limit to user (User object or None)
+        :param inherited_only: Return only inherited roles (bool)
+        :return: List of RoleAssignment objects
+        """
+        user_pk = user.pk if user and user.is_authenticated else None
+        roles = [
+            e.role_assignment
+            for e in self.effective_roles.all()
+            if (not inherited_only or e.inherited)
+            and (not user_pk or e.user_id == user_pk)
+        ]
+        roles.sort(key=lambda a: (a.role.name, a.user.name, a.user.username))
+        roles.sort(key=lambda a: a.project.full_title, reverse=True)
+        return roles
+
     def get_roles(
         self,
         user: Optional[AbstractUser] = None,
@@ -454,32 +629,34 @@ class Project(models.Model):
                 'Inherited set False and inherited_only set True, No results '
                 'can be returned'
             )
-        projects = [] if inherited_only else [self]
         # NOTE: We have to get inherited roles to exclude overridden ones
-        parents = list(self.get_parents())
-        projects += parents
-        q_kwargs = {
-            'project__in': projects,
-            'role__project_types__contains': [self.type],
-        }
-        if user and user.is_authenticated:
-            q_kwargs['user'] = user
-        roles = RoleAssignment.objects.filter(**q_kwargs).order_by(
-            '-project__full_title', 'role__name', 'user'
-        )
+        if 'effective_roles' in getattr(self, '_prefetched_objects_cache', {}):
+            roles = self._get_prefetched_roles(user, inherited_only)
+        else:
+            q_kwargs = {'effective_roles__project': self}
+            if inherited_only:
+                q_kwargs['effective_roles__inherited'] = True
+            if user and user.is_authenticated:
+                q_kwargs['user'] = user
+            roles = (
+                RoleAssignment.objects.filter(**q_kwargs)
+                .select_related('project', 'role', 'user')
+                .order_by('-project__full_title', 'role__name', 'user')
+            )
         user_roles = {}
         for a in roles:
             u = a.user
+            local = a.project_id == self.pk
             rank_ok = (not min_rank or a.role.rank >= min_rank) and (
                 not max_rank or a.role.rank <= max_rank
             )
             # Local role (always returned first if it exists)
-            if a.project == self and not inherited_only and rank_ok:
+            if local and not inherited_only and rank_ok:
                 user_roles[u] = a
             # Inherited role of higher rank
             elif (
                 inherited
-                and a.project in parents
+                and not local
                 and (
                     u not in user_roles or a.role.rank < user_roles[u].role.rank
                 )
@@ -488,7 +665,7 @@ class Project(models.Model):
                 user_roles[u] = a
             # Pop overridden role if in list
             elif (
-                a.project in parents
+                not local
                 and u in user_roles
                 and a.role.rank < user_roles[u].role.rank
             ):
@@ -661,16 +838,10 @@ class Project(models.Model):
         # User with role in self has at least the same role in children
         if self.has_role(user):
             return True
-        children = self.get_children(flat=True)
-        if (
-            any([c.public_access is not None for c in children])
-            or RoleAssignment.objects.filter(
-                user=user, project__in=children
-            ).count()
-            > 0
-        ):
-            return True
-        return False
+        return memoize_role(
+            ('children', self.pk, user.pk),
+            lambda: self._has_role_in_children(user),
+        )
 
     def get_source_site(self) -> Optional['RemoteSite']:
         """
@@ -743,7 +914,6 @@ class Project(models.Model):
         if self.public_access != role:
             self.public_access = role
             self.save()
-            self._update_public_children()  # Update for parents
 
     def set_archive(self, status: bool = True):
         """
@@ -765,6 +935,107 @@ class Project(models.Model):
         )
 
 
+# ProjectAncestor --------------------------------------------------------------
+
+
+class ProjectAncestorManager(models.Manager):
+    """Manager for custom table-level ProjectAncestor queries"""
+
+    def update_project(self, project: Project):
+        """
+        Update ancestry for a project and its children. Should be called when a
+        project is created or moved under another category.
+
+        :param project: Project object
+        """
+        subtree = list(
+            self.filter(ancestor=project)
+            .order_by()
+            .values_list('descendant', 'depth')
+        )
+        if not subtree:  # New project
+            self.create(ancestor=project, descendant=project, depth=0)
+            subtree = [(project.pk, 0)]
+        subtree_pks = [s[0] for s in subtree]
+        # Remove links to former parents
+        self.filter(descendant__in=subtree_pks).exclude(
+            ancestor__in=subtree_pks
+        ).delete()
+        if not project.parent:
+            return
+        self.bulk_create(
+            [
+                self.model(
+                    ancestor_id=a_pk,
+                    descendant_id=d_pk,
+                    depth=a_depth + d_depth + 1,
+                )
+                for a_pk, a_depth in self.filter(descendant=project.parent)
+                .order_by()
+                .values_list('ancestor', 'depth')
+                for d_pk, d_depth in subtree
+            ]
+        )
+
+
+class ProjectAncestor(models.Model):
+    """
+    Ancestry index for the project hierarchy. Stores a link from each
+    category to every category and project nested under it, including a link
+    from each project to itself with zero depth. Maintained automatically on
+    Project changes.
+
+    Use the ProjectManager API (e.g. Project.objects.descendants_of()) to query
+    the hierarchy instead of accessing these objects directly.
+    """
+
+    #: Parent category or the project itself
+    ancestor = models.ForeignKey(
+        Project,
+        related_name='descendant_links',
+        help_text='Parent category or the project itself',
+        on_delete=models.CASCADE,
+    )
+
+    #: Nested category or project
+    descendant = models.ForeignKey(
+        Project,
+        related_name='ancestor_links',
+        help_text='Nested category or project',
+        on_delete=models.CASCADE,
+    )
+
+    #: Distance between ancestor and descendant in the project tree
+    depth = models.IntegerField(
+        help_text='Distance between ancestor and descendant in the project tree'
+    )
+
+    # Set manager for custom queries
+    objects = ProjectAncestorManager()
+
+    class Meta:
+        ordering = ['ancestor__full_title', 'depth']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['ancestor', 'descendant'],
+                name='unique_project_ancestor',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['descendant', 'depth'],
+                name='project_ancestor_desc_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.ancestor} -> {self.descendant} ({self.depth})'
+
+    def __repr__(self):
+        values = (self.ancestor.title, self.descendant.title, self.depth)
+        return 'ProjectAncestor({})'.format(', '.join(repr(v) for v in values))
+
+
 # Role -------------------------------------------------------------------------
 
 
@@ -807,6 +1078,55 @@ class Role(models.Model):
 # RoleAssignment ---------------------------------------------------------------
 
 
+class RoleAssignmentManager(models.Manager):
+    """Manager for custom table-level RoleAssignment queries"""
+
+    def get_effective_roles(
+        self,
+        user: AbstractUser,
+        projects: Union[QuerySet[Project], list[Project]],
+        inherited_only: bool = False,
+    ) -> dict[int, Optional['RoleAssignment']]:
+        """
+        Return the currently active role for user in multiple projects with a
+        single query. The role for each project is resolved as in
+        Project.get_role(). Resolved roles are also stored in the role memo if
+        active.
+
+        :param user: User object
+        :param projects: QuerySet or list of Project objects
+        :param inherited_only: Only return inherited roles if True
+                               (boolean, default=False)
+        :return: Dict of RoleAssignment objects or None with project primary
+                 keys as keys
+        """
+        project_pks = [p.pk for p in projects]
+        ret = {pk: None for pk in project_pks}
+        if not user or user.is_anonymous or not project_pks:
+            return ret
+        q_kwargs = {'user': user, 'project__in': project_pks}
+        if inherited_only:
+            q_kwargs['inherited'] = True
+        eff_roles = (
+            EffectiveRole.objects.filter(**q_kwargs)
+            .select_related(
+                'role_assignment__project',
+                'role_assignment__role',
+                'role_assignment__user',
+            )
+            .order_by(
+                'project', 'rank', '-role_assignment__project__full_title'
+            )
+        )
+        for e in eff_roles:
+            if ret[e.project_id] is None:
+                ret[e.project_id] = e.role_assignment
+        prime_role_memo(
+            {('role', pk, user.pk, inherited_only): v for pk, v in ret.items()}
+        )
+        return ret
+
+
 class RoleAssignment(models.Model):
     """
     Assignment of an user to a role in a project. One local assignment per user
@@ -848,6 +1168,9 @@ class RoleAssignment(models.Model):
         default=uuid.uuid4, unique=True, help_text='RoleAssignment SODAR UUID'
     )
 
+    # Set manager for custom queries
+    objects = RoleAssignmentManager()
+
     class Meta:
         ordering = [
             'project__parent__title',
@@ -928,6 +1251,258 @@ class RoleAssignment(models.Model):
         self._validate_owner()
         self._validate_delegate()
         super().save(*args, **kwargs)
+        EffectiveRole.objects.update_assignment(self)
+        clear_role_memo()
+
+    def delete(self, *args, **kwargs):
+        """Custom deletion for RoleAssignment, clearing memoized roles"""
+        ret = super().delete(*args, **kwargs)
+        clear_role_memo()
+        return ret
+
+
+# EffectiveRole ----------------------------------------------------------------
+
+
+class EffectiveRoleManager(models.Manager):
+    """Manager for custom table-level EffectiveRole queries"""
+
+    def _build(
+        self,
+        projects: list[Project],
+        assignments: QuerySet[RoleAssignment],
+        targets: Optional[list[Project]] = None,
+    ) -> list['EffectiveRole']:
+        """
+        Return unsaved EffectiveRole objects for projects.
+
+        :param projects: List of Project objects ordered so that parents
+                         precede their children
+        :param assignments: QuerySet of RoleAssignment objects for projects
+        :param targets: Only return objects for these projects (optional)
+        :return: List of EffectiveRole objects
+        """
+        target_pks = {p.pk for p in targets} if targets else None
+        local_roles = defaultdict(list)
+        for a in assignments.select_related('role'):
+            local_roles[a.project_id].append(a)
+        chains = {}
+        ret = []
+        for p in projects:
+            chains[p.pk] = chains.get(p.parent_id, []) + local_roles[p.pk]
+            if target_pks is not None and p.pk not in target_pks:
+                continue
+            for a in chains[p.pk]:
+                if p.type not in a.role.project_types:
+                    continue
+                ret.append(
+                    self.model(
+                        project=p,
+                        user_id=a.user_id,
+                        role_assignment=a,
+                        rank=a.role.rank,
+                        inherited=a.project_id != p.pk,
+                    )
+                )
+        return ret
+
+    def update_assignment(self, role_as: RoleAssignment):
+        """
+        Update effective roles for a role assignment in its project and the
+        children of the project.
+
+        :param role_as: RoleAssignment object
+        """
+        self.filter(role_assignment=role_as).delete()
+        project = role_as.project
+        projects = [project] + list(project.get_children(flat=True))
+        self.bulk_create(
+            [
+                self.model(
+                    project=p,
+                    user_id=role_as.user_id,
+                    role_assignment=role_as,
+                    rank=role_as.role.rank,
+                    inherited=p != project,
+                )
+                for p in projects
+                if p.type in role_as.role.project_types
+            ]
+        )
+
+    def add_assignments(self, role_assignments: list[RoleAssignment]):
+        """
+        Create effective roles for multiple new role assignments in their
+        projects and the children of the projects. Used for role assignments
+        created with bulk_create(), which does not call save().
+
+        :param role_assignments: List of RoleAssignment objects
+        """
+        descendants = defaultdict(list)
+        for link in ProjectAncestor.objects.filter(
+            ancestor__in={a.project_id for a in role_assignments}
+        ).select_related('descendant'):
+            descendants[link.ancestor_id].append(link.descendant)
+        self.bulk_create(
+            [
+                self.model(
+                    project=p,
+                    user_id=a.user_id,
+                    role_assignment=a,
+                    rank=a.role.rank,
+                    inherited=p.pk != a.project_id,
+                )
+                for a in role_assignments
+                for p in descendants[a.project_id]
+                if p.type in a.role.project_types
+            ]
+        )
+
+    def update_project(self, project: Project):
+        """
+        Update effective roles for a project and its children. Should be called
+        when a project is created or moved under another category. Roles are
+        resolved from the ProjectAncestor closure in batches without loading
+        the projects of the subtree.
+
+        :param project: Project object
+        """
+        subtree = ProjectAncestor.objects.filter(ancestor=project).values(
+            'descendant'
+        )
+        self.filter(project__in=subtree).delete()
+        rows = (
+            ProjectAncestor.objects.filter(
+                descendant__in=subtree, ancestor__local_roles__isnull=False
+            )
+            .order_by()
+            .values_list(
+                'descendant',
+                'descendant__type',
+                'depth',
+                'ancestor__local_roles',
+                'ancestor__local_roles__user',
+                'ancestor__local_roles__role__rank',
+                'ancestor__local_roles__role__project_types',
+            )
+        )
+        batch = []
+        for p_pk, p_type, depth, a_pk, user_pk, rank, p_types in rows.iterator(
+            chunk_size=EFFECTIVE_ROLE_BATCH_SIZE
+        ):
+            if p_type not in p_types:
+                continue
+            batch.append(
+                self.model(
+                    project_id=p_pk,
+                    user_id=user_pk,
+                    role_assignment_id=a_pk,
+                    rank=rank,
+                    inherited=depth > 0,
+                )
+            )
+            if len(batch) >= EFFECTIVE_ROLE_BATCH_SIZE:
+                self.bulk_create(batch)
+                batch = []
+        if batch:
+            self.bulk_create(batch)
+
+    def rebuild(self) -> int:
+        """
+        Rebuild effective roles for all projects.
+
+        :return: Number of EffectiveRole objects created (int)
+        """
+        self.all().delete()
+        ret = self.bulk_create(
+            self._build(
+                list(Project.objects.all().order_by('full_title')),
+                RoleAssignment.objects.all(),
+            )
+        )
+        bump_perm_generation(PERM_GEN_GLOBAL)
+        clear_role_memo()
+        return len(ret)
+
+
+class EffectiveRole(models.Model):
+    """
+    Denormalized role assignment applicable in a project, either assigned
+    locally or inherited from a parent category. Maintained automatically on
+    RoleAssignment and Project changes, used for resolving roles without
+    traversing the project hierarchy.
+
+    Use the Project model API (e.g. Project.get_role()) to query roles instead
+    of accessing these objects directly.
+    """
+
+    #: Project in which the role is effective
+    project = models.ForeignKey(
+        Project,
+        related_name='effective_roles',
+        help_text='Project in which the role is effective',
+        on_delete=models.CASCADE,
+    )
+
+    #: User for whom the role is effective
+    user = models.ForeignKey(
+        AUTH_USER_MODEL,
+        related_name='effective_roles',
+        help_text='User for whom the role is effective',
+        on_delete=models.CASCADE,
+    )
+
+    #: Local or inherited role assignment
+    role_assignment = models.ForeignKey(
+        RoleAssignment,
+        related_name='effective_roles',
+        help_text='Local or inherited role assignment',
+        on_delete=models.CASCADE,
+    )
+
+    #: Rank of the assigned role
+    rank = models.IntegerField(help_text='Rank of the assigned role')
+
+    #: Whether the role is inherited from a parent category
+    inherited = models.BooleanField(
+        default=False,
+        help_text='Whether the role is inherited from a parent category',
+    )
+
+    # Set manager for custom queries
+    objects = EffectiveRoleManager()
+
+    class Meta:
+        ordering = ['project__full_title', 'rank', 'user__username']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['project', 'role_assignment'],
+                name='unique_effective_role',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['user', 'project', 'rank'],
+                name='effective_role_user_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return '{}: {}: {}{}'.format(
+            self.project,
+            self.role_assignment.role,
+            self.user,
+            ' [INHERITED]' if self.inherited else '',
+        )
+
+    def __repr__(self):
+        values = (
+            self.project.title,
+            self.user.username,
+            self.role_assignment.role.name,
+            self.inherited,
+        )
+        return 'EffectiveRole({})'.format(', '.join(repr(v) for v in values))
 
 
 # AppSetting -------------------------------------------------------------------
@@ -965,6 +1540,37 @@ class AppSettingManager(models.Manager):
         setting = super().get_queryset().get(**query_parameters)
         return setting.get_value()
 
+    def get_setting_values(
+        self,
+        project: Optional[Project] = None,
+        user: Optional[AbstractUser] = None,
+        setting_names: Optional[list[str]] = None,
+    ) -> dict:
+        """
+        Return values of all settings set for project and/or user in a single
+        query.
+
+        :param project: Project object or pk
+        :param user: User object or pk
+        :param setting_names: Only return settings with these names if set
+                              (list of strings or None)
+        :return: Dict with (plugin_name, setting_name) tuples as keys
+        """
+        qs = (
+            super()
+            .get_queryset()
+            .filter(project=project, user=user)
+            .select_related('app_plugin')
+        )
+        if setting_names is not None:
+            qs = qs.filter(name__in=setting_names)
+        return {
+            (s.app_plugin.name if s.app_plugin else APP_NAME, s.name): (
+                s.get_value()
+            )
+            for s in qs
+        }
+
 
 class AppSetting(models.Model):
     """
@@ -1067,13 +1673,20 @@ class AppSetting(models.Model):
 
     def save(self, *args, **kwargs):
         """Version of save() to convert 'value' data according to 'type'"""
+        self.convert_value()
+        super().save(*args, **kwargs)
+
+    # Custom row-level functions
+
+    def convert_value(self):
+        """
+        Convert 'value' data according to 'type'. Called in save(), must be
+        called separately when saving objects in bulk.
+        """
         if self.type == APP_SETTING_TYPE_BOOLEAN:
             self.value = str(int(self.value))
         elif self.type == APP_SETTING_TYPE_INTEGER:
             self.value = str(self.value)
-        super().save(*args, **kwargs)
-
-    # Custom row-level functions
 
     def get_value(self) -> Any:
         """Return value of the setting in the format specified in 'type'"""
@@ -1461,9 +2074,35 @@ class SODARUser(AbstractUser):
         default=uuid.uuid4, unique=True, help_text='User SODAR UUID'
     )
 
+    #: User names and email for search (auto-generated)
+    search_text = models.GeneratedField(
+        expression=Concat(
+            'username',
+            Value(' '),
+            'name',
+            Value(' '),
+            'first_name',
+            Value(' '),
+            'last_name',
+            Value(' '),
+            'email',
+            output_field=models.TextField(),
+        ),
+        output_field=models.TextField(),
+        db_persist=True,
+        help_text='User names and email for search (auto-generated)',
+    )
+
     class Meta:
         abstract = True
         ordering = ['name', 'username']
+        # Trigram index for case-insensitive partial matching in autocomplete
+        indexes = [
+            GinIndex(
+                OpClass(Upper('search_text'), name='gin_trgm_ops'),
+                name='%(class)s_search_trgm',
+            ),
+        ]
 
     def __str__(self):
         return self.username
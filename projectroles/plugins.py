@@ -1,14 +1,18 @@
 """Plugin point definitions and plugin API for apps based on projectroles"""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 import json
 import logging
+import threading
+import time
 
 from typing import Any, Optional, Union
 from uuid import UUID
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connections
 from django.db.models import Model, QuerySet
 from django.http import HttpRequest
 from djangoplugins.point import PluginPoint
@@ -28,6 +32,7 @@ User = get_user_model()
 
 # SODAR constants
 PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
+PROJECT_ACTION_CREATE = SODAR_CONSTANTS['PROJECT_ACTION_CREATE']
 APP_SETTING_SCOPE_PROJECT = SODAR_CONSTANTS['APP_SETTING_SCOPE_PROJECT']
 APP_SETTING_SCOPE_USER = SODAR_CONSTANTS['APP_SETTING_SCOPE_USER']
 APP_SETTING_SCOPE_PROJECT_USER = SODAR_CONSTANTS[
@@ -52,6 +57,9 @@ APP_SETTING_SCOPES = [
     APP_SETTING_SCOPE_SITE,
 ]
 APP_SETTING_OPTION_TYPES = [APP_SETTING_TYPE_INTEGER, APP_SETTING_TYPE_STRING]
+SEARCH_MAX_WORKERS = 4
+SEARCH_TIMEOUT = 30
+SEARCH_TIMEOUT_MSG = 'Search timed out after {timeout} seconds'
 
 # From djangoplugins
 ENABLED = 0
@@ -150,6 +158,46 @@ class ProjectModifyPluginMixin:
         """
         pass
 
+    def perform_role_bulk_create(
+        self,
+        project: Project,
+        role_assignments: list[RoleAssignment],
+        request: Optional[HttpRequest] = None,
+    ):
+        """
+        Perform additional actions to finalize creation of multiple role
+        assignments in a project in bulk. By default, calls
+        perform_role_modify() for each role assignment. Override to handle the
+        role assignments in a single batch.
+
+        :param project: Project object
+        :param role_assignments: List of RoleAssignment objects
+        :param request: Request object or None
+        """
+        for role_as in role_assignments:
+            self.perform_role_modify(
+                role_as, PROJECT_ACTION_CREATE, None, request
+            )
+
+    def revert_role_bulk_create(
+        self,
+        project: Project,
+        role_assignments: list[RoleAssignment],
+        request: Optional[HttpRequest] = None,
+    ):
+        """
+        Revert bulk role assignment creation if errors have occurred in other
+        apps. By default, calls revert_role_modify() for each role assignment.
+
+        :param project: Project object
+        :param role_assignments: List of RoleAssignment objects
+        :param request: Request object or None
+        """
+        for role_as in role_assignments:
+            self.revert_role_modify(
+                role_as, PROJECT_ACTION_CREATE, None, request
+            )
+
     def perform_role_delete(
         self,
         role_as: RoleAssignment,
@@ -358,6 +406,10 @@ class ProjectAppPluginPoint(PluginPoint):
     #: CSS file for the search resutls table from this plugin (optional)
     search_css = None
 
+    #: Search timeout in seconds overriding PROJECTROLES_SEARCH_TIMEOUT for
+    #: this plugin, 0 to disable (optional)
+    search_timeout = None
+
     #: App card template for the project details page
     details_template = None
 
@@ -494,6 +546,25 @@ class ProjectAppPluginPoint(PluginPoint):
         """
         return None
 
+    def get_project_list_values(
+        self, column_id: str, projects: list[Project], user: User
+    ) -> dict[UUID, Union[str, int, None]]:
+        """
+        Return values for the optional additional project list column for
+        multiple projects. Override to retrieve values in bulk. By default,
+        calls get_project_list_value() for each project.
+
+        :param column_id: ID of the column (string)
+        :param projects: List of Project objects
+        :param user: User object (current user)
+        :return: Dict of strings (may contain HTML), integers or None with
+                 project UUIDs as keys
+        """
+        return {
+            p.sodar_uuid: self.get_project_list_value(column_id, p, user)
+            for p in projects
+        }
+
     def validate_form_app_settings(
         self,
         app_settings: dict,
@@ -721,6 +792,7 @@ class PluginAppSettingDef:
         global_edit: bool = False,
         project_types: Optional[list[str]] = None,
         widget_attrs: Optional[dict] = None,
+        cache_default: bool = False,
     ):
         """
         Initialize PluginAppSettingDef.
@@ -745,6 +817,8 @@ class PluginAppSettingDef:
         :param project_types: Allowed project types (optional,
                               default=[PROJECT_TYPE_PROJECT])
         :parm widget_attrs: Form widget attributes (optional, dict)
+        :param cache_default: Cache return value of callable default per
+                              project and user (optional, default=False)
         :raise: ValueError if an argument is not valid
         """
         # Validate provided values
@@ -783,6 +857,7 @@ class PluginAppSettingDef:
         self.global_edit = global_edit
         self.project_types = project_types or [PROJECT_TYPE_PROJECT]
         self.widget_attrs = widget_attrs or {}
+        self.cache_default = cache_default
 
     @classmethod
     def validate_scope(cls, scope: str):
@@ -1197,6 +1272,186 @@ class PluginAPI:
                 pass
         return None
 
+    @classmethod
+    def _search_plugin(
+        cls,
+        plugin: Any,
+        search_terms: list[str],
+        user: User,
+        projects: QuerySet[Project],
+        keywords: dict,
+        worker: bool = False,
+    ) -> tuple[Optional[str], list['PluginSearchResult']]:
+        """
+        Call search() for a single plugin.
+
+        :param plugin: Project app plugin object
+        :param search_terms: Search terms (list of strings)
+        :param user: User object for user initiating the search
+        :param projects: QuerySet of projects where the search is performed
+        :param keywords: Search keywords (dict)
+        :param worker: Close database connections on return if True (bool)
+        :return: Tuple of error (string or None) and list of
+                 PluginSearchResult objects
+        """
+        start = time.monotonic()
+        try:
+            return None, plugin.search(search_terms, user, projects, **keywords)
+        except Exception as ex:
+            if settings.DEBUG:
+                raise ex
+            logger.error(
+                'Exception raised by search() in {}: "{}" ({})'.format(
+                    plugin.name,
+                    ex,
+                    f'terms={search_terms}; '
+                    f'user={user}; '
+                    f'projects={projects}; '
+                    f'keywords={keywords}',
+                )
+            )
+            return str(ex), []
+        finally:
+            logger.debug(
+                'Search in {} took {:.3f}s'.format(
+                    plugin.name, time.monotonic() - start
+                )
+            )
+            if worker:
+                connections.close_all()
+
+    @classmethod
+    def _get_search_timeout(cls, plugin: Any) -> Union[int, float]:
+        """
+        Return search timeout for a project app plugin.
+
+        :param plugin: Project app plugin object
+        :return: Timeout in seconds, 0 if disabled
+        """
+        timeout = getattr(plugin, 'search_timeout', None)
+        if timeout is None:
+            timeout = getattr(
+                settings, 'PROJECTROLES_SEARCH_TIMEOUT', SEARCH_TIMEOUT
+            )
+        return timeout
+
+    @classmethod
+    def search_plugins(
+        cls,
+        plugins: list[Any],
+        search_terms: list[str],
+        user: User,
+        projects: QuerySet[Project],
+        keywords: Optional[dict] = None,
+    ) -> dict[str, tuple[Optional[str], list['PluginSearchResult']]]:
+        """
+        Call search() concurrently for multiple project app plugins in worker
+        threads started for this call. Plugins not returning results within
+        their timeout return an error. The timeout is set in the search_timeout
+        attribute of the plugin or in PROJECTROLES_SEARCH_TIMEOUT, and counted
+        from the start of the search in the plugin. At most
+        PROJECTROLES_SEARCH_MAX_WORKERS plugins are searched at the same time.
+        If set to 0, plugins are searched sequentially in the current thread
+        without a timeout.
+
+        NOTE: Timed out searches are not interrupted and keep running in their
+              worker thread until search() returns. If all worker threads are
+              taken by timed out searches, remaining plugins return an error.
+
+        :param plugins: List of project app plugin objects
+        :param search_terms: Search terms (list of strings)
+        :param user: User object for user initiating the search
+        :param projects: QuerySet of projects where the search is performed
+        :param keywords: Optional search keywords (dict)
+        :return: Dict of tuples of error (string or None) and list of
+                 PluginSearchResult objects, with plugin names as keys
+        """
+        keywords = keywords or {}
+        max_workers = getattr(
+            settings, 'PROJECTROLES_SEARCH_MAX_WORKERS', SEARCH_MAX_WORKERS
+        )
+        if not max_workers or not plugins:
+            return {
+                p.name: cls._search_plugin(
+                    p, search_terms, user, projects, keywords
+                )
+                for p in plugins
+            }
+        timeouts = {p.name: cls._get_search_timeout(p) for p in plugins}
+        started = {}
+        cond = threading.Condition()
+
+        def _search(plugin):
+            with cond:
+                started[plugin.name] = time.monotonic()
+                cond.notify_all()
+            return cls._search_plugin(
+                plugin, search_terms, user, projects, keywords, True
+            )
+
+        def _notify(future):
+            with cond:
+                cond.notify_all()
+
+        worker_count = min(max_workers, len(plugins))
+        executor = ThreadPoolExecutor(
+            max_workers=worker_count, thread_name_prefix='sodar_search'
+        )
+        futures = {}
+        for p in plugins:
+            futures[p.name] = executor.submit(_search, p)
+            futures[p.name].add_done_callback(_notify)
+        executor.shutdown(wait=False)  # Threads exit once searches return
+
+        ret = {}
+        timed_out = set()
+        with cond:
+            while len(ret) < len(futures):
+                now = time.monotonic()
+                deadlines = []
+                for name, future in futures.items():
+                    if name in ret:
+                        continue
+                    if future.done():
+                        ret[name] = future.result()
+                        continue
+                    if name not in started or not timeouts[name]:
+                        continue
+                    deadline = started[name] + timeouts[name]
+                    if now < deadline:
+                        deadlines.append(deadline)
+                        continue
+                    logger.error(
+                        f'Search in {name} timed out ({timeouts[name]}s)'
+                    )
+                    timed_out.add(name)
+                    ret[name] = (
+                        SEARCH_TIMEOUT_MSG.format(timeout=timeouts[name]),
+                        [],
+                    )
+                blocked = [n for n in timed_out if not futures[n].done()]
+                if len(ret) < len(futures) and len(blocked) >= worker_count:
+                    # Remaining searches would never start
+                    for name, future in futures.items():
+                        if name not in ret:
+                            future.cancel()
+                            logger.error(
+                                f'Search in {name} not started, workers '
+                                f'taken by timed out searches'
+                            )
+                            ret[name] = (
+                                SEARCH_TIMEOUT_MSG.format(
+                                    timeout=timeouts[name]
+                                ),
+                                [],
+                            )
+                    break
+                if len(ret) < len(futures):
+                    cond.wait(
+                        timeout=min(deadlines) - now if deadlines else None
+                    )
+        return {p.name: ret[p.name] for p in plugins}
+
     @classmethod
     def get_backend_api(
         cls, plugin_name: str, force: bool = False, **kwargs
@@ -2,9 +2,12 @@
 
 from email.utils import parseaddr
 from packaging.version import parse as parse_version
+from typing import Optional
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db.models import Manager, Prefetch, QuerySet
+from django.http import HttpRequest
 
 from rest_framework import exceptions, serializers
 from drf_keyed_list import KeyedListSerializer
@@ -12,6 +15,7 @@ from drf_keyed_list import KeyedListSerializer
 from projectroles.app_settings import AppSettingAPI
 from projectroles.models import (
     Project,
+    EffectiveRole,
     Role,
     RoleAssignment,
     ProjectInvite,
@@ -46,32 +50,90 @@ PROJECT_ROLE_FINDER = SODAR_CONSTANTS['PROJECT_ROLE_FINDER']
 SYSTEM_USER_GROUP = SODAR_CONSTANTS['SYSTEM_USER_GROUP']
 
 # Local constants
+APP_NAME = 'projectroles'
 REMOTE_MODIFY_MSG = (
     'Modification of remote projects is not allowed, modify on the SOURCE site '
     'instead'
 )
 VERSION_1_1 = parse_version('1.1')
 VERSION_2_0 = parse_version('2.0')
+FIELDS_QUERY_PARAM = 'fields'
+OMIT_QUERY_PARAM = 'omit'
 
 
 # Base Serializers -------------------------------------------------------------
 
 
 class SODARModelSerializer(serializers.ModelSerializer):
-    """Base serializer for any SODAR model with a sodar_uuid field"""
+    """
+    Base serializer for any SODAR model with a sodar_uuid field.
+
+    Supports sparse fieldsets in GET requests. Returned fields can be limited
+    with the "fields" query string, or excluded with the "omit" query string,
+    both given as comma-separated field names. Fields not returned are not
+    computed. Only applies to the topmost serializer, not nested ones.
+    """
 
     sodar_uuid = serializers.CharField(read_only=True)
 
     class Meta:
         pass
 
+    def _get_query_fields(self, param: str) -> Optional[set[str]]:
+        """
+        Return field names from comma-separated query string parameter.
+
+        :param param: Query string parameter name (string)
+        :return: Set of strings or None if not limited by request
+        """
+        request = self.context.get('request')
+        if not request or request.method != 'GET':
+            return None
+        # Only apply to topmost serializer or list serializer child
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return None
+        value = getattr(request, 'query_params', request.GET).get(param)
+        if not value:
+            return None
+        return {f.strip() for f in value.split(',') if f.strip()}
+
+    def is_field_included(self, field_name: str) -> bool:
+        """
+        Return whether field is to be returned according to the "fields" and
+        "omit" query strings of the request. Can also be used for values added
+        in to_representation() which are not declared as fields.
+
+        :param field_name: Name of field (string)
+        :return: Boolean
+        """
+        include = self._get_query_fields(FIELDS_QUERY_PARAM)
+        omit = self._get_query_fields(OMIT_QUERY_PARAM)
+        return (include is None or field_name in include) and (
+            omit is None or field_name not in omit
+        )
+
+    def get_fields(self):
+        """
+        Override get_fields() to only return fields requested with the
+        "fields" and "omit" query strings.
+        """
+        fields = super().get_fields()
+        return {k: v for k, v in fields.items() if self.is_field_included(k)}
+
     def to_representation(self, instance):
         """
         Override to_representation() to ensure sodar_uuid is included for object
         creation POST responses.
         """
         ret = super().to_representation(instance)
-        if 'sodar_uuid' not in ret and 'sodar_uuid' in self.context:
+        if (
+            'sodar_uuid' not in ret
+            and 'sodar_uuid' in self.context
+            and self.is_field_included('sodar_uuid')
+        ):
             ret['sodar_uuid'] = str(self.context['sodar_uuid'])
         return ret
 
@@ -117,7 +179,11 @@ class SODARProjectModelSerializer(SODARModelSerializer):
         in responses.
         """
         ret = super().to_representation(instance)
-        if 'project' not in ret and 'project' in self.context:
+        if (
+            'project' not in ret
+            and 'project' in self.context
+            and self.is_field_included('project')
+        ):
             ret['project'] = str(self.context['project'].sodar_uuid)
         return ret
 
@@ -168,7 +234,36 @@ class SODARUserSerializer(SODARModelSerializer):
             'sodar_uuid',
         ]
 
+    @classmethod
+    def setup_eager_loading(
+        cls,
+        queryset: QuerySet,
+        request: Optional[HttpRequest] = None,
+        prefix: str = '',
+    ) -> QuerySet:
+        """
+        Return queryset with related objects required in user serialization
+        prefetched. If request is given, only objects for fields requested with
+        the "fields" and "omit" query strings are included.
+
+        :param queryset: QuerySet of User objects or objects related to users
+        :param request: Request object (optional)
+        :param prefix: Lookup prefix for user relation (string, optional)
+        :return: QuerySet
+        """
+        fields = cls(context={'request': request}).fields
+        if 'additional_emails' in fields:
+            queryset = queryset.prefetch_related(prefix + 'additional_emails')
+        if 'auth_type' in fields:
+            queryset = queryset.prefetch_related(prefix + 'groups')
+        return queryset
+
     def get_additional_emails(self, obj: User) -> list:
+        # Use prefetched emails if available
+        if 'additional_emails' in getattr(obj, '_prefetched_objects_cache', {}):
+            return sorted(
+                e.email for e in obj.additional_emails.all() if e.verified
+            )
         return [
             e.email
             for e in SODARUserAdditionalEmail.objects.filter(
@@ -339,6 +434,187 @@ class RoleAssignmentNestedListSerializer(
         read_only_fields = ['role']
 
 
+class RoleAssignmentBulkEntrySerializer(serializers.Serializer):
+    """Serializer for a single entry in bulk role assignment creation"""
+
+    project = serializers.UUIDField()
+    user = serializers.UUIDField()
+    role = serializers.CharField()
+
+
+class RoleAssignmentBulkCreateSerializer(
+    RoleAssignmentModifyMixin, serializers.Serializer
+):
+    """
+    Serializer for creating multiple RoleAssignment objects in bulk. All
+    entries are validated together and either all or none of them are
+    created.
+    """
+
+    roles = RoleAssignmentBulkEntrySerializer(many=True, allow_empty=False)
+
+    @classmethod
+    def _validate_perms(cls, entries: list[dict], request: HttpRequest):
+        """
+        Validate user permissions for projects in bulk entries using the
+        project access checks of SODARAPIProjectPermission.
+        """
+        from projectroles.views_api import SODARAPIProjectPermission
+
+        has_perm = SODARAPIProjectPermission.has_project_permission
+        for project in {e['project'] for e in entries}:
+            if not has_perm(
+                request, project, 'projectroles.update_project_members'
+            ):
+                raise exceptions.PermissionDenied(
+                    f'User lacks permission to modify members in project '
+                    f'(UUID={project.sodar_uuid})'
+                )
+        for project in {
+            e['project']
+            for e in entries
+            if e['role'].name == PROJECT_ROLE_DELEGATE
+        }:
+            if not has_perm(
+                request, project, 'projectroles.update_project_delegate'
+            ):
+                raise exceptions.PermissionDenied(
+                    f'User lacks permission to assign delegates in project '
+                    f'(UUID={project.sodar_uuid})'
+                )
+
+    def validate(self, attrs):
+        entries = attrs['roles']
+        del_limit = getattr(settings, 'PROJECTROLES_DELEGATE_LIMIT', 1)
+        errors = []
+
+        # Retrieve objects
+        projects = Project.objects.filter(
+            sodar_uuid__in={e['project'] for e in entries}
+        ).in_bulk(field_name='sodar_uuid')
+        users = User.objects.filter(
+            sodar_uuid__in={e['user'] for e in entries}
+        ).in_bulk(field_name='sodar_uuid')
+        roles = Role.objects.filter(
+            name__in={e['role'] for e in entries}
+        ).in_bulk(field_name='name')
+        for i, e in enumerate(entries):
+            for k, objects in [
+                ('project', projects),
+                ('user', users),
+                ('role', roles),
+            ]:
+                if e[k] not in objects:
+                    errors.append(f'Entry {i}: {k.capitalize()} not found')
+        if errors:
+            raise serializers.ValidationError(errors)
+        entries = [
+            {
+                'project': projects[e['project']],
+                'user': users[e['user']],
+                'role': roles[e['role']],
+            }
+            for e in entries
+        ]
+        # Check permissions
+        self._validate_perms(entries, self.context['request'])
+        project_list = list({e['project'] for e in entries})
+        for project in project_list:
+            if project.is_remote():
+                raise serializers.ValidationError(REMOTE_MODIFY_MSG)
+
+        # Retrieve existing local and inherited roles
+        user_list = list({e['user'] for e in entries})
+        local_roles = {
+            (a.project_id, a.user_id): a
+            for a in RoleAssignment.objects.filter(
+                project__in=project_list, user__in=user_list
+            ).select_related('role')
+        }
+        inherited_roles = {}
+        for e_role in (
+            EffectiveRole.objects.filter(
+                project__in=project_list, user__in=user_list, inherited=True
+            )
+            .select_related('role_assignment__role')
+            .order_by('rank')
+        ):
+            inherited_roles.setdefault(
+                (e_role.project_id, e_role.user_id), e_role.role_assignment
+            )
+        delegate_counts = {
+            p.pk: RoleAssignment.objects.filter(
+                project=p, role__name=PROJECT_ROLE_DELEGATE
+            ).count()
+            for p in {
+                e['project']
+                for e in entries
+                if e['role'].name == PROJECT_ROLE_DELEGATE
+            }
+        }
+
+        # Validate entries
+        seen = set()
+        for i, e in enumerate(entries):
+            project, user, role = e['project'], e['user'], e['role']
+            key = (project.pk, user.pk)
+            if role.name == PROJECT_ROLE_OWNER:
+                errors.append(f'Entry {i}: Modifying owner not allowed')
+            elif project.type not in role.project_types:
+                errors.append(
+                    f'Entry {i}: '
+                    + ROLE_PROJECT_TYPE_ERROR_MSG.format(
+                        project_type=project.type, role_name=role.name
+                    )
+                )
+            elif key in seen:
+                errors.append(
+                    f'Entry {i}: Duplicate entry for user "{user.username}" '
+                    f'in project (UUID={project.sodar_uuid})'
+                )
+            elif key in local_roles:
+                old_as = local_roles[key]
+                errors.append(
+                    f'Entry {i}: User "{user.username}" already has the role '
+                    f'of "{old_as.role.name}" in project '
+                    f'(UUID={project.sodar_uuid})'
+                )
+            elif key in inherited_roles and (
+                role.rank > inherited_roles[key].role.rank
+            ):
+                errors.append(
+                    f'Entry {i}: User "{user.username}" inherits role '
+                    f'"{inherited_roles[key].role.name}", demoting from '
+                    f'inherited role is not allowed'
+                )
+            elif role.name == PROJECT_ROLE_DELEGATE:
+                delegate_counts[project.pk] += 1
+                if del_limit != 0 and delegate_counts[project.pk] > del_limit:
+                    errors.append(
+                        f'Entry {i}: Project delegate limit of {del_limit} '
+                        f'has been reached (UUID={project.sodar_uuid})'
+                    )
+            seen.add(key)
+        if errors:
+            raise serializers.ValidationError(errors)
+        attrs['roles'] = entries
+        return attrs
+
+    def save(self, **kwargs):
+        """Override save() to create role assignments in bulk"""
+        self.instance = self.create_assignments_bulk(
+            data=self.validated_data['roles'], request=self.context['request']
+        )
+        return self.instance
+
+    def to_representation(self, instance):
+        return {
+            'roles': RoleAssignmentSerializer(
+                instance, many=True, context=self.context
+            ).data
+        }
+
+
 class ProjectInviteSerializer(
     ProjectInviteMixin, RoleAssignmentValidateMixin, SODARProjectModelSerializer
 ):
@@ -408,6 +684,21 @@ class ProjectInviteSerializer(
         return ret
 
 
+class ProjectListSerializer(serializers.ListSerializer):
+    """
+    List serializer for the Project model. Resolves roles of the requesting
+    user for all listed projects and their parents with a single query.
+    """
+
+    def to_representation(self, data):
+        projects = list(data.all() if isinstance(data, Manager) else data)
+        user = self.context['request'].user
+        self.context['user_roles'] = RoleAssignment.objects.get_effective_roles(
+            user, projects + [p.parent for p in projects if p.parent]
+        )
+        return super().to_representation(projects)
+
+
 class ProjectSerializer(ProjectModifyMixin, SODARModelSerializer):
     """Serializer for the Project model"""
 
@@ -460,6 +751,60 @@ class ProjectSerializer(ProjectModifyMixin, SODARModelSerializer):
             'sodar_uuid',
         ]
         read_only_fields = ['full_title']
+        list_serializer_class = ProjectListSerializer
+
+    @classmethod
+    def setup_eager_loading(
+        cls, queryset: QuerySet, request: Optional[HttpRequest] = None
+    ) -> QuerySet:
+        """
+        Return Project queryset with related objects required in serialization
+        included, to avoid per-project queries when serializing multiple
+        projects. If request is given, only objects for fields requested with
+        the "fields" and "omit" query strings are included.
+
+        :param queryset: QuerySet of Project objects
+        :param request: Request object (optional)
+        :return: QuerySet of Project objects
+        """
+        fields = cls(context={'request': request}).fields
+        # Parent is always needed for checking finder roles
+        queryset = queryset.select_related('parent')
+        if 'public_access' in fields:
+            queryset = queryset.select_related('public_access')
+        if 'children' in fields:
+            queryset = queryset.prefetch_related('children')
+        if 'roles' in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'effective_roles',
+                    queryset=SODARUserSerializer.setup_eager_loading(
+                        EffectiveRole.objects.select_related(
+                            'role_assignment__project',
+                            'role_assignment__role',
+                            'role_assignment__user',
+                        ),
+                        prefix='role_assignment__user__',
+                    ),
+                )
+            )
+        return queryset
+
+    def _get_user_role(
+        self, project: Project, user: User
+    ) -> Optional[RoleAssignment]:
+        """
+        Return role for user in project, using roles resolved in bulk by the
+        list serializer if available.
+
+        :param project: Project object
+        :param user: User object
+        :return: RoleAssignment object or None
+        """
+        user_roles = self.context.get('user_roles')
+        if user_roles is not None and project.pk in user_roles:
+            return user_roles[project.pk]
+        return project.get_role(user)
 
     def _validate_title(self, parent, attrs):
         """Validate title field"""
@@ -662,52 +1007,58 @@ class ProjectSerializer(ProjectModifyMixin, SODARModelSerializer):
         """
         ret = super().to_representation(instance)
         req_version = parse_version(self.context['request'].version)
-        # Set up project to get instance with UUID
-        parent = ret.get('parent')
-        project = Project.objects.get(
-            title=ret['title'],
-            **{'parent__sodar_uuid': parent} if parent else {},
-        )
+        # Get created project if serializing validated data on creation
+        if isinstance(instance, Project):
+            project = instance
+        else:
+            parent = ret.get('parent')
+            project = Project.objects.get(
+                title=ret['title'],
+                **{'parent__sodar_uuid': parent} if parent else {},
+            )
         user = self.context['request'].user
 
         # Return only title, full title and UUID for projects with finder role
         if (
             project.is_project()
             and project.parent
-            and not project.has_role(user)
+            and not project.public_access_id
+            and not self._get_user_role(project, user)
         ):
-            parent_as = project.parent.get_role(user)
+            parent_as = self._get_user_role(project.parent, user)
             if (
                 parent_as
                 and parent_as.role.rank >= ROLE_RANKING[PROJECT_ROLE_FINDER]
             ):
-                return {
+                ret = {
                     'title': project.title,
                     'full_title': project.full_title,
                     'sodar_uuid': str(project.sodar_uuid),
                 }
+                return {k: v for k, v in ret.items() if k in self.fields}
 
         # Else return full serialization
         # Proper rendering of readme
-        ret['readme'] = project.readme or ''
+        if 'readme' in ret:
+            ret['readme'] = project.readme or ''
         # Force project UUID
-        if not ret.get('sodar_uuid'):
+        if 'sodar_uuid' in self.fields and not ret.get('sodar_uuid'):
             ret['sodar_uuid'] = str(project.sodar_uuid)
         # Add inherited info to roles
         if ret.get('roles'):
-            for k, v in ret['roles'].items():
-                role_as = RoleAssignment.objects.get(sodar_uuid=k)
-                ret['roles'][k]['inherited'] = (
-                    True if role_as.project != project else False
-                )
+            roles = {str(a.sodar_uuid): a for a in project.get_roles()}
+            for k in ret['roles'].keys():
+                ret['roles'][k]['inherited'] = roles[k].project_id != project.pk
         # Set full_title manually
-        ret['full_title'] = project.full_title
+        if 'full_title' in self.fields:
+            ret['full_title'] = project.full_title
         # Remove children field for projects and API version <1.1
         if project.is_project() or req_version < VERSION_1_1:
             ret.pop('children', None)
         # Replace public_access with public_guest_access if API version <2.0
         if req_version < VERSION_2_0:
-            ret['public_guest_access'] = ret['public_access'] is not None
+            if 'public_access' in ret:
+                ret['public_guest_access'] = ret['public_access'] is not None
             ret.pop('public_access', None)
         else:  # Else remove public_guest_access
             ret.pop('public_guest_access', None)
@@ -742,10 +1093,14 @@ class AppSettingSerializer(SODARProjectModelSerializer):
         """Override to clean up data for serialization"""
         ret = super().to_representation(instance)
         if instance.app_plugin:
-            ret['plugin_name'] = instance.app_plugin.name
+            plugin_name = instance.app_plugin.name
         else:
-            ret['plugin_name'] = 'projectroles'
-        ret['value'] = instance.get_value()
+            plugin_name = 'projectroles'
+        # plugin_name has no model attribute, so it is not set by super()
+        if self.is_field_included('plugin_name'):
+            ret['plugin_name'] = plugin_name
+        if 'value' in ret:
+            ret['value'] = instance.get_value()
         if (
             isinstance(ret.get('user'), dict)
             and parse_version(self.context['request'].version) >= VERSION_2_0
@@ -753,8 +1108,9 @@ class AppSettingSerializer(SODARProjectModelSerializer):
             ret['user'] = ret['user']['sodar_uuid']
         # Return user_modifiable from definition since it is no longer in model
         # TODO: Remove this in projectroles API v3.0
-        s_def = app_settings.get_definition(
-            instance.name, plugin_name=ret['plugin_name']
-        )
-        ret['user_modifiable'] = s_def.user_modifiable
+        if self.is_field_included('user_modifiable'):
+            s_def = app_settings.get_definition(
+                instance.name, plugin_name=plugin_name
+            )
+            ret['user_modifiable'] = s_def.user_modifiable
         return ret
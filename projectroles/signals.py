@@ -1,19 +1,43 @@
 """Django signals for the projectroles app"""
 
+import functools
 import logging
 
 from axes.signals import user_locked_out
+from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.signals import (
     user_logged_in,
     user_logged_out,
     user_login_failed,
 )
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
+from django.utils.module_loading import autodiscover_modules
 
+from djangoplugins.models import Plugin
 from rest_framework.exceptions import PermissionDenied
 
-from projectroles.models import AUTH_PROVIDER_OIDC
+from projectroles.app_settings import AppSettingAPI
+from projectroles.cache import (
+    bump_perm_generation,
+    bump_search_generation,
+    clear_app_setting_cache,
+    get_search_cache_timeout,
+    PERM_GEN_GLOBAL,
+    PERM_GEN_PROJECT,
+    PERM_GEN_USER,
+)
+from projectroles.models import (
+    APP_NAME,
+    RoleAssignment,
+    AppSetting,
+    RemoteSite,
+    RemoteProject,
+    AUTH_PROVIDER_OIDC,
+)
+from projectroles.plugins import ProjectAppPluginPoint
 
 
 logger = logging.getLogger(__name__)
@@ -101,3 +125,116 @@ def raise_axes_permission_denied(request, *args, **kwargs):
         or '/api/' in request.get_full_path()
     ):
         raise PermissionDenied(ACCOUNT_LOCKED_MSG)
+
+
+# Permission cache signals -----------------------------------------------------
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_perms(sender, instance, **kwargs):
+    """Invalidate cached permissions on user update"""
+    # Login timestamp updates do not affect permissions
+    if kwargs.get('update_fields') == frozenset(['last_login']):
+        return
+    bump_perm_generation(PERM_GEN_USER, [instance.pk])
+
+
+@receiver(post_save, sender=RoleAssignment)
+@receiver(post_delete, sender=RoleAssignment)
+def invalidate_role_perms(sender, instance, **kwargs):
+    """Invalidate cached permissions on role assignment update"""
+    bump_perm_generation(PERM_GEN_USER, [instance.user_id])
+    # Project members are returned in project lists
+    bump_perm_generation(PERM_GEN_PROJECT, [instance.project_id])
+
+
+@receiver(post_save, sender=AppSetting)
+@receiver(post_delete, sender=AppSetting)
+def invalidate_app_setting_perms(sender, instance, **kwargs):
+    """Invalidate cached permissions on app setting update"""
+    if instance.project_id:
+        bump_perm_generation(PERM_GEN_PROJECT, [instance.project_id])
+    if instance.user_id:
+        bump_perm_generation(PERM_GEN_USER, [instance.user_id])
+    if not instance.project_id and not instance.user_id:
+        bump_perm_generation(PERM_GEN_GLOBAL)
+
+
+@receiver(post_save, sender=AppSetting)
+@receiver(post_delete, sender=AppSetting)
+def invalidate_app_setting_cache(sender, instance, **kwargs):
+    """Invalidate cached app setting value on app setting update"""
+    clear_app_setting_cache(
+        instance.app_plugin.name if instance.app_plugin_id else APP_NAME,
+        instance.name,
+        instance.project_id,
+        instance.user_id,
+    )
+
+
+@receiver(post_save, sender=RemoteProject)
+@receiver(post_delete, sender=RemoteProject)
+def invalidate_remote_project_perms(sender, instance, **kwargs):
+    """Invalidate cached permissions on remote project update"""
+    if instance.project_id:
+        bump_perm_generation(PERM_GEN_PROJECT, [instance.project_id])
+
+
+@receiver(post_save, sender=RemoteSite)
+@receiver(post_delete, sender=RemoteSite)
+@receiver(setting_changed)
+def invalidate_site_perms(sender, **kwargs):
+    """Invalidate all cached permissions on remote site or settings update"""
+    bump_perm_generation(PERM_GEN_GLOBAL)
+
+
+# Search cache signals ---------------------------------------------------------
+
+
+@functools.cache
+def get_search_app_labels() -> frozenset[str]:
+    """
+    Return labels of apps with search enabled project app plugins. Models in
+    these apps may affect cached search results.
+
+    :return: Frozenset of app labels (strings)
+    """
+    # Import plugin modules without querying the plugin database table
+    autodiscover_modules('plugins')
+    ret = {APP_NAME}
+    classes = ProjectAppPluginPoint.__subclasses__()
+    while classes:
+        c = classes.pop()
+        classes += c.__subclasses__()
+        app_config = apps.get_containing_app_config(c.__module__)
+        if c.search_enable and app_config:
+            ret.add(app_config.label)
+    return frozenset(ret)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_search_results(sender, **kwargs):
+    """Invalidate cached search results on model update in a searched app"""
+    app_label = sender._meta.app_label
+    if get_search_cache_timeout() and app_label in get_search_app_labels():
+        bump_search_generation(app_label)
+
+
+# App setting definition signals -----------------------------------------------
+
+
+@receiver(post_save, sender=Plugin)
+@receiver(post_delete, sender=Plugin)
+@receiver(post_migrate)
+def clear_app_setting_registry(sender, **kwargs):
+    """Clear app setting definition registry on plugin update"""
+    AppSettingAPI.clear_registry()
+
+
+@receiver(setting_changed)
+def clear_app_setting_registry_settings(sender, setting, **kwargs):
+    """Clear app setting definition registry on test definition update"""
+    if setting == 'PROJECTROLES_APP_SETTINGS_TEST':
+        AppSettingAPI.clear_registry()
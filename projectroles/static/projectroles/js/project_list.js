@@ -22,9 +22,6 @@ function updateCustomColumns(uuids) {
     })
   }
 
-  // Get datatables table and API
-  let dt = $('#sodar-pr-project-list-table').DataTable()
-  let dtApi = new $.fn.dataTable.Api('#sodar-pr-project-list-table')
   let start = 0
   let interval = 25
   let values = []
@@ -38,6 +35,9 @@ function updateCustomColumns(uuids) {
     dfdNext.pipe(function () {
       let value = values.shift()
       return getAjaxRequest(value[0], value[1]).done(function (data) {
+        // Get datatables table and API, table may have been reinitialized
+        let dt = $('#sodar-pr-project-list-table').DataTable()
+        let dtApi = new $.fn.dataTable.Api('#sodar-pr-project-list-table')
         $.each(data, function (uuid, projectData) {
           let dtRow = dt.row('#sodar-pr-project-list-item-' + uuid)
           let rowIdx = dtRow.index()
@@ -75,8 +75,6 @@ function updateRoleColumn(uuids) {
     })
   }
 
-  let dt = $('#sodar-pr-project-list-table').DataTable()
-  let dtApi = new $.fn.dataTable.Api('#sodar-pr-project-list-table')
   let start = 0
   let interval = 25
   let values = []
@@ -89,6 +87,8 @@ function updateRoleColumn(uuids) {
     dfdNext.pipe(function () {
       let value = values.shift()
       return getAjaxRequest(value[0], value[1]).done(function (data) {
+        let dt = $('#sodar-pr-project-list-table').DataTable()
+        let dtApi = new $.fn.dataTable.Api('#sodar-pr-project-list-table')
         $.each(data, function (uuid, colData) {
           let dtRow = dt.row('#sodar-pr-project-list-item-' + uuid)
           let rowIdx = dtRow.index()
@@ -139,12 +139,24 @@ function toggleStarring(initial) {
   }
 }
 
+// Method for setting category expand link state
+function setExpandLink(link, expanded) {
+  let icon = 'mdi:chevron-right'
+  let title = 'Expand'
+  if (expanded) {
+    icon = 'mdi:chevron-down'
+    title = 'Collapse'
+  }
+  link.attr('data-expanded', +expanded).attr('title', title).html(
+    '<i class="iconify" data-icon="' + icon + '"></i> ' +
+    link.attr('data-children'))
+}
+
 // Project list data retrieval and updating
 $(document).ready(function () {
   let table = $('#sodar-pr-project-list-table')
   if (!table.length) return // Skip if project list is disabled for view
 
-  let listUrl = table.attr('data-list-url')
   let parent = table.attr('data-parent')
   let starredDefault = table.attr('data-starred-default')
   let customColAlign = []
@@ -152,244 +164,400 @@ $(document).ready(function () {
     customColAlign.push($(this).attr('data-align'))
   })
   let colCount = customColAlign.length + 2
-  let allUuids = []
-  let projectUuids = []
   let tableBody = $('#sodar-pr-project-list-table tbody')
+  const catDelim = ' / '
+  // Categories are loaded one level at a time until the full list is needed
+  let treeMode = true
+  let expanded = new Set()
+  let fullListRequest = null
+  let userData = null
 
-  $.ajax({
-    url: listUrl,
-    method: 'GET',
-  }).done(function (data) {
-    $('#sodar-pr-project-list-loading').remove()
-    // If there are no results, display message row
-    if (data.projects.length === 0) {
-      // let tableBody = $('#sodar-pr-project-list-table tbody')
-      tableBody.append($('<tr>')
-        .attr('id', 'sodar-pr-project-list-message')
-        .append($('<td>')
-          .attr('colspan', colCount)
-          .attr('class', 'text-center text-muted font-italic')
-          .text(data['messages']['no_projects'])
-        )
-      )
-      return
+  // Return list URL for entries one level under a category
+  let getListUrl = function (listParent, depth) {
+    let params = {}
+    if (listParent) params['parent'] = listParent
+    if (depth) params['depth'] = depth
+    let url = table.attr('data-list-url').split('?')[0]
+    if ($.isEmptyObject(params)) return url
+    return url + '?' + $.param(params)
+  }
+
+  // Build table row for project list entry
+  let buildRow = function (p, titlePrefix, ancestors) {
+    let icon
+    let projectType
+    if (p['type'] === 'CATEGORY') {
+      icon = 'rhombus-split'
+      projectType = 'Category'
+    } else {
+      icon = 'cube'
+      projectType = 'Project'
     }
+    let fullTitle = titlePrefix + p['full_title']
 
-    // Display rows
-    let projectCount = data['projects'].length
-    let starredCount = 0
-    const catDelim = ' / '
-
-    for (let i = 0; i < projectCount; i++) {
-      let p = data['projects'][i]
-      let icon
-      let projectType
-      if (p['type'] === 'CATEGORY') {
-        icon = 'rhombus-split'
-        projectType = 'Category'
-      } else {
-        icon = 'cube'
-        projectType = 'Project'
-      }
+    // Row
+    let row = $('<tr>')
+      .attr('class',
+        'sodar-pr-project-list-item sodar-pr-project-list-item-' +
+        p['type'].toLowerCase())
+      .attr('id', 'sodar-pr-project-list-item-' + p['uuid'])
+      .attr('data-uuid', p['uuid'])
+      .attr('data-full-title', fullTitle)
+      .attr('data-starred', +p['starred'])
+      .attr('data-ancestors', ancestors.join(' '))
 
-      // Row
-      tableBody.append($('<tr>')
-        .attr('class',
-          'sodar-pr-project-list-item sodar-pr-project-list-item-' +
-          p['type'].toLowerCase())
-        .attr('id', 'sodar-pr-project-list-item-' + p['uuid'])
-        .attr('data-uuid', p['uuid'])
-        .attr('data-full-title', p['full_title'])
-        .attr('data-starred', +p['starred'])
+    // Title column
+    let tElem = '<a>'
+    let tHref = '/project/' + p['uuid']
+    let tClass = 'sodar-pr-project-link'
+    if (!p['access']) {
+      tElem = '<span>'
+      tHref = ''
+      tClass = 'text-muted sodar-pr-project-link-disabled'
+    }
+    // Highlight project title in category structure
+    let titleHtml = ''
+    if (userData['highlight'] &&
+      projectType.toUpperCase() === 'PROJECT' &&
+      (parent || fullTitle.includes(catDelim))) {
+      let titleSplit = fullTitle.split(catDelim)
+      let splitLen = titleSplit.length
+      titleHtml = titleSplit.slice(0, splitLen - 1).join(catDelim)
+      if (titleHtml.length) titleHtml += catDelim
+      titleHtml += '<strong>' + titleSplit[splitLen - 1] + '</strong>'
+    } else titleHtml = fullTitle
+    let titleContainer = $('<div>')
+      .attr('class', 'sodar-pr-project-title-container')
+      .append($('<i>')
+        .attr('class', 'iconify mr-1')
+        .attr('data-icon', 'mdi:' + icon)
+        .attr('title', projectType)
       )
-      if (p['starred']) starredCount += 1
-      let row = tableBody.find('tr:last')
-
-      // Title column
-      let tElem = '<a>'
-      let tHref = '/project/' + p['uuid']
-      let tClass = 'sodar-pr-project-link'
-      if (!p['access']) {
-        tElem = '<span>'
-        tHref = ''
-        tClass = 'text-muted sodar-pr-project-link-disabled'
-      }
-      // Highlight project title in category structure
-      let titleHtml = ''
-      if (data['user']['highlight'] &&
-        projectType.toUpperCase() === 'PROJECT' &&
-        (parent || p['full_title'].includes(catDelim))) {
-        let titleSplit = p['full_title'].split(catDelim)
-        let splitLen = titleSplit.length
-        titleHtml = titleSplit.slice(0, splitLen - 1).join(catDelim)
-        if (titleHtml.length) titleHtml += catDelim
-        titleHtml += '<strong>' + titleSplit[splitLen - 1] + '</strong>'
-      } else titleHtml = p['full_title']
-      row.append($('<td>')
-        .attr('class', 'sodar-pr-project-list-title-td')
-        .append($('<div>')
-          .attr('class', 'sodar-pr-project-title-container')
-          .append($('<i>')
-            .attr('class', 'iconify mr-1')
-            .attr('data-icon', 'mdi:' + icon)
-            .attr('title', projectType)
-          )
-          .append($('<span>')
-            .attr('class', 'sodar-pr-project-title')
-            .append($(tElem)
-              .attr('class', tClass)
-              .attr('href', tHref)
-              .html(titleHtml)
-            )
-          )
+      .append($('<span>')
+        .attr('class', 'sodar-pr-project-title')
+        .append($(tElem)
+          .attr('class', tClass)
+          .attr('href', tHref)
+          .html(titleHtml)
         )
       )
+    row.append($('<td>')
+      .attr('class', 'sodar-pr-project-list-title-td')
+      .append(titleContainer)
+    )
 
-      // Add icons to title columns
-      let titleSpan = row.find($('span.sodar-pr-project-title'))
-      // Remote icon
-      if (p['remote']) {
-        let textClass
-        if (p['revoked']) textClass = 'text-danger'
-        else textClass = 'text-info'
-        titleSpan.append($('<i>')
-          .attr('class',
-            'iconify text-info ml-1 sodar-pr-remote-project-icon ' +
-            textClass)
-          .attr('data-icon', 'mdi:cloud')
-          .attr('title', 'Remote synchronized from source site')
-        )
-      }
-      // Public icon
-      if (p['type'] === 'PROJECT' && p['public_access']) {
-        titleSpan.append($('<i>')
-          .attr('class',
-            'iconify text-info ml-1 sodar-pr-project-public')
-          .attr('data-icon', 'mdi:earth')
-          .attr('title', 'Public read-only access')
-        )
-      } else if (p['type'] === 'CATEGORY' && p['public_stats']) {
-        titleSpan.append($('<i>')
-          .attr('class',
-            'iconify text-info ml-1 sodar-pr-project-stats')
-          .attr('data-icon', 'mdi:chart-box')
-          .attr('title', 'Public statistics displayed')
-        )
-      }
-      // Archived icon
-      if (p['type'] === 'PROJECT' && p['archive']) {
-        titleSpan.append($('<i>')
-          .attr('class',
-            'iconify text-info ml-1 sodar-pr-project-archive')
-          .attr('data-icon', 'mdi:archive')
-          .attr('title', 'Archived')
-        )
-      }
-      // Starred icon
-      if (p['starred']) {
-        titleSpan.append($('<i>')
-          .attr('class',
-            'iconify text-warning ml-1 sodar-pr-project-starred')
-          .attr('data-icon', 'mdi:star')
-        )
-      }
-      // Blocked icon
-      if (p['blocked']) {
-        titleSpan.append($('<i>')
-          .attr('class',
-            'iconify text-danger ml-1 sodar-pr-project-blocked')
-          .attr('data-icon', 'mdi:cancel')
-          .attr('title',
-            'Access temporarily blocked by administrators')
-        )
-      }
-      // Finder link
-      if (!p['blocked'] && !p['access'] && p['finder_url']) {
-        titleSpan.append($('<a>')
-          .attr('href', p['finder_url'])
-          .attr('class', 'sodar-pr-project-findable')
-          .attr('title', 'Findable project: Request access from ' +
-            'category owner or delegate')
-          .append($('<i>')
-            .attr('class', 'iconify ml-1')
-            .attr('data-icon', 'mdi:account-supervisor')
+    // Add icons to title columns
+    let titleSpan = row.find($('span.sodar-pr-project-title'))
+    // Remote icon
+    if (p['remote']) {
+      let textClass
+      if (p['revoked']) textClass = 'text-danger'
+      else textClass = 'text-info'
+      titleSpan.append($('<i>')
+        .attr('class',
+          'iconify text-info ml-1 sodar-pr-remote-project-icon ' +
+          textClass)
+        .attr('data-icon', 'mdi:cloud')
+        .attr('title', 'Remote synchronized from source site')
+      )
+    }
+    // Public icon
+    if (p['type'] === 'PROJECT' && p['public_access']) {
+      titleSpan.append($('<i>')
+        .attr('class',
+          'iconify text-info ml-1 sodar-pr-project-public')
+        .attr('data-icon', 'mdi:earth')
+        .attr('title', 'Public read-only access')
+      )
+    } else if (p['type'] === 'CATEGORY' && p['public_stats']) {
+      titleSpan.append($('<i>')
+        .attr('class',
+          'iconify text-info ml-1 sodar-pr-project-stats')
+        .attr('data-icon', 'mdi:chart-box')
+        .attr('title', 'Public statistics displayed')
+      )
+    }
+    // Archived icon
+    if (p['type'] === 'PROJECT' && p['archive']) {
+      titleSpan.append($('<i>')
+        .attr('class',
+          'iconify text-info ml-1 sodar-pr-project-archive')
+        .attr('data-icon', 'mdi:archive')
+        .attr('title', 'Archived')
+      )
+    }
+    // Starred icon
+    if (p['starred']) {
+      titleSpan.append($('<i>')
+        .attr('class',
+          'iconify text-warning ml-1 sodar-pr-project-starred')
+        .attr('data-icon', 'mdi:star')
+      )
+    }
+    // Blocked icon
+    if (p['blocked']) {
+      titleSpan.append($('<i>')
+        .attr('class',
+          'iconify text-danger ml-1 sodar-pr-project-blocked')
+        .attr('data-icon', 'mdi:cancel')
+        .attr('title',
+          'Access temporarily blocked by administrators')
+      )
+    }
+    // Finder link
+    if (!p['blocked'] && !p['access'] && p['finder_url']) {
+      titleSpan.append($('<a>')
+        .attr('href', p['finder_url'])
+        .attr('class', 'sodar-pr-project-findable')
+        .attr('title', 'Findable project: Request access from ' +
+          'category owner or delegate')
+        .append($('<i>')
+          .attr('class', 'iconify ml-1')
+          .attr('data-icon', 'mdi:account-supervisor')
 
-          )
         )
-      }
+      )
+    }
+    // Expand link for categories with children not yet loaded
+    if (treeMode && p['children']) {
+      let link = $('<a>')
+        .attr('class', 'sodar-pr-project-list-expand text-muted ml-2')
+        .attr('href', '#')
+        .attr('data-children', p['children'])
+      setExpandLink(link, false)
+      titleContainer.append(link)
+    }
 
-      // Fill project custom columns with spinners
-      for (let j = 1; j < colCount - 1; j++) {
-        if (p['type'] === 'PROJECT' && p['access']) {
-          row.append($('<td>')
-            .attr('class',
-              'sodar-pr-project-list-custom text-' +
-              customColAlign[j - 1])
-            .append($('<i>')
-              .attr('class', 'iconify spin text-muted ' +
-                'sodar-pr-project-list-load-icon')
-              .attr('data-icon', 'mdi:loading')
-            )
-          )
-        } else row.append($('<td>'))
-      }
-      // Add user role column
-      if (!data['user']['superuser'] && p['access']) {
+    // Fill project custom columns with spinners
+    for (let j = 1; j < colCount - 1; j++) {
+      if (p['type'] === 'PROJECT' && p['access']) {
         row.append($('<td>')
-          .attr('class', 'sodar-pr-project-list-role')
+          .attr('class',
+            'sodar-pr-project-list-custom text-' +
+            customColAlign[j - 1])
           .append($('<i>')
             .attr('class', 'iconify spin text-muted ' +
               'sodar-pr-project-list-load-icon')
             .attr('data-icon', 'mdi:loading')
           )
         )
-      } else if (!data['user']['superuser']) {
-        row.append($('<td>')
-          .attr('class', 'sodar-pr-project-list-role text-muted')
-          .html('N/A')
+      } else row.append($('<td>'))
+    }
+    // Add user role column
+    if (!userData['superuser'] && p['access']) {
+      row.append($('<td>')
+        .attr('class', 'sodar-pr-project-list-role')
+        .append($('<i>')
+          .attr('class', 'iconify spin text-muted ' +
+            'sodar-pr-project-list-load-icon')
+          .attr('data-icon', 'mdi:loading')
         )
-      }
+      )
+    } else if (!userData['superuser']) {
+      row.append($('<td>')
+        .attr('class', 'sodar-pr-project-list-role text-muted')
+        .html('N/A')
+      )
+    }
+    return row
+  }
 
+  // Insert rows for list entries after a row or at the end of the table
+  let insertRows = function (projects, prevRow, titlePrefix, ancestors) {
+    let ret = {allUuids: [], projectUuids: []}
+    for (let i = 0; i < projects.length; i++) {
+      let p = projects[i]
+      let row = buildRow(p, titlePrefix, ancestors)
+      if (prevRow) prevRow.after(row)
+      else tableBody.append(row)
+      prevRow = row
       // Add categories and projects with access for further queries
       if (p['access']) {
-        allUuids.push(p['uuid'])
-        if (p['type'] === 'PROJECT') {
-          projectUuids.push(p['uuid'])
-        }
+        ret.allUuids.push(p['uuid'])
+        if (p['type'] === 'PROJECT') ret.projectUuids.push(p['uuid'])
       }
     }
+    return ret
+  }
 
-    // Enable starred button and filter
-    let starringEnabled = false
-    if (starredCount > 0 && starredCount < projectCount) {
-      $('#sodar-pr-project-list-link-star').prop('disabled', false)
-      starringEnabled = true
+  // Insert rows for children of a category row
+  let insertChildRows = function (row, projects) {
+    let uuid = row.attr('data-uuid')
+    let ancestors = []
+    if (row.attr('data-ancestors')) {
+      ancestors = row.attr('data-ancestors').split(' ')
     }
-    if (projectCount > 1) {
-      $('#sodar-pr-project-list-filter').prop('disabled', false)
+    ancestors.push(uuid)
+    row.attr('data-loaded', '1')
+    expanded.add(uuid)
+    setExpandLink(row.find('.sodar-pr-project-list-expand'), true)
+    return insertRows(
+      projects, row, row.attr('data-full-title') + catDelim, ancestors)
+  }
+
+  // Update custom and role columns for inserted rows
+  let updateColumns = function (uuids) {
+    if (uuids.projectUuids.length > 0) {
+      updateCustomColumns(uuids.projectUuids)
     }
+    if (uuids.allUuids.length > 0 && !userData['superuser']) {
+      updateRoleColumn(uuids.allUuids)
+    }
+  }
 
-    // Enable datatables
-    $.fn.dataTable.ext.classes.sPageButton =
-      'btn sodar-list-btn ml-1 sodar-paginate-button btn-outline-light ' +
-      'text-primary'
-    let dt = $('#sodar-pr-project-list-table').DataTable({
+  // Hide pagination if only one page
+  let updatePaging = function (dt) {
+    if (dt.page.info().pages <= 1) {
+      $('.dt-paging').hide()
+    } else {
+      $('.dt-paging').show()
+    }
+  }
+
+  // Enable datatables
+  let initTable = function (pageLength, page) {
+    let dt = table.DataTable({
       ordering: false,
       scrollX: false,
       autoWidth: false,
       paging: true,
       pagingType: 'full_numbers',
-      pageLength: window.projectListPagination,
+      pageLength: pageLength,
       lengthChange: true,
       scrollCollapse: true,
       info: false,
       language: {paginate: sodarDataTablesPaginate},
       dom: 'tp'
     })
-    // Hide pagination if only one page
-    if (dt.page.info().pages === 1) {
-      $('.dt-paging').hide()
+    if (page) dt.page(page).draw(false)
+    updatePaging(dt)
+    return dt
+  }
+
+  // Reinitialize datatables after modifying rows in the table body
+  let modifyRows = function (func) {
+    let dt = table.DataTable()
+    let pageLength = dt.page.len()
+    let page = dt.page()
+    dt.destroy()
+    let ret = func()
+    initTable(pageLength, page)
+    return ret
+  }
+
+  // Return true if all categories in the list have been loaded
+  let allLoaded = function () {
+    return table.DataTable().rows().nodes().to$().filter(function () {
+      return $(this).find('.sodar-pr-project-list-expand').length > 0 &&
+        $(this).attr('data-loaded') !== '1'
+    }).length === 0
+  }
+
+  // Switch to flat list of all entries, call func once it is available
+  let loadFullList = function (func) {
+    if (!fullListRequest && allLoaded()) {
+      // Everything has already been loaded, no need to query again
+      treeMode = false
+      table.DataTable().rows().nodes().to$()
+        .find('.sodar-pr-project-list-expand').remove()
+      fullListRequest = $.Deferred().resolve()
+    } else if (!fullListRequest) {
+      fullListRequest = $.ajax({
+        url: getListUrl(parent, 0),
+        method: 'GET',
+      }).done(function (data) {
+        treeMode = false
+        let uuids = modifyRows(function () {
+          tableBody.empty()
+          return insertRows(data['projects'], null, '', [])
+        })
+        updateColumns(uuids)
+      })
+    }
+    fullListRequest.done(func)
+  }
+
+  // Expand or collapse category
+  tableBody.on('click', '.sodar-pr-project-list-expand', function (e) {
+    e.preventDefault()
+    let link = $(this)
+    let row = link.closest('tr')
+    let uuid = row.attr('data-uuid')
+    if (link.attr('data-expanded') === '1') {
+      expanded.delete(uuid)
+      setExpandLink(link, false)
+      table.DataTable().draw(false)
+    } else if (row.attr('data-loaded') === '1') {
+      expanded.add(uuid)
+      setExpandLink(link, true)
+      table.DataTable().draw(false)
+    } else if (link.attr('data-loading') !== '1') {
+      link.attr('data-loading', '1')
+      $.ajax({
+        url: getListUrl(uuid, 1),
+        method: 'GET',
+      }).done(function (data) {
+        let uuids = modifyRows(function () {
+          return insertChildRows(row, data['projects'])
+        })
+        updateColumns(uuids)
+      }).always(function () {
+        link.removeAttr('data-loading')
+      })
     }
+  })
+
+  // Render initial list level
+  let renderList = function (data, childData) {
+    $('#sodar-pr-project-list-loading').remove()
+    // If there are no results, display message row
+    if (data.projects.length === 0) {
+      tableBody.append($('<tr>')
+        .attr('id', 'sodar-pr-project-list-message')
+        .append($('<td>')
+          .attr('colspan', colCount)
+          .attr('class', 'text-center text-muted font-italic')
+          .text(data['messages']['no_projects'])
+        )
+      )
+      return
+    }
+
+    // Display rows
+    let uuids = insertRows(data['projects'], null, '', [])
+    if (childData) {
+      let childUuids = insertChildRows(
+        tableBody.find('tr:first'), childData['projects'])
+      uuids.allUuids = uuids.allUuids.concat(childUuids.allUuids)
+      uuids.projectUuids = uuids.projectUuids.concat(childUuids.projectUuids)
+    }
+
+    // Enable starred button and filter
+    let starredCount = data['starred_count']
+    let totalCount = data['total_count']
+    let starringEnabled = false
+    if (starredCount > 0 && starredCount < totalCount) {
+      $('#sodar-pr-project-list-link-star').prop('disabled', false)
+      starringEnabled = true
+    }
+    if (totalCount > 1) {
+      $('#sodar-pr-project-list-filter').prop('disabled', false)
+    }
+
+    $.fn.dataTable.ext.classes.sPageButton =
+      'btn sodar-list-btn ml-1 sodar-paginate-button btn-outline-light ' +
+      'text-primary'
+    initTable(window.projectListPagination, 0)
+    // Hide children of collapsed categories
+    $.fn.dataTable.ext.search.push(
+      function (settings, data, dataIndex, rowObj, counter) {
+        if (!treeMode) return true
+        let api = new $.fn.dataTable.Api(
+          '#sodar-pr-project-list-table')
+        let ancestors = $(api.row(dataIndex).node()).attr('data-ancestors')
+        if (!ancestors) return true
+        return ancestors.split(' ').every(a => expanded.has(a))
+      })
     // Add star filter
     $.fn.dataTable.ext.search.push(
       function (settings, data, dataIndex, rowObj, counter) {
@@ -407,12 +575,7 @@ $(document).ready(function () {
         '#sodar-pr-project-list').find('table').DataTable()
       let value = parseInt($(this).val())
       dt.page.len(value).draw()
-      // Update pagination
-      if (dt.page.info().pages === 1) {
-        $('.dt-paging').hide()
-      } else {
-        $('.dt-paging').show()
-      }
+      updatePaging(dt)
       // Update user setting
       $.ajax({
         url: 'project/api/settings/set/user',
@@ -429,19 +592,28 @@ $(document).ready(function () {
 
     // Toggle star filter
     if (starredDefault === '1' && starringEnabled) {
-      toggleStarring(true)
+      loadFullList(function () {
+        toggleStarring(true)
+      })
     }
+    updateColumns(uuids)
+  }
 
-    if (projectUuids.length > 0) {
-      // Update custom columns
-      updateCustomColumns(projectUuids)
-    }
-    if (allUuids.length > 0) {
-      // Update role column
-      if (!data['user']['superuser']) {
-        updateRoleColumn(allUuids)
-      }
-    }
+  // Load first level, expand it right away if it only contains one category
+  $.ajax({
+    url: getListUrl(parent, 1),
+    method: 'GET',
+  }).done(function (data) {
+    userData = data['user']
+    let projects = data['projects']
+    if (projects.length === 1 && projects[0]['children']) {
+      $.ajax({
+        url: getListUrl(projects[0]['uuid'], 1),
+        method: 'GET',
+      }).done(function (childData) {
+        renderList(data, childData)
+      })
+    } else renderList(data, null)
   })
 
   // Filter input
@@ -453,20 +625,22 @@ $(document).ready(function () {
           '<i class="iconify" data-icon="mdi:star-outline"></i> Starred'
         )
     }
-    let dt = $(this).closest(
-      '#sodar-pr-project-list').find('table').dataTable().api()
-    let v = $(this).val()
-    dt.column(0).search(v) // Limit filter to title column
-    dt.draw()
+    // Filter the full list instead of levels loaded so far
+    loadFullList(function () {
+      let dt = table.DataTable()
+      let v = $('#sodar-pr-project-list-filter').val()
+      dt.column(0).search(v) // Limit filter to title column
+      dt.draw()
+    })
   })
 
   // Filter by starred
   $('#sodar-pr-project-list-link-star').click(function () {
     // Clear filter and toggle starring
     $('#sodar-pr-project-list-link-star').value = ''
-    let dt = $(this).closest(
-      '#sodar-pr-project-list').find('table').dataTable().api()
-    dt.column(0).search('').draw()
-    toggleStarring(false)
+    loadFullList(function () {
+      table.DataTable().column(0).search('').draw()
+      toggleStarring(false)
+    })
   })
 })
@@ -2,11 +2,13 @@
 
 import json
 
+from django.core.cache import cache
 from django.test import override_settings
 
 from test_plus.test import TestCase
 
 from projectroles.app_settings import AppSettingAPI
+from projectroles.cache import start_app_setting_memo, end_app_setting_memo
 from projectroles.models import Role, AppSetting, SODAR_CONSTANTS
 from projectroles.plugins import PluginAppSettingDef, PluginAPI
 from projectroles.tests.test_models import (
@@ -489,6 +491,56 @@ class TestAppSettingAPI(
                 project=self.project,  # No user
             )
 
+    def test_get_many(self):
+        """Test get_many()"""
+        s_keys = [
+            (EXAMPLE_APP_NAME, 'project_str_setting'),
+            (EXAMPLE_APP_NAME, 'project_int_setting'),
+            (EXAMPLE_APP_NAME, 'project_json_setting'),
+            (APP_NAME, 'ip_restrict'),
+        ]
+        vals = app_settings.get_many(s_keys, project=self.project)
+        self.assertEqual(len(vals), len(s_keys))
+        for k in s_keys:
+            self.assertEqual(
+                vals[k],
+                app_settings.get(k[0], k[1], project=self.project),
+            )
+
+    def test_get_many_queries(self):
+        """Test get_many() database queries"""
+        s_keys = [
+            (EXAMPLE_APP_NAME, 'project_str_setting'),
+            (EXAMPLE_APP_NAME, 'project_int_setting'),
+            (EXAMPLE_APP_NAME, 'project_bool_setting'),
+            (EXAMPLE_APP_NAME, 'project_json_setting'),
+        ]
+        with self.assertNumQueries(1):
+            vals = app_settings.get_many(
+                s_keys, project=self.project, validate=False
+            )
+        self.assertEqual(vals[s_keys[0]], self.project_str_setting['value'])
+        self.assertEqual(vals[s_keys[1]], self.project_int_setting['value'])
+        self.assertEqual(vals[s_keys[2]], self.project_bool_settings['value'])
+        self.assertEqual(vals[s_keys[3]], self.project_json_setting['value'])
+
+    def test_get_many_post_safe(self):
+        """Test get_many() with post_safe=True"""
+        k = (EXAMPLE_APP_NAME, 'project_json_setting')
+        vals = app_settings.get_many([k], project=self.project, post_safe=True)
+        self.assertIsInstance(vals[k], str)
+        self.assertEqual(
+            json.loads(vals[k]), self.project_json_setting['value']
+        )
+
+    def test_get_many_invalid_args(self):
+        """Test get_many() with invalid args"""
+        with self.assertRaises(ValueError):
+            app_settings.get_many(
+                [(APP_NAME, 'project_star')],
+                project=self.project,  # No user
+            )
+
     def test_is_set_no_object(self):
         """Test is_set() with no setting object set"""
         n = 'project_star'
@@ -751,6 +803,61 @@ class TestAppSettingAPI(
             app_settings.set(APP_NAME, n, False, user=self.user)
         self.assertEqual(AppSetting.objects.filter(name=n, value=v).count(), 0)
 
+    def test_set_many(self):
+        """Test set_many()"""
+        self.assertIsNone(
+            AppSetting.objects.filter(
+                app_plugin=None, project=self.project, name='ip_restrict'
+            ).first()
+        )
+        values = {
+            (EXAMPLE_APP_NAME, 'project_str_setting'): 'updated',
+            (EXAMPLE_APP_NAME, 'project_int_setting'): 170,
+            (EXAMPLE_APP_NAME, 'project_json_setting'): {'key': 'value'},
+            (APP_NAME, 'ip_restrict'): True,
+        }
+        ret = app_settings.set_many(values, project=self.project)
+        self.assertEqual(sorted(ret), sorted(values.keys()))
+        for k, v in values.items():
+            self.assertEqual(app_settings.get(k[0], k[1], self.project), v)
+        setting = AppSetting.objects.get(
+            app_plugin=None, project=self.project, name='ip_restrict'
+        )
+        self.assertEqual(setting.value, '1')
+
+    def test_set_many_unchanged(self):
+        """Test set_many() with unchanged values"""
+        values = {
+            (EXAMPLE_APP_NAME, 'project_str_setting'): 'test',
+            (EXAMPLE_APP_NAME, 'project_int_setting'): 0,
+        }
+        ret = app_settings.set_many(values, project=self.project)
+        self.assertEqual(ret, [])
+
+    def test_set_many_invalid(self):
+        """Test set_many() with invalid value"""
+        values = {
+            (EXAMPLE_APP_NAME, 'project_str_setting'): 'updated',
+            (EXAMPLE_APP_NAME, 'project_int_setting'): 'Nan',
+        }
+        with self.assertRaises(ValueError):
+            app_settings.set_many(values, project=self.project)
+        self.assertEqual(
+            app_settings.get(
+                EXAMPLE_APP_NAME, 'project_str_setting', self.project
+            ),
+            'test',
+        )
+
+    def test_set_many_memo(self):
+        """Test set_many() with active app setting memo"""
+        token = start_app_setting_memo()
+        k = (EXAMPLE_APP_NAME, 'project_str_setting')
+        self.assertEqual(app_settings.get(k[0], k[1], self.project), 'test')
+        app_settings.set_many({k: 'updated'}, project=self.project)
+        self.assertEqual(app_settings.get(k[0], k[1], self.project), 'updated')
+        end_app_setting_memo(token)
+
     def test_validate_boolean(self):
         """Test validate() with type BOOLEAN"""
         for setting in self.settings:
@@ -806,6 +913,7 @@ class TestAppSettingAPI(
             'options': [],
             'project_types': [PROJECT_TYPE_PROJECT],
             'widget_attrs': {},
+            'cache_default': False,
         }
         s_def = app_settings.get_definition(
             'project_str_setting', plugin=app_plugin
@@ -828,6 +936,7 @@ class TestAppSettingAPI(
             'options': [],
             'project_types': [PROJECT_TYPE_PROJECT],
             'widget_attrs': {},
+            'cache_default': False,
         }
         s_def = app_settings.get_definition(
             'project_str_setting', plugin_name=EXAMPLE_APP_NAME
@@ -849,6 +958,7 @@ class TestAppSettingAPI(
             'options': [],
             'project_types': [PROJECT_TYPE_PROJECT],
             'widget_attrs': {},
+            'cache_default': False,
         }
         s_def = app_settings.get_definition(
             'user_str_setting', plugin_name=EXAMPLE_APP_NAME
@@ -954,6 +1064,44 @@ class TestAppSettingAPI(
                 'Ri4thai8aez5ooRa', plugin_name=EXAMPLE_APP_NAME
             )
 
+    def test_get_registry(self):
+        """Test get_registry()"""
+        registry = app_settings.get_registry()
+        self.assertIs(registry, app_settings.get_registry())
+        self.assertEqual(
+            sorted(registry.by_plugin.keys()),
+            sorted(app_settings.get_all_defs().keys()),
+        )
+        self.assertIn(EXAMPLE_APP_NAME, registry.by_plugin)
+        for scope, scope_defs in registry.by_scope.items():
+            for s_defs in scope_defs.values():
+                for s_def in s_defs.values():
+                    self.assertEqual(s_def.scope, scope)
+        self.assertEqual(registry.duplicates, ())
+
+    def test_get_registry_immutable(self):
+        """Test modifying registry returned by get_registry()"""
+        registry = app_settings.get_registry()
+        with self.assertRaises(AttributeError):
+            registry.by_plugin = {}
+        with self.assertRaises(TypeError):
+            registry.by_plugin[APP_NAME]['ip_restrict'] = None
+
+    def test_get_registry_override(self):
+        """Test get_registry() with PROJECTROLES_APP_SETTINGS_TEST"""
+        s_def = PluginAppSettingDef(
+            name='test_setting',
+            scope=APP_SETTING_SCOPE_PROJECT,
+            type=APP_SETTING_TYPE_BOOLEAN,
+            default=False,
+        )
+        with override_settings(PROJECTROLES_APP_SETTINGS_TEST=[s_def]):
+            self.assertEqual(
+                list(app_settings.get_projectroles_defs().keys()),
+                ['test_setting'],
+            )
+        self.assertNotIn('test_setting', app_settings.get_projectroles_defs())
+
     def test_get_defaults_project(self):
         """Test get_defaults() with PROJECT scope"""
         prefix = f'settings.{EXAMPLE_APP_NAME}.'
@@ -1268,3 +1416,76 @@ class TestAppSettingAPI(
         self.assertEqual(app_settings.compare_value(obj, vf), False)
         self.assertEqual(app_settings.compare_value(obj, None), True)
         self.assertEqual(app_settings.compare_value(obj, ''), True)
+
+
+class TestAppSettingCacheDefault(ProjectMixin, TestCase):
+    """Tests for AppSettingAPI callable defaults with cache_default=True"""
+
+    def _get_default(self, project=None, user=None):
+        self.default_calls += 1
+        return str(project.sodar_uuid)
+
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project = self.make_project(
+                title='TestProject', type=PROJECT_TYPE_PROJECT, parent=None
+            )
+        self.default_calls = 0
+        s_defs = [
+            PluginAppSettingDef(
+                name='callable_setting',
+                scope=APP_SETTING_SCOPE_PROJECT,
+                type=APP_SETTING_TYPE_STRING,
+                default=self._get_default,
+                cache_default=True,
+            )
+        ]
+        override = override_settings(PROJECTROLES_APP_SETTINGS_TEST=s_defs)
+        # Commit invalidation from setting change to enable the shared cache
+        with self.captureOnCommitCallbacks(execute=True):
+            override.enable()
+        self.addCleanup(override.disable)
+
+    def test_get_default_memo(self):
+        """Test get_default() with request scoped memo"""
+        token = start_app_setting_memo()
+        for _ in range(2):
+            self.assertEqual(
+                app_settings.get_default(
+                    APP_NAME, 'callable_setting', project=self.project
+                ),
+                str(self.project.sodar_uuid),
+            )
+        end_app_setting_memo(token)
+        self.assertEqual(self.default_calls, 1)
+
+    @override_settings(PROJECTROLES_APP_SETTING_CACHE_TIMEOUT=0)
+    def test_get_default_no_cache(self):
+        """Test get_default() with shared cache disabled and no memo"""
+        for _ in range(2):
+            app_settings.get_default(
+                APP_NAME, 'callable_setting', project=self.project
+            )
+        self.assertEqual(self.default_calls, 2)
+
+    def test_get_default_shared(self):
+        """Test get_default() with shared cache"""
+        for _ in range(2):
+            app_settings.get_default(
+                APP_NAME, 'callable_setting', project=self.project
+            )
+        self.assertEqual(self.default_calls, 1)
+
+    def test_get_default_shared_project_update(self):
+        """Test get_default() with shared cache after project update"""
+        app_settings.get_default(
+            APP_NAME, 'callable_setting', project=self.project
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.description = 'Updated'
+            self.project.save()
+        app_settings.get_default(
+            APP_NAME, 'callable_setting', project=self.project
+        )
+        self.assertEqual(self.default_calls, 2)
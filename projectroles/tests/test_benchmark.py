@@ -0,0 +1,276 @@
+"""
+Benchmarks for performance critical operations in the projectroles app.
+
+These tests create large amounts of data and are skipped by default. To run
+them, set PROJECTROLES_TEST_BENCHMARK=1 in your environment.
+"""
+
+import logging
+import time
+
+from ipaddress import ip_address, ip_network
+from unittest import skipUnless
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from test_plus.test import TestCase
+
+from projectroles.ip_access import IPAllowList
+from projectroles.models import (
+    Project,
+    ProjectAncestor,
+    SODAR_CONSTANTS,
+    CAT_DELIMITER,
+)
+from projectroles.tests.test_models import (
+    ProjectMixin,
+    RoleMixin,
+    RoleAssignmentMixin,
+)
+from projectroles.views_ajax import ProjectListAjaxView
+
+
+logger = logging.getLogger(__name__)
+
+
+# SODAR constants
+PROJECT_TYPE_CATEGORY = SODAR_CONSTANTS['PROJECT_TYPE_CATEGORY']
+PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
+
+# Local constants
+BENCHMARK_SKIP_MSG = 'PROJECTROLES_TEST_BENCHMARK not set'
+BENCHMARK_MSG = '{name}: {time:.3f}s, {queries} queries'
+TREE_CATEGORY_COUNT = 100
+TREE_PROJECT_COUNT = 99  # Per category
+MOVE_MAX_QUERIES = 20
+LIST_ROLE_CATEGORY_COUNT = 10
+LIST_MAX_QUERIES = 1
+IP_NETWORK_COUNT = 10000
+IP_LOOKUP_COUNT = 10000
+
+
+class BenchmarkMixin:
+    """Helpers for creating benchmark data and measuring operations"""
+
+    @classmethod
+    def make_project_tree(
+        cls, parent: Project, category_count: int, project_count: int
+    ) -> list[Project]:
+        """
+        Create a two-level subtree of categories and projects under parent in
+        bulk, bypassing Project.save().
+
+        :param parent: Project object of type CATEGORY
+        :param category_count: Number of categories to create (int)
+        :param project_count: Number of projects per category (int)
+        :return: List of created Project objects
+        """
+        parent_links = list(
+            ProjectAncestor.objects.filter(descendant=parent).values_list(
+                'ancestor', 'depth'
+            )
+        )
+        categories = Project.objects.bulk_create(
+            [
+                Project(
+                    title=f'BenchCategory{i}',
+                    type=PROJECT_TYPE_CATEGORY,
+                    parent=parent,
+                    full_title=f'{parent.full_title}{CAT_DELIMITER}'
+                    f'BenchCategory{i}',
+                )
+                for i in range(category_count)
+            ]
+        )
+        projects = Project.objects.bulk_create(
+            [
+                Project(
+                    title=f'BenchProject{j}',
+                    type=PROJECT_TYPE_PROJECT,
+                    parent=c,
+                    full_title=f'{c.full_title}{CAT_DELIMITER}BenchProject{j}',
+                )
+                for c in categories
+                for j in range(project_count)
+            ]
+        )
+        links = []
+        for p in categories + projects:
+            links.append(ProjectAncestor(ancestor=p, descendant=p, depth=0))
+            if p.parent != parent:
+                links.append(
+                    ProjectAncestor(ancestor=p.parent, descendant=p, depth=1)
+                )
+            depth = 1 if p.parent == parent else 2
+            for a_pk, a_depth in parent_links:
+                links.append(
+                    ProjectAncestor(
+                        ancestor_id=a_pk,
+                        descendant=p,
+                        depth=a_depth + depth,
+                    )
+                )
+        ProjectAncestor.objects.bulk_create(links, batch_size=10000)
+        return categories + projects
+
+    def run_benchmark(self, name: str, func: callable) -> int:
+        """
+        Run and time function, log results and return the number of queries.
+
+        :param name: Benchmark name (string)
+        :param func: Function to call
+        :return: Number of executed queries (int)
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        logger.info(
+            BENCHMARK_MSG.format(
+                name=name, time=elapsed, queries=len(ctx.captured_queries)
+            )
+        )
+        return len(ctx.captured_queries)
+
+
+@skipUnless(
+    getattr(settings, 'PROJECTROLES_TEST_BENCHMARK', False), BENCHMARK_SKIP_MSG
+)
+class TestProjectSaveBenchmark(ProjectMixin, BenchmarkMixin, TestCase):
+    """Benchmarks for Project.save() with large subtrees"""
+
+    def setUp(self):
+        self.category = self.make_project(
+            'TopCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.new_category = self.make_project(
+            'NewCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.children = self.make_project_tree(
+            self.category, TREE_CATEGORY_COUNT, TREE_PROJECT_COUNT
+        )
+
+    def _move(self):
+        self.category.parent = self.new_category
+        self.category.save()
+
+    def _rename(self):
+        self.category.title = 'RenamedCategory'
+        self.category.save()
+
+    def test_move_category(self):
+        """Benchmark moving category with 10k descendants"""
+        self.assertEqual(
+            Project.objects.descendants_of(self.category).count(), 10000
+        )
+        queries = self.run_benchmark('Move category', self._move)
+        self.assertLessEqual(queries, MOVE_MAX_QUERIES)
+        project = self.children[-1]
+        project.refresh_from_db()
+        self.assertEqual(
+            project.full_title,
+            CAT_DELIMITER.join(
+                [
+                    'NewCategory',
+                    'TopCategory',
+                    project.parent.title,
+                    project.title,
+                ]
+            ),
+        )
+        self.assertEqual(
+            Project.objects.descendants_of(self.new_category).count(), 10001
+        )
+
+    def test_rename_category(self):
+        """Benchmark renaming category with 10k descendants"""
+        queries = self.run_benchmark('Rename category', self._rename)
+        self.assertLessEqual(queries, MOVE_MAX_QUERIES)
+        project = self.children[-1]
+        project.refresh_from_db()
+        self.assertTrue(
+            project.full_title.startswith('RenamedCategory' + CAT_DELIMITER)
+        )
+
+
+@skipUnless(
+    getattr(settings, 'PROJECTROLES_TEST_BENCHMARK', False), BENCHMARK_SKIP_MSG
+)
+class TestProjectListBenchmark(
+    ProjectMixin, RoleMixin, RoleAssignmentMixin, BenchmarkMixin, TestCase
+):
+    """Benchmarks for ProjectListAjaxView project visibility queries"""
+
+    def setUp(self):
+        self.init_roles()
+        self.user = self.make_user('user')
+        self.category = self.make_project(
+            'TopCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.children = self.make_project_tree(
+            self.category, TREE_CATEGORY_COUNT, TREE_PROJECT_COUNT
+        )
+        # Assign roles in a subset of categories
+        for c in self.children[:LIST_ROLE_CATEGORY_COUNT]:
+            self.make_assignment(c, self.user, self.role_guest)
+        self.projects = None
+
+    def _get_projects(self):
+        self.projects = list(ProjectListAjaxView._get_projects(self.user, []))
+
+    def test_get_projects(self):
+        """Benchmark listing visible projects from 10k projects"""
+        queries = self.run_benchmark('List projects', self._get_projects)
+        self.assertLessEqual(queries, LIST_MAX_QUERIES)
+        # Top category, role categories and their projects
+        self.assertEqual(
+            len(self.projects),
+            1 + LIST_ROLE_CATEGORY_COUNT * (TREE_PROJECT_COUNT + 1),
+        )
+
+
+@skipUnless(
+    getattr(settings, 'PROJECTROLES_TEST_BENCHMARK', False), BENCHMARK_SKIP_MSG
+)
+class TestIPAllowListBenchmark(BenchmarkMixin, TestCase):
+    """Benchmarks for IPAllowList with large allow lists"""
+
+    def setUp(self):
+        # Every other /24 network to avoid merging
+        self.allow_list = ','.join(
+            f'10.{i // 256}.{i % 256}.0/24'
+            for i in range(0, IP_NETWORK_COUNT * 2, 2)
+        )
+        self.addresses = [
+            ip_address(f'10.{i // 256}.{i % 256}.1')
+            for i in range(IP_LOOKUP_COUNT)
+        ]
+        self.compiled = None
+        self.results = None
+
+    def _compile(self):
+        self.compiled = IPAllowList(self.allow_list)
+
+    def _lookup(self):
+        self.results = [a in self.compiled for a in self.addresses]
+
+    def _lookup_linear(self):
+        networks = [ip_network(s) for s in self.allow_list.split(',')]
+        self.results = [
+            any(a in n for n in networks) for a in self.addresses[:100]
+        ]
+
+    def test_lookup(self):
+        """Benchmark IP lookups in allow list with 10k networks"""
+        self.run_benchmark('Compile IP allow list', self._compile)
+        self.assertEqual(len(self.compiled), IP_NETWORK_COUNT)
+        queries = self.run_benchmark('Lookup IP addresses', self._lookup)
+        self.assertEqual(queries, 0)
+        self.assertEqual(
+            self.results, [i % 2 == 0 for i in range(IP_LOOKUP_COUNT)]
+        )
+        # Baseline with linear matching of 100 addresses
+        self.run_benchmark('Lookup IP addresses (linear)', self._lookup_linear)
+        self.assertEqual(self.results, [i % 2 == 0 for i in range(100)])
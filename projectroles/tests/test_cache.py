@@ -0,0 +1,622 @@
+"""Tests for role, permission and app setting caching in the projectroles app"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from test_plus.test import TestCase
+
+from projectroles.app_settings import AppSettingAPI
+from projectroles.cache import (
+    AppSettingMemo,
+    RoleMemo,
+    get_app_setting_memo,
+    start_app_setting_memo,
+    end_app_setting_memo,
+    get_app_setting_cache_stats,
+    get_role_memo,
+    start_role_memo,
+    end_role_memo,
+    clear_role_memo,
+    memoize_app_setting,
+    memoize_role,
+    bump_perm_generation,
+    get_perm_cache_key,
+    get_search_cache_key,
+    has_pending_invalidation,
+    has_perm_cached,
+    PERM_GEN_GLOBAL,
+    PERM_GEN_PROJECT,
+    PERM_GEN_USER,
+)
+from projectroles.models import SODAR_CONSTANTS
+from projectroles.signals import get_search_app_labels
+from projectroles.tests.test_models import (
+    AppSettingMixin,
+    ProjectMixin,
+    RoleMixin,
+    RoleAssignmentMixin,
+)
+
+
+app_settings = AppSettingAPI()
+
+
+# SODAR constants
+PROJECT_TYPE_CATEGORY = SODAR_CONSTANTS['PROJECT_TYPE_CATEGORY']
+PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
+APP_SETTING_SCOPE_PROJECT_USER = SODAR_CONSTANTS[
+    'APP_SETTING_SCOPE_PROJECT_USER'
+]
+APP_SETTING_TYPE_BOOLEAN = SODAR_CONSTANTS['APP_SETTING_TYPE_BOOLEAN']
+
+# Local constants
+APP_NAME = 'projectroles'
+PERM_VIEW = 'projectroles.view_project'
+PERM_UPDATE = 'projectroles.update_project'
+
+
+class TestRoleMemo(ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase):
+    """Tests for RoleMemo and role memo helpers"""
+
+    def setUp(self):
+        self.init_roles()
+        self.user_owner = self.make_user('owner')
+        self.user_contributor = self.make_user('contributor')
+        self.category = self.make_project(
+            'TestCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.owner_as = self.make_assignment(
+            self.category, self.user_owner, self.role_owner
+        )
+        self.project = self.make_project(
+            'TestProject', PROJECT_TYPE_PROJECT, self.category
+        )
+        self.token = start_role_memo()
+        self.memo = get_role_memo()
+
+    def tearDown(self):
+        end_role_memo(self.token)
+
+    def test_get(self):
+        """Test RoleMemo.get()"""
+        memo = RoleMemo()
+        self.assertEqual(memo.get(('key',), lambda: 1), 1)
+        self.assertEqual(memo.get(('key',), lambda: 2), 1)
+        self.assertEqual(memo.hits, 1)
+        self.assertEqual(memo.misses, 1)
+
+    def test_clear(self):
+        """Test RoleMemo.clear()"""
+        memo = RoleMemo()
+        memo.get(('key',), lambda: 1)
+        memo.clear()
+        self.assertEqual(memo.get(('key',), lambda: 2), 2)
+        self.assertEqual(memo.hits, 0)
+        self.assertEqual(memo.misses, 2)
+
+    def test_end_role_memo(self):
+        """Test end_role_memo()"""
+        end_role_memo(self.token)
+        self.assertIsNone(get_role_memo())
+        self.assertEqual(memoize_role(('key',), lambda: 1), 1)
+        self.assertEqual(memoize_role(('key',), lambda: 2), 2)
+        self.token = start_role_memo()
+
+    def test_get_role(self):
+        """Test Project.get_role() with memo"""
+        self.assertEqual(self.project.get_role(self.user_owner), self.owner_as)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.project.get_role(self.user_owner), self.owner_as
+            )
+        self.assertEqual(self.memo.hits, 1)
+        self.assertEqual(self.memo.misses, 1)
+
+    def test_get_role_inherited_only(self):
+        """Test Project.get_role() with memo and inherited_only"""
+        self.assertEqual(self.project.get_role(self.user_owner), self.owner_as)
+        self.assertEqual(
+            self.category.get_role(self.user_owner, inherited_only=True), None
+        )
+        self.assertEqual(self.memo.hits, 0)
+        self.assertEqual(self.memo.misses, 2)
+
+    def test_get_role_assignment_create(self):
+        """Test Project.get_role() with memo after creating assignment"""
+        self.assertIsNone(self.project.get_role(self.user_contributor))
+        contrib_as = self.make_assignment(
+            self.project, self.user_contributor, self.role_contributor
+        )
+        self.assertEqual(
+            self.project.get_role(self.user_contributor), contrib_as
+        )
+        self.assertEqual(self.memo.misses, 2)
+
+    def test_get_role_assignment_delete(self):
+        """Test Project.get_role() with memo after deleting assignment"""
+        contrib_as = self.make_assignment(
+            self.project, self.user_contributor, self.role_contributor
+        )
+        self.assertEqual(
+            self.project.get_role(self.user_contributor), contrib_as
+        )
+        contrib_as.delete()
+        self.assertIsNone(self.project.get_role(self.user_contributor))
+
+    def test_get_role_project_move(self):
+        """Test Project.get_role() with memo after moving project"""
+        new_category = self.make_project(
+            'NewCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.assertEqual(self.project.get_role(self.user_owner), self.owner_as)
+        self.project.parent = new_category
+        self.project.save()
+        self.assertIsNone(self.project.get_role(self.user_owner))
+
+    def test_has_role_in_children(self):
+        """Test Project.has_role_in_children() with memo"""
+        self.assertFalse(
+            self.category.has_role_in_children(self.user_contributor)
+        )
+        with self.assertNumQueries(0):
+            self.category.has_role_in_children(self.user_contributor)
+        self.make_assignment(
+            self.project, self.user_contributor, self.role_contributor
+        )
+        self.assertTrue(
+            self.category.has_role_in_children(self.user_contributor)
+        )
+
+    def test_clear_role_memo(self):
+        """Test clear_role_memo()"""
+        self.project.get_role(self.user_owner)
+        clear_role_memo()
+        self.project.get_role(self.user_owner)
+        self.assertEqual(self.memo.hits, 0)
+        self.assertEqual(self.memo.misses, 2)
+
+
+class TestRoleMemoMiddleware(
+    ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase
+):
+    """Tests for RoleMemoMiddleware"""
+
+    def setUp(self):
+        self.init_roles()
+        self.user_owner = self.make_user('owner')
+        self.category = self.make_project(
+            'TestCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.make_assignment(self.category, self.user_owner, self.role_owner)
+        self.project = self.make_project(
+            'TestProject', PROJECT_TYPE_PROJECT, self.category
+        )
+
+    def test_request(self):
+        """Test request with role memo"""
+        with self.login(self.user_owner):
+            response = self.client.get(
+                reverse(
+                    'projectroles:detail',
+                    kwargs={'project': self.project.sodar_uuid},
+                )
+            )
+        self.assertEqual(response.status_code, 200)
+        memo = response.wsgi_request.role_memo
+        self.assertIsInstance(memo, RoleMemo)
+        self.assertGreater(memo.hits, 0)
+        self.assertGreater(memo.misses, 0)
+        self.assertIsNone(get_role_memo())  # Memo ended after request
+
+
+class TestHasPermCached(ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase):
+    """Tests for has_perm_cached()"""
+
+    def setUp(self):
+        cache.clear()
+        # Commit setup data to enable the cache
+        with self.captureOnCommitCallbacks(execute=True):
+            self.init_roles()
+            self.user_owner = self.make_user('owner')
+            self.user_guest = self.make_user('guest')
+            self.category = self.make_project(
+                'TestCategory', PROJECT_TYPE_CATEGORY, None
+            )
+            self.make_assignment(
+                self.category, self.user_owner, self.role_owner
+            )
+            self.project = self.make_project(
+                'TestProject', PROJECT_TYPE_PROJECT, self.category
+            )
+
+    def test_has_perm(self):
+        """Test has_perm_cached()"""
+        self.assertTrue(
+            has_perm_cached(self.user_owner, PERM_VIEW, self.project)
+        )
+        self.assertFalse(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+
+    def test_has_perm_cached(self):
+        """Test has_perm_cached() with cached value"""
+        has_perm_cached(self.user_owner, PERM_UPDATE, self.project)
+        with self.assertNumQueries(1):  # Project ancestors
+            self.assertTrue(
+                has_perm_cached(self.user_owner, PERM_UPDATE, self.project)
+            )
+
+    def test_has_perm_role_create(self):
+        """Test has_perm_cached() after creating role assignment"""
+        self.assertFalse(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+        self.make_assignment(self.project, self.user_guest, self.role_guest)
+        self.assertTrue(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+
+    def test_has_perm_role_inherited(self):
+        """Test has_perm_cached() after creating inherited role assignment"""
+        self.assertFalse(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+        self.make_assignment(self.category, self.user_guest, self.role_guest)
+        self.assertTrue(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+
+    def test_has_perm_role_delete(self):
+        """Test has_perm_cached() after deleting role assignment"""
+        role_as = self.make_assignment(
+            self.project, self.user_guest, self.role_guest
+        )
+        self.assertTrue(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+        role_as.delete()
+        self.assertFalse(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+
+    def test_has_perm_public_access(self):
+        """Test has_perm_cached() after setting public access"""
+        self.assertFalse(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+        self.project.set_public_access(self.role_guest)
+        self.assertTrue(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+
+    def test_has_perm_project_move(self):
+        """Test has_perm_cached() after moving project"""
+        new_category = self.make_project(
+            'NewCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.assertTrue(
+            has_perm_cached(self.user_owner, PERM_VIEW, self.project)
+        )
+        self.project.parent = new_category
+        self.project.save()
+        self.assertFalse(
+            has_perm_cached(self.user_owner, PERM_VIEW, self.project)
+        )
+
+    def test_has_perm_site_setting(self):
+        """Test has_perm_cached() after updating site setting"""
+        self.assertTrue(
+            has_perm_cached(self.user_owner, PERM_UPDATE, self.project)
+        )
+        app_settings.set('projectroles', 'site_read_only', True)
+        self.assertFalse(
+            has_perm_cached(self.user_owner, PERM_UPDATE, self.project)
+        )
+
+    def test_has_perm_superuser(self):
+        """Test has_perm_cached() after updating superuser status"""
+        self.assertFalse(
+            has_perm_cached(self.user_guest, PERM_UPDATE, self.project)
+        )
+        self.user_guest.is_superuser = True
+        self.user_guest.save()
+        self.assertTrue(
+            has_perm_cached(self.user_guest, PERM_UPDATE, self.project)
+        )
+
+    def test_has_perm_bump_generation(self):
+        """Test has_perm_cached() after bumping generations"""
+        has_perm_cached(self.user_owner, PERM_VIEW, self.project)
+        for scope, pks in [
+            (PERM_GEN_GLOBAL, None),
+            (PERM_GEN_USER, [self.user_owner.pk]),
+            (PERM_GEN_PROJECT, [self.category.pk]),
+        ]:
+            with self.captureOnCommitCallbacks(execute=True):
+                bump_perm_generation(scope, pks)
+            with self.assertNumQueries(2):  # Ancestors and project role
+                has_perm_cached(self.user_owner, PERM_VIEW, self.project)
+
+    def test_has_perm_pending(self):
+        """Test has_perm_cached() with uncommitted changes"""
+        self.assertFalse(has_pending_invalidation())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.make_assignment(self.project, self.user_guest, self.role_guest)
+            self.assertTrue(has_pending_invalidation())
+            self.assertTrue(
+                has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+            )
+            # Value should not be cached before commit
+            key = get_perm_cache_key(self.user_guest, PERM_VIEW, self.project)
+            self.assertIsNone(cache.get(key))
+        self.assertFalse(has_pending_invalidation())
+
+    def test_has_perm_role_delete_commit(self):
+        """Test has_perm_cached() with value cached before commit"""
+        with self.captureOnCommitCallbacks(execute=True):
+            role_as = self.make_assignment(
+                self.project, self.user_guest, self.role_guest
+            )
+        self.assertTrue(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                role_as.delete()
+            # Concurrent request caches value from data committed before delete
+            key = get_perm_cache_key(self.user_guest, PERM_VIEW, self.project)
+            cache.set(key, True)
+        # Value cached before commit should not be returned after commit
+        self.assertNotEqual(
+            get_perm_cache_key(self.user_guest, PERM_VIEW, self.project), key
+        )
+        self.assertFalse(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+
+    def test_has_perm_last_login(self):
+        """Test has_perm_cached() after updating login timestamp"""
+        key = get_perm_cache_key(self.user_owner, PERM_VIEW, self.project)
+        self.user_owner.last_login = timezone.now()
+        self.user_owner.save(update_fields=['last_login'])
+        self.assertFalse(has_pending_invalidation())
+        self.assertEqual(
+            get_perm_cache_key(self.user_owner, PERM_VIEW, self.project), key
+        )
+
+    @override_settings(
+        CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.dummy.DummyCache'
+            }
+        }
+    )
+    def test_has_perm_dummy_cache(self):
+        """Test has_perm_cached() with dummy cache backend"""
+        self.assertTrue(
+            has_perm_cached(self.user_owner, PERM_VIEW, self.project)
+        )
+        self.assertFalse(
+            has_perm_cached(self.user_guest, PERM_VIEW, self.project)
+        )
+
+    def test_has_perm_disabled(self):
+        """Test has_perm_cached() with disabled cache"""
+        override = override_settings(PROJECTROLES_PERM_CACHE_TIMEOUT=0)
+        # Commit invalidation from setting change to keep site_read_only in
+        # the shared app setting cache
+        with self.captureOnCommitCallbacks(execute=True):
+            override.enable()
+        self.addCleanup(override.disable)
+        has_perm_cached(self.user_owner, PERM_UPDATE, self.project)
+        with self.assertNumQueries(1):  # Project role
+            has_perm_cached(self.user_owner, PERM_UPDATE, self.project)
+
+
+class TestAppSettingCache(ProjectMixin, AppSettingMixin, TestCase):
+    """Tests for app setting value caching"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = self.make_user('user')
+        self.project = self.make_project(
+            'TestProject', PROJECT_TYPE_PROJECT, None
+        )
+        self.token = start_app_setting_memo()
+        self.memo = get_app_setting_memo()
+
+    def tearDown(self):
+        end_app_setting_memo(self.token)
+
+    def test_get(self):
+        """Test get() with memo"""
+        self.assertEqual(
+            app_settings.get(APP_NAME, 'ip_restrict', project=self.project),
+            False,
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                app_settings.get(APP_NAME, 'ip_restrict', project=self.project),
+                False,
+            )
+        self.assertEqual(self.memo.hits, 1)
+        self.assertEqual(self.memo.misses, 1)
+
+    def test_get_set(self):
+        """Test get() with memo after set()"""
+        app_settings.get(APP_NAME, 'ip_restrict', project=self.project)
+        app_settings.set(APP_NAME, 'ip_restrict', True, project=self.project)
+        self.assertEqual(
+            app_settings.get(APP_NAME, 'ip_restrict', project=self.project),
+            True,
+        )
+
+    def test_get_delete(self):
+        """Test get() with memo after delete()"""
+        app_settings.set(APP_NAME, 'ip_restrict', True, project=self.project)
+        app_settings.get(APP_NAME, 'ip_restrict', project=self.project)
+        app_settings.delete(APP_NAME, 'ip_restrict', project=self.project)
+        self.assertEqual(
+            app_settings.get(APP_NAME, 'ip_restrict', project=self.project),
+            False,
+        )
+
+    def test_get_delete_by_scope(self):
+        """Test get() with memo after delete_by_scope()"""
+        app_settings.set(
+            APP_NAME, 'project_star', True, project=self.project, user=self.user
+        )
+        app_settings.get(
+            APP_NAME, 'project_star', project=self.project, user=self.user
+        )
+        app_settings.delete_by_scope(
+            APP_SETTING_SCOPE_PROJECT_USER, project=self.project, user=self.user
+        )
+        self.assertEqual(
+            app_settings.get(
+                APP_NAME, 'project_star', project=self.project, user=self.user
+            ),
+            False,
+        )
+
+    def test_request(self):
+        """Test request with app setting memo"""
+        with self.login(self.user):
+            response = self.client.get(reverse('home'))
+        self.assertEqual(response.status_code, 200)
+        memo = response.wsgi_request.app_setting_memo
+        self.assertIsInstance(memo, AppSettingMemo)
+        self.assertGreater(memo.misses, 0)
+
+
+@override_settings(PROJECTROLES_APP_SETTING_CACHE_TIMEOUT=300)
+class TestAppSettingSharedCache(AppSettingMixin, TestCase):
+    """Tests for app setting values cached across requests"""
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        # Clear values cached from site-wide changes rolled back after test
+        cache.clear()
+
+    def test_get(self):
+        """Test get() with shared cache"""
+        stats = get_app_setting_cache_stats()
+        app_settings.get(APP_NAME, 'site_read_only')
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                app_settings.get(APP_NAME, 'site_read_only'), False
+            )
+        new_stats = get_app_setting_cache_stats()
+        self.assertEqual(new_stats['cache_hits'], stats['cache_hits'] + 1)
+        self.assertEqual(new_stats['cache_misses'], stats['cache_misses'] + 1)
+
+    def test_get_model_update(self):
+        """Test get() with shared cache after updating AppSetting directly"""
+        app_settings.get(APP_NAME, 'site_read_only')
+        self.make_setting(
+            plugin_name=APP_NAME,
+            name='site_read_only',
+            setting_type=APP_SETTING_TYPE_BOOLEAN,
+            value='1',
+        )
+        self.assertEqual(app_settings.get(APP_NAME, 'site_read_only'), True)
+
+    def test_get_commit(self):
+        """Test get() with shared cache after committed update"""
+        app_settings.get(APP_NAME, 'site_read_only')
+        with self.captureOnCommitCallbacks(execute=True):
+            app_settings.set(APP_NAME, 'site_read_only', True)
+        self.assertEqual(app_settings.get(APP_NAME, 'site_read_only'), True)
+
+    def test_get_rollback(self):
+        """Test get() with shared cache after rolled back update"""
+        app_settings.get(APP_NAME, 'site_read_only')
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                app_settings.set(APP_NAME, 'site_read_only', True)
+                self.assertTrue(has_pending_invalidation())
+                self.assertEqual(
+                    app_settings.get(APP_NAME, 'site_read_only'), True
+                )
+                raise ValueError()
+        self.assertFalse(has_pending_invalidation())
+        # Uncommitted value should not have been cached
+        self.assertEqual(app_settings.get(APP_NAME, 'site_read_only'), False)
+
+    def test_get_many_rollback(self):
+        """Test get_many() with shared cache after rolled back update"""
+        s_keys = [(APP_NAME, 'site_read_only')]
+        app_settings.get_many(s_keys)
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                app_settings.set(APP_NAME, 'site_read_only', True)
+                self.assertEqual(
+                    app_settings.get_many(s_keys), {s_keys[0]: True}
+                )
+                raise ValueError()
+        self.assertEqual(app_settings.get_many(s_keys), {s_keys[0]: False})
+
+    def test_get_commit_concurrent(self):
+        """Test get() with shared cache and value cached before commit"""
+        with self.captureOnCommitCallbacks(execute=True):
+            app_settings.set(APP_NAME, 'site_read_only', True)
+            # Concurrent request caches value committed before the update
+            with patch(
+                'projectroles.cache.has_pending_invalidation',
+                return_value=False,
+            ):
+                memoize_app_setting(
+                    APP_NAME, 'site_read_only', None, None, lambda: False
+                )
+        # Value cached before commit should not be returned after commit
+        self.assertEqual(app_settings.get(APP_NAME, 'site_read_only'), True)
+
+
+class TestSearchCache(ProjectMixin, TestCase):
+    """Tests for search result cache invalidation"""
+
+    def _get_key(self, app_label):
+        return get_search_cache_key(
+            self.user, 'test_plugin', app_label, ['test'], {}
+        )
+
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user = self.make_user('user')
+
+    def test_get_search_app_labels(self):
+        """Test get_search_app_labels()"""
+        self.assertEqual(
+            get_search_app_labels(),
+            frozenset(['projectroles', 'filesfolders', 'timeline']),
+        )
+
+    def test_model_update(self):
+        """Test search cache key after model update in searched app"""
+        key = self._get_key(APP_NAME)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.make_project('TestCategory', PROJECT_TYPE_CATEGORY, None)
+        self.assertNotEqual(self._get_key(APP_NAME), key)
+
+    def test_model_update_other_app(self):
+        """Test search cache key after model update in app without search"""
+        user_label = self.user._meta.app_label
+        key = self._get_key(user_label)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.make_user('new_user')
+        self.assertEqual(self._get_key(user_label), key)
+
+    def test_model_update_pending(self):
+        """Test search cache key with uncommitted model update"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.make_project('TestCategory', PROJECT_TYPE_CATEGORY, None)
+            self.assertIsNone(self._get_key(APP_NAME))
+        self.assertIsNotNone(self._get_key(APP_NAME))
@@ -36,6 +36,9 @@ from projectroles.management.commands.blockprojectaccess import (
     INVALID_MODE_MSG,
     MODE_CONVERT_ERR_MSG,
 )
+from projectroles.management.commands.checkpublicchildren import (
+    Command as CheckPublicChildrenCommand,
+)
 from projectroles.management.commands.cleanappsettings import (
     LOG_NONE_LABEL,
     START_MSG,
@@ -50,12 +53,17 @@ from projectroles.management.commands.createdevusers import (
     DEV_USER_NAMES,
     DEFAULT_PASSWORD,
 )
+from projectroles.management.commands.rebuildroles import (
+    Command as RebuildRolesCommand,
+)
 from projectroles.management.commands.syncgroups import (
     Command as SyncGroupsCommand,
 )
 
 from projectroles.models import (
+    Project,
     RoleAssignment,
+    EffectiveRole,
     ProjectInvite,
     RemoteSite,
     AppSetting,
@@ -812,6 +820,66 @@ class TestBlockProjectAccess(
         )
 
 
+class TestCheckPublicChildren(ProjectMixin, RoleMixin, TestCase):
+    """Tests for checkpublicchildren command"""
+
+    def setUp(self):
+        self.init_roles()
+        self.category = self.make_project(
+            'TestCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.sub_category = self.make_project(
+            'SubCategory', PROJECT_TYPE_CATEGORY, self.category
+        )
+        self.project = self.make_project(
+            'TestProject',
+            PROJECT_TYPE_PROJECT,
+            self.sub_category,
+            public_access=self.role_guest,
+        )
+        self.command = CheckPublicChildrenCommand()
+
+    def _assert_count(self, project: Project, count: int):
+        project.refresh_from_db()
+        self.assertEqual(project.public_children_count, count)
+        self.assertEqual(project.has_public_children, count > 0)
+
+    def test_check(self):
+        """Test checking with valid counts"""
+        with self.assertLogs(
+            'projectroles.management.commands.checkpublicchildren', 'INFO'
+        ) as cm:
+            self.command.handle()
+        self.assertEqual(len(cm.output), 2)
+        self._assert_count(self.category, 1)
+        self._assert_count(self.sub_category, 1)
+
+    def test_check_invalid(self):
+        """Test checking with invalid counts"""
+        Project.objects.filter(pk=self.category.pk).update(
+            public_children_count=0, has_public_children=False
+        )
+        with self.assertLogs(
+            'projectroles.management.commands.checkpublicchildren', 'INFO'
+        ) as cm:
+            self.command.handle()
+        self.assertEqual(len(cm.output), 3)
+        self._assert_count(self.category, 0)  # Not repaired
+
+    def test_check_repair(self):
+        """Test repairing invalid counts"""
+        Project.objects.filter(pk=self.category.pk).update(
+            public_children_count=0, has_public_children=False
+        )
+        Project.objects.filter(pk=self.sub_category.pk).update(
+            public_children_count=3
+        )
+        self.command.handle(repair=True)
+        self._assert_count(self.category, 1)
+        self._assert_count(self.sub_category, 1)
+        self._assert_count(self.project, 0)
+
+
 class TestCleanAppSettings(
     ProjectMixin, RoleMixin, RoleAssignmentMixin, AppSettingMixin, TestCase
 ):
@@ -1505,6 +1573,45 @@ class TestRemoveRoles(
         )
 
 
+class TestRebuildRoles(ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase):
+    """Tests for rebuildroles command"""
+
+    def setUp(self):
+        self.init_roles()
+        self.user_owner = self.make_user('owner')
+        self.user_contributor = self.make_user('contributor')
+        self.category = self.make_project(
+            'TestCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.owner_as = self.make_assignment(
+            self.category, self.user_owner, self.role_owner
+        )
+        self.project = self.make_project(
+            'TestProject', PROJECT_TYPE_PROJECT, self.category
+        )
+        self.contributor_as = self.make_assignment(
+            self.project, self.user_contributor, self.role_contributor
+        )
+        self.command = RebuildRolesCommand()
+
+    def test_rebuild(self):
+        """Test rebuilding effective roles"""
+        EffectiveRole.objects.all().delete()
+        self.assertIsNone(self.project.get_role(self.user_owner))
+        self.command.handle()
+        self.assertEqual(EffectiveRole.objects.count(), 3)
+        self.assertEqual(self.project.get_role(self.user_owner), self.owner_as)
+        self.assertEqual(
+            self.project.get_role(self.user_contributor), self.contributor_as
+        )
+
+    def test_rebuild_existing(self):
+        """Test rebuilding with existing effective roles"""
+        self.assertEqual(EffectiveRole.objects.count(), 3)
+        self.command.handle()
+        self.assertEqual(EffectiveRole.objects.count(), 3)
+
+
 class TestSyncGroups(TestCase):
     """Tests for syncgroups command"""
 
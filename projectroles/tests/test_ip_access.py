@@ -0,0 +1,122 @@
+"""Tests for IP access restriction in the projectroles app"""
+
+from ipaddress import ip_address
+
+from django.test import RequestFactory
+
+from test_plus.test import TestCase
+
+from projectroles.ip_access import (
+    IPAllowList,
+    check_ip_access,
+    get_client_address,
+    get_ip_allow_list,
+)
+from projectroles.models import SODAR_CONSTANTS
+from projectroles.tests.test_models import ProjectMixin, AppSettingMixin
+
+
+# SODAR constants
+PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
+APP_SETTING_TYPE_BOOLEAN = SODAR_CONSTANTS['APP_SETTING_TYPE_BOOLEAN']
+APP_SETTING_TYPE_STRING = SODAR_CONSTANTS['APP_SETTING_TYPE_STRING']
+
+# Local constants
+APP_NAME = 'projectroles'
+ALLOW_LIST = '192.168.1.1, 10.0.0.0/24,10.0.1.0/24, 2001:db8::/32'
+
+
+class TestIPAllowList(TestCase):
+    """Tests for IPAllowList"""
+
+    def test_contains(self):
+        """Test IPAllowList lookup"""
+        allow_list = IPAllowList(ALLOW_LIST)
+        self.assertIn(ip_address('192.168.1.1'), allow_list)
+        self.assertIn(ip_address('10.0.0.0'), allow_list)
+        self.assertIn(ip_address('10.0.1.255'), allow_list)
+        self.assertIn(ip_address('2001:db8::1'), allow_list)
+        self.assertNotIn(ip_address('192.168.1.2'), allow_list)
+        self.assertNotIn(ip_address('10.0.2.0'), allow_list)
+        self.assertNotIn(ip_address('9.255.255.255'), allow_list)
+        self.assertNotIn(ip_address('2001:db9::1'), allow_list)
+
+    def test_merge(self):
+        """Test merging adjacent and overlapping networks"""
+        allow_list = IPAllowList(ALLOW_LIST)
+        self.assertEqual(len(allow_list), 3)
+
+    def test_empty(self):
+        """Test IPAllowList with empty value"""
+        allow_list = IPAllowList('')
+        self.assertEqual(len(allow_list), 0)
+        self.assertNotIn(ip_address('192.168.1.1'), allow_list)
+
+    def test_invalid(self):
+        """Test IPAllowList with invalid entry"""
+        allow_list = IPAllowList('xxx,192.168.1.1')
+        self.assertEqual(len(allow_list), 1)
+        self.assertIn(ip_address('192.168.1.1'), allow_list)
+
+    def test_get_ip_allow_list(self):
+        """Test get_ip_allow_list() caching"""
+        allow_list = get_ip_allow_list(ALLOW_LIST)
+        self.assertIs(get_ip_allow_list(ALLOW_LIST), allow_list)
+        self.assertIsNot(get_ip_allow_list('192.168.1.1'), allow_list)
+
+
+class TestCheckIPAccess(ProjectMixin, AppSettingMixin, TestCase):
+    """Tests for check_ip_access()"""
+
+    def setUp(self):
+        self.project = self.make_project(
+            'TestProject', PROJECT_TYPE_PROJECT, None
+        )
+        self.req_factory = RequestFactory()
+
+    def _set_ip_restrict(self, allow_list: str):
+        self.make_setting(
+            plugin_name=APP_NAME,
+            name='ip_restrict',
+            setting_type=APP_SETTING_TYPE_BOOLEAN,
+            value=True,
+            project=self.project,
+        )
+        self.make_setting(
+            plugin_name=APP_NAME,
+            name='ip_allow_list',
+            setting_type=APP_SETTING_TYPE_STRING,
+            value=allow_list,
+            value_json=None,
+            project=self.project,
+        )
+
+    def test_get_client_address(self):
+        """Test get_client_address()"""
+        request = self.req_factory.get(
+            '/', HTTP_X_FORWARDED_FOR='10.0.0.1, 192.168.1.1'
+        )
+        self.assertEqual(get_client_address(request), ip_address('10.0.0.1'))
+
+    def test_check_no_restrict(self):
+        """Test check_ip_access() with no IP restriction"""
+        request = self.req_factory.get('/', REMOTE_ADDR='192.168.1.2')
+        self.assertTrue(check_ip_access(request, self.project))
+
+    def test_check_allowed(self):
+        """Test check_ip_access() with allowed address"""
+        self._set_ip_restrict(ALLOW_LIST)
+        request = self.req_factory.get('/', REMOTE_ADDR='10.0.1.10')
+        self.assertTrue(check_ip_access(request, self.project))
+
+    def test_check_denied(self):
+        """Test check_ip_access() with address not in allow list"""
+        self._set_ip_restrict(ALLOW_LIST)
+        request = self.req_factory.get('/', REMOTE_ADDR='192.168.1.2')
+        self.assertFalse(check_ip_access(request, self.project))
+
+    def test_check_empty_list(self):
+        """Test check_ip_access() with empty allow list"""
+        self._set_ip_restrict('')
+        request = self.req_factory.get('/', REMOTE_ADDR='192.168.1.1')
+        self.assertFalse(check_ip_access(request, self.project))
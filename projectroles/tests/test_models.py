@@ -7,20 +7,24 @@ from typing import Any, Optional, Union
 from uuid import UUID
 
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import Group
+from django.contrib.auth.models import AnonymousUser, Group
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.models import QuerySet
 from django.forms.models import model_to_dict
 from django.urls import reverse
 from django.utils import timezone
 from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from test_plus.test import TestCase
 
 from projectroles.models import (
     Project,
+    ProjectAncestor,
     Role,
     RoleAssignment,
+    EffectiveRole,
     ProjectInvite,
     AppSetting,
     RemoteSite,
@@ -384,6 +388,7 @@ class TestProject(ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase):
             'public_access': None,
             'archive': False,
             'has_public_children': False,
+            'public_children_count': 0,
         }
         model_dict = model_to_dict(self.project)
         # HACK: Can't compare markupfields like this. Better solution?
@@ -504,6 +509,131 @@ class TestProject(ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase):
         """Test get_parents() with sub project"""
         self.assertEqual(list(self.project.get_parents()), [self.category])
 
+    def test_save_rename_category(self):
+        """Test save() with renamed category"""
+        sub_cat = self.make_project(
+            'SubCategory', PROJECT_TYPE_CATEGORY, self.category
+        )
+        sub_project = self.make_project(
+            'SubProject', PROJECT_TYPE_PROJECT, sub_cat
+        )
+        self.category.title = 'NewTitle'
+        self.category.save()
+        sub_cat.refresh_from_db()
+        sub_project.refresh_from_db()
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.full_title, 'NewTitle / TestProject')
+        self.assertEqual(sub_cat.full_title, 'NewTitle / SubCategory')
+        self.assertEqual(
+            sub_project.full_title, 'NewTitle / SubCategory / SubProject'
+        )
+
+    def test_save_move_category(self):
+        """Test save() with moved category"""
+        new_cat = self.make_project('NewCategory', PROJECT_TYPE_CATEGORY, None)
+        sub_cat = self.make_project(
+            'SubCategory', PROJECT_TYPE_CATEGORY, self.category
+        )
+        sub_project = self.make_project(
+            'SubProject', PROJECT_TYPE_PROJECT, sub_cat
+        )
+        self.category.parent = new_cat
+        self.category.save()
+        sub_cat.refresh_from_db()
+        sub_project.refresh_from_db()
+        self.project.refresh_from_db()
+        self.assertEqual(
+            self.project.full_title, 'NewCategory / TestCategory / TestProject'
+        )
+        self.assertEqual(
+            sub_project.full_title,
+            'NewCategory / TestCategory / SubCategory / SubProject',
+        )
+
+    def test_save_move_category_num_queries(self):
+        """Test save() query count with moved category"""
+        new_cat = self.make_project('NewCategory', PROJECT_TYPE_CATEGORY, None)
+        with CaptureQueriesContext(connection) as ctx:
+            self.category.parent = new_cat
+            self.category.save()
+        self.category.parent = None
+        self.category.save()
+        for i in range(5):
+            sub_cat = self.make_project(
+                f'SubCategory{i}', PROJECT_TYPE_CATEGORY, self.category
+            )
+            self.make_project(f'SubProject{i}', PROJECT_TYPE_PROJECT, sub_cat)
+        # Query count should not depend on the number of children
+        with self.assertNumQueries(len(ctx.captured_queries)):
+            self.category.parent = new_cat
+            self.category.save()
+
+    def test_save_move_category_public_children(self):
+        """Test save() with moved category and public children"""
+        new_cat = self.make_project('NewCategory', PROJECT_TYPE_CATEGORY, None)
+        sub_cat = self.make_project(
+            'SubCategory', PROJECT_TYPE_CATEGORY, self.category
+        )
+        self.make_project(
+            'SubProject',
+            PROJECT_TYPE_PROJECT,
+            sub_cat,
+            public_access=self.role_guest,
+        )
+        self.category.parent = new_cat
+        self.category.save()
+        self.assertEqual(self.category.has_public_children, True)
+        self.assertEqual(self.category.public_children_count, 1)
+        sub_cat.refresh_from_db()
+        self.assertEqual(sub_cat.has_public_children, True)
+        self.assertEqual(sub_cat.public_children_count, 1)
+        new_cat.refresh_from_db()
+        self.assertEqual(new_cat.has_public_children, True)
+        self.assertEqual(new_cat.public_children_count, 1)
+
+    def test_save_move_public_project(self):
+        """Test save() with moved public project"""
+        new_cat = self.make_project('NewCategory', PROJECT_TYPE_CATEGORY, None)
+        self.project.set_public_access(self.role_guest)
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.public_children_count, 1)
+        self.project.parent = new_cat
+        self.project.save()
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.has_public_children, False)
+        self.assertEqual(self.category.public_children_count, 0)
+        new_cat.refresh_from_db()
+        self.assertEqual(new_cat.has_public_children, True)
+        self.assertEqual(new_cat.public_children_count, 1)
+
+    def test_save_stale_public_children(self):
+        """Test save() with outdated public children count in parent object"""
+        self.project.set_public_access(self.role_guest)
+        self.assertEqual(self.category.public_children_count, 0)  # Outdated
+        self.category.description = 'Updated'
+        self.category.save()
+        self.assertEqual(self.category.has_public_children, True)
+        self.assertEqual(self.category.public_children_count, 1)
+
+    def test_delete_public_children(self):
+        """Test delete() with public project"""
+        sub_cat = self.make_project(
+            'SubCategory', PROJECT_TYPE_CATEGORY, self.category
+        )
+        self.make_project(
+            'SubProject',
+            PROJECT_TYPE_PROJECT,
+            sub_cat,
+            public_access=self.role_guest,
+        )
+        self.project.set_public_access(self.role_guest)
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.public_children_count, 2)
+        sub_cat.delete()
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.has_public_children, True)
+        self.assertEqual(self.category.public_children_count, 1)
+
     def test_is_remote(self):
         """Test is_remote() without remote projects"""
         self.assertEqual(self.project.is_remote(), False)
@@ -526,6 +656,30 @@ class TestProject(ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase):
         self.project.set_public_access(None)
         self.assertEqual(self.project.public_access, None)
 
+    def test_set_public_access_parents(self):
+        """Test set_public_access() public children for parents"""
+        sub_cat = self.make_project(
+            'SubCategory', PROJECT_TYPE_CATEGORY, self.category
+        )
+        sub_project = self.make_project(
+            'SubProject', PROJECT_TYPE_PROJECT, sub_cat
+        )
+        sub_project.set_public_access(self.role_guest)
+        self.project.set_public_access(self.role_guest)
+        self.category.refresh_from_db()
+        sub_cat.refresh_from_db()
+        self.assertEqual(self.category.public_children_count, 2)
+        self.assertEqual(self.category.has_public_children, True)
+        self.assertEqual(sub_cat.public_children_count, 1)
+        self.assertEqual(sub_cat.has_public_children, True)
+        sub_project.set_public_access(self.role_viewer)  # No change
+        sub_project.set_public_access(None)
+        self.category.refresh_from_db()
+        sub_cat.refresh_from_db()
+        self.assertEqual(self.category.public_children_count, 1)
+        self.assertEqual(sub_cat.public_children_count, 0)
+        self.assertEqual(sub_cat.has_public_children, False)
+
     def test_set_archive(self):
         """Test set_archive()"""
         self.assertFalse(self.project.archive)
@@ -966,6 +1120,265 @@ class TestRoleAssignment(
         )
         self.assertIsInstance(delegate_as, RoleAssignment)
 
+    def test_get_effective_roles(self):
+        """Test get_effective_roles()"""
+        project_new = self.make_project(
+            'NewProject', PROJECT_TYPE_PROJECT, self.category
+        )
+        cat_as = self.make_assignment(
+            self.category, self.user_bob, self.role_guest
+        )
+        project_as = self.make_assignment(
+            self.project, self.user_bob, self.role_contributor
+        )
+        projects = [self.category, self.project, project_new]
+        with self.assertNumQueries(1):
+            roles = RoleAssignment.objects.get_effective_roles(
+                self.user_bob, projects
+            )
+        self.assertEqual(
+            roles,
+            {
+                self.category.pk: cat_as,
+                self.project.pk: project_as,
+                project_new.pk: cat_as,
+            },
+        )
+        # Results should be consistent with get_role()
+        for p in projects:
+            self.assertEqual(roles[p.pk], p.get_role(self.user_bob))
+
+    def test_get_effective_roles_inherit_higher(self):
+        """Test get_effective_roles() with inherited role higher than local"""
+        self.make_assignment(self.project, self.user_alice, self.role_guest)
+        roles = RoleAssignment.objects.get_effective_roles(
+            self.user_alice, [self.project]
+        )
+        self.assertEqual(roles, {self.project.pk: self.owner_as_cat})
+
+    def test_get_effective_roles_inherited_only(self):
+        """Test get_effective_roles() with inherited_only=True"""
+        self.make_assignment(self.project, self.user_bob, self.role_guest)
+        roles = RoleAssignment.objects.get_effective_roles(
+            self.user_bob, [self.category, self.project], inherited_only=True
+        )
+        self.assertEqual(roles, {self.category.pk: None, self.project.pk: None})
+
+    def test_get_effective_roles_no_role(self):
+        """Test get_effective_roles() with no roles for user"""
+        roles = RoleAssignment.objects.get_effective_roles(
+            self.user_carol, [self.category, self.project]
+        )
+        self.assertEqual(roles, {self.category.pk: None, self.project.pk: None})
+
+    def test_get_effective_roles_anon(self):
+        """Test get_effective_roles() with anonymous user"""
+        with self.assertNumQueries(0):
+            roles = RoleAssignment.objects.get_effective_roles(
+                AnonymousUser(), [self.category, self.project]
+            )
+        self.assertEqual(roles, {self.category.pk: None, self.project.pk: None})
+
+
+class TestEffectiveRole(ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase):
+    """Tests for EffectiveRole"""
+
+    def _get_roles(self, project: Project) -> list[tuple]:
+        """Return effective roles for project as sorted tuples"""
+        return sorted(
+            [
+                (r.user.username, r.role_assignment, r.rank, r.inherited)
+                for r in EffectiveRole.objects.filter(project=project)
+            ],
+            key=lambda x: x[0],
+        )
+
+    def setUp(self):
+        self.category = self.make_project(
+            title='TestCategory', type=PROJECT_TYPE_CATEGORY, parent=None
+        )
+        self.sub_category = self.make_project(
+            title='SubCategory',
+            type=PROJECT_TYPE_CATEGORY,
+            parent=self.category,
+        )
+        self.project = self.make_project(
+            title='TestProject',
+            type=PROJECT_TYPE_PROJECT,
+            parent=self.sub_category,
+        )
+        self.init_roles()
+        self.user_alice = self.make_user('alice')
+        self.user_bob = self.make_user('bob')
+        self.owner_as_cat = self.make_assignment(
+            self.category, self.user_alice, self.role_owner
+        )
+
+    def test_create_assignment(self):
+        """Test effective roles after creating assignment"""
+        self.assertEqual(
+            self._get_roles(self.category),
+            [('alice', self.owner_as_cat, 10, False)],
+        )
+        self.assertEqual(
+            self._get_roles(self.sub_category),
+            [('alice', self.owner_as_cat, 10, True)],
+        )
+        self.assertEqual(
+            self._get_roles(self.project),
+            [('alice', self.owner_as_cat, 10, True)],
+        )
+
+    def test_create_assignment_local(self):
+        """Test effective roles after creating local and inherited roles"""
+        contrib_as = self.make_assignment(
+            self.project, self.user_bob, self.role_contributor
+        )
+        guest_as = self.make_assignment(
+            self.sub_category, self.user_bob, self.role_guest
+        )
+        self.assertEqual(
+            self._get_roles(self.project),
+            [
+                ('alice', self.owner_as_cat, 10, True),
+                ('bob', contrib_as, 30, False),
+                ('bob', guest_as, 40, True),
+            ],
+        )
+        self.assertEqual(self.project.get_role(self.user_bob), contrib_as)
+
+    def test_create_assignment_finder(self):
+        """Test effective roles with finder role"""
+        finder_as = self.make_assignment(
+            self.category, self.user_bob, self.role_finder
+        )
+        self.assertEqual(
+            self._get_roles(self.sub_category),
+            [
+                ('alice', self.owner_as_cat, 10, True),
+                ('bob', finder_as, 50, True),
+            ],
+        )
+        # Finder role is not applicable for projects
+        self.assertEqual(
+            self._get_roles(self.project),
+            [('alice', self.owner_as_cat, 10, True)],
+        )
+
+    def test_update_assignment(self):
+        """Test effective roles after updating assignment"""
+        self.owner_as_cat.role = self.role_delegate
+        self.owner_as_cat.save()
+        self.assertEqual(
+            self._get_roles(self.project),
+            [('alice', self.owner_as_cat, 20, True)],
+        )
+
+    def test_add_assignments(self):
+        """Test add_assignments()"""
+        contrib_as, finder_as = RoleAssignment.objects.bulk_create(
+            [
+                RoleAssignment(
+                    project=self.project,
+                    user=self.user_bob,
+                    role=self.role_contributor,
+                ),
+                RoleAssignment(
+                    project=self.sub_category,
+                    user=self.user_bob,
+                    role=self.role_finder,
+                ),
+            ]
+        )
+        self.assertEqual(EffectiveRole.objects.count(), 3)
+        EffectiveRole.objects.add_assignments([contrib_as, finder_as])
+        self.assertEqual(EffectiveRole.objects.count(), 5)
+        self.assertEqual(
+            self._get_roles(self.sub_category),
+            [
+                ('alice', self.owner_as_cat, 10, True),
+                ('bob', finder_as, 50, False),
+            ],
+        )
+        self.assertEqual(
+            self._get_roles(self.project),
+            [
+                ('alice', self.owner_as_cat, 10, True),
+                ('bob', contrib_as, 30, False),
+            ],
+        )
+
+    def test_delete_assignment(self):
+        """Test effective roles after deleting assignment"""
+        self.assertEqual(EffectiveRole.objects.count(), 3)
+        self.owner_as_cat.delete()
+        self.assertEqual(EffectiveRole.objects.count(), 0)
+
+    def test_create_project(self):
+        """Test effective roles after creating project"""
+        project = self.make_project(
+            title='NewProject',
+            type=PROJECT_TYPE_PROJECT,
+            parent=self.sub_category,
+        )
+        self.assertEqual(
+            self._get_roles(project),
+            [('alice', self.owner_as_cat, 10, True)],
+        )
+
+    def test_move_project(self):
+        """Test effective roles after moving project"""
+        category = self.make_project(
+            title='NewCategory', type=PROJECT_TYPE_CATEGORY, parent=None
+        )
+        owner_as = self.make_assignment(
+            category, self.user_bob, self.role_owner
+        )
+        self.sub_category.parent = category
+        self.sub_category.save()
+        self.assertEqual(
+            self._get_roles(self.sub_category),
+            [('bob', owner_as, 10, True)],
+        )
+        self.assertEqual(
+            self._get_roles(self.project), [('bob', owner_as, 10, True)]
+        )
+        self.assertIsNone(self.project.get_role(self.user_alice))
+
+    def test_update_project_queries(self):
+        """Test update_project() query count with children"""
+        with CaptureQueriesContext(connection) as ctx:
+            EffectiveRole.objects.update_project(self.sub_category)
+        for i in range(3):
+            project = self.make_project(
+                title=f'Project{i}',
+                type=PROJECT_TYPE_PROJECT,
+                parent=self.sub_category,
+            )
+            self.make_assignment(project, self.user_bob, self.role_guest)
+        expected = self._get_roles(self.project)
+        with self.assertNumQueries(len(ctx.captured_queries)):
+            EffectiveRole.objects.update_project(self.sub_category)
+        self.assertEqual(EffectiveRole.objects.count(), 9)
+        self.assertEqual(self._get_roles(self.project), expected)
+
+    def test_delete_project(self):
+        """Test effective roles after deleting project"""
+        self.project.delete()
+        self.assertEqual(EffectiveRole.objects.count(), 2)
+
+    def test_rebuild(self):
+        """Test rebuild()"""
+        contrib_as = self.make_assignment(
+            self.project, self.user_bob, self.role_contributor
+        )
+        expected = self._get_roles(self.project)
+        EffectiveRole.objects.all().delete()
+        self.assertIsNone(self.project.get_role(self.user_bob))
+        self.assertEqual(EffectiveRole.objects.rebuild(), 4)
+        self.assertEqual(self._get_roles(self.project), expected)
+        self.assertEqual(self.project.get_role(self.user_bob), contrib_as)
+
 
 class TestProjectInvite(
     ProjectMixin, RoleAssignmentMixin, ProjectInviteMixin, TestCase
@@ -1288,6 +1701,148 @@ class TestProjectManager(ProjectMixin, RoleAssignmentMixin, TestCase):
         )
         self.assertEqual(len(result), 0)
 
+    def test_ancestors_of(self):
+        """Test ancestors_of()"""
+        self.assertEqual(
+            list(Project.objects.ancestors_of(self.project_sub)),
+            [self.category_top, self.category_sub],
+        )
+        self.assertEqual(
+            list(Project.objects.ancestors_of(self.category_top)), []
+        )
+
+    def test_ancestors_of_include_self(self):
+        """Test ancestors_of() with include_self=True"""
+        self.assertEqual(
+            list(
+                Project.objects.ancestors_of(
+                    self.project_sub, include_self=True
+                )
+            ),
+            [self.category_top, self.category_sub, self.project_sub],
+        )
+
+    def test_descendants_of(self):
+        """Test descendants_of()"""
+        self.assertEqual(
+            list(
+                Project.objects.descendants_of(self.category_top).order_by(
+                    'full_title'
+                )
+            ),
+            [self.project, self.category_sub, self.project_sub],
+        )
+        self.assertEqual(
+            list(Project.objects.descendants_of(self.category_sub)),
+            [self.project_sub],
+        )
+        self.assertEqual(
+            list(Project.objects.descendants_of(self.project_sub)), []
+        )
+
+    def test_descendants_of_include_self(self):
+        """Test descendants_of() with include_self=True"""
+        self.assertEqual(
+            list(
+                Project.objects.descendants_of(
+                    self.category_sub, include_self=True
+                ).order_by('full_title')
+            ),
+            [self.category_sub, self.project_sub],
+        )
+
+    def test_descendants_of_similar_title(self):
+        """Test descendants_of() with similarly titled category"""
+        self.make_project(
+            title='TestCategory2', type=PROJECT_TYPE_CATEGORY, parent=None
+        )
+        self.assertEqual(
+            Project.objects.descendants_of(self.category_top).count(), 3
+        )
+
+
+class TestProjectAncestor(ProjectMixin, TestCase):
+    """Tests for ProjectAncestor"""
+
+    def _get_links(self) -> list[tuple]:
+        """Return all ancestry links as sorted tuples"""
+        return sorted(
+            (a.ancestor.title, a.descendant.title, a.depth)
+            for a in ProjectAncestor.objects.all()
+        )
+
+    def setUp(self):
+        self.category = self.make_project(
+            title='TestCategory', type=PROJECT_TYPE_CATEGORY, parent=None
+        )
+        self.sub_category = self.make_project(
+            title='SubCategory',
+            type=PROJECT_TYPE_CATEGORY,
+            parent=self.category,
+        )
+        self.project = self.make_project(
+            title='TestProject',
+            type=PROJECT_TYPE_PROJECT,
+            parent=self.sub_category,
+        )
+
+    def test_create(self):
+        """Test ancestry after creating projects"""
+        self.assertEqual(
+            self._get_links(),
+            [
+                ('SubCategory', 'SubCategory', 0),
+                ('SubCategory', 'TestProject', 1),
+                ('TestCategory', 'SubCategory', 1),
+                ('TestCategory', 'TestCategory', 0),
+                ('TestCategory', 'TestProject', 2),
+                ('TestProject', 'TestProject', 0),
+            ],
+        )
+
+    def test_move(self):
+        """Test ancestry after moving category"""
+        category = self.make_project(
+            title='NewCategory', type=PROJECT_TYPE_CATEGORY, parent=None
+        )
+        self.sub_category.parent = category
+        self.sub_category.save()
+        self.assertEqual(
+            self._get_links(),
+            [
+                ('NewCategory', 'NewCategory', 0),
+                ('NewCategory', 'SubCategory', 1),
+                ('NewCategory', 'TestProject', 2),
+                ('SubCategory', 'SubCategory', 0),
+                ('SubCategory', 'TestProject', 1),
+                ('TestCategory', 'TestCategory', 0),
+                ('TestProject', 'TestProject', 0),
+            ],
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(
+            self.project.get_parents(), [category, self.sub_category]
+        )
+
+    def test_move_top(self):
+        """Test ancestry after moving category to top level"""
+        self.sub_category.parent = None
+        self.sub_category.save()
+        self.assertEqual(
+            self._get_links(),
+            [
+                ('SubCategory', 'SubCategory', 0),
+                ('SubCategory', 'TestProject', 1),
+                ('TestCategory', 'TestCategory', 0),
+                ('TestProject', 'TestProject', 0),
+            ],
+        )
+
+    def test_delete(self):
+        """Test ancestry after deleting project"""
+        self.project.delete()
+        self.assertEqual(ProjectAncestor.objects.count(), 3)
+
 
 class TestProjectAppSetting(
     ProjectMixin, RoleAssignmentMixin, AppSettingMixin, TestCase
@@ -1819,6 +2374,16 @@ class TestSODARUser(TestCase):
         """Test default enable_update value"""
         self.assertEqual(self.user.enable_update, True)
 
+    def test_search_text(self):
+        """Test search_text generation"""
+        self.user.name = 'Full Name'
+        self.user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(
+            self.user.search_text.split(),
+            ['testuser', 'Full', 'Name', self.user.email],
+        )
+
     def test__str__(self):
         """Test SODARUser __str__()"""
         self.assertEqual(
@@ -1059,6 +1059,95 @@ class TestRoleAssignmentCreateAPIView(ProjectrolesAPIPermissionTestBase):
         )
 
 
+class TestRoleAssignmentBulkCreateAPIView(ProjectrolesAPIPermissionTestBase):
+    """Tests for RoleAssignmentBulkCreateAPIView permissions"""
+
+    def _cleanup(self):
+        RoleAssignment.objects.filter(
+            project=self.project,
+            role__name=SODAR_CONSTANTS['PROJECT_ROLE_CONTRIBUTOR'],
+            user=self.assign_user,
+        ).delete()
+
+    def setUp(self):
+        super().setUp()
+        self.assign_user = self.make_user('assign_user')
+        self.url = reverse('projectroles:api_role_bulk_create')
+        self.post_data = {
+            'roles': [
+                {
+                    'project': str(self.project.sodar_uuid),
+                    'user': str(self.assign_user.sodar_uuid),
+                    'role': SODAR_CONSTANTS['PROJECT_ROLE_CONTRIBUTOR'],
+                }
+            ]
+        }
+        self.good_users = [
+            self.superuser,
+            self.user_owner_cat,
+            self.user_delegate_cat,
+            self.user_owner,
+            self.user_delegate,
+        ]
+        self.bad_users = [
+            self.user_contributor_cat,
+            self.user_guest_cat,
+            self.user_viewer_cat,
+            self.user_finder_cat,
+            self.user_contributor,
+            self.user_guest,
+            self.user_viewer,
+            self.user_no_roles,
+        ]
+
+    def test_post(self):
+        """Test RoleAssignmentBulkCreateAPIView POST"""
+        self.assert_response_api(
+            self.url,
+            self.good_users,
+            201,
+            method='POST',
+            data=self.post_data,
+            cleanup_method=self._cleanup,
+        )
+        self.assert_response_api(
+            self.url, self.bad_users, 403, method='POST', data=self.post_data
+        )
+        self.assert_response_api(
+            self.url, self.anonymous, 401, method='POST', data=self.post_data
+        )
+        self.assert_response_api(
+            self.url,
+            self.good_users,
+            201,
+            method='POST',
+            data=self.post_data,
+            knox=True,
+            cleanup_method=self._cleanup,
+        )
+        self.assert_response_api(
+            self.url,
+            self.bad_users,
+            403,
+            method='POST',
+            data=self.post_data,
+            knox=True,
+        )
+
+    @override_settings(PROJECTROLES_ALLOW_ANONYMOUS=True)
+    def test_post_anon(self):
+        """Test POST with anonymous access"""
+        for role in self.guest_roles:
+            self.project.set_public_access(role)
+            self.assert_response_api(
+                self.url,
+                self.anonymous,
+                401,
+                method='POST',
+                data=self.post_data,
+            )
+
+
 class TestRoleAssignmentUpdateAPIView(ProjectrolesAPIPermissionTestBase):
     """Tests for RoleAssignmentUpdateAPIView permissions"""
 
@@ -1,9 +1,17 @@
 """Tests for plugins in the projectroles Django app"""
 
+import time
+
+from django.test import override_settings
+
 from test_plus.test import TestCase
 
-from projectroles.models import SODAR_CONSTANTS
-from projectroles.plugins import PluginAppSettingDef
+from projectroles.models import Project, SODAR_CONSTANTS
+from projectroles.plugins import (
+    PluginAPI,
+    PluginAppSettingDef,
+    SEARCH_TIMEOUT_MSG,
+)
 
 # SODAR constants
 PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
@@ -32,6 +40,37 @@ DEF_JSON_VALUE = {
     'list': [1, 2, 3, 4, 5],
     'level_6': False,
 }
+SEARCH_TERMS = ['test']
+SEARCH_SLOW_TIME = 0.5
+SEARCH_TIMEOUT = 0.1
+
+
+class SearchTestPlugin:
+    """Plugin stub returning search results"""
+
+    name = 'search_test'
+
+    def search(self, search_terms, user, projects, **kwargs):
+        return ['result']
+
+
+class SearchTestSlowPlugin:
+    """Plugin stub returning search results after a delay"""
+
+    name = 'search_test_slow'
+
+    def search(self, search_terms, user, projects, **kwargs):
+        time.sleep(SEARCH_SLOW_TIME)
+        return ['slow_result']
+
+
+class SearchTestErrorPlugin:
+    """Plugin stub raising an exception in search"""
+
+    name = 'search_test_error'
+
+    def search(self, search_terms, user, projects, **kwargs):
+        raise Exception('Search failed')
 
 
 class TestPluginAppSettingDef(TestCase):
@@ -57,6 +96,7 @@ class TestPluginAppSettingDef(TestCase):
             'global_edit': False,
             'project_types': [PROJECT_TYPE_PROJECT],
             'widget_attrs': {},
+            'cache_default': False,
         }
         self.assertEqual(s_def.__dict__, expected)
 
@@ -89,6 +129,7 @@ class TestPluginAppSettingDef(TestCase):
             'global_edit': True,
             'project_types': [PROJECT_TYPE_PROJECT, PROJECT_TYPE_CATEGORY],
             'widget_attrs': DEF_WIDGET_ATTRS,
+            'cache_default': False,
         }
         self.assertEqual(s_def.__dict__, expected)
 
@@ -294,3 +335,129 @@ class TestPluginAppSettingDef(TestCase):
                 default=True,
                 user_modifiable=True,
             )
+
+
+class TestPluginAPISearch(TestCase):
+    """Tests for PluginAPI.search_plugins()"""
+
+    def setUp(self):
+        self.plugin_api = PluginAPI()
+        self.user = self.make_user('user')
+        self.projects = Project.objects.none()
+
+    def _search(self, plugins):
+        return self.plugin_api.search_plugins(
+            plugins, SEARCH_TERMS, self.user, self.projects
+        )
+
+    @override_settings(PROJECTROLES_SEARCH_MAX_WORKERS=2)
+    def test_search(self):
+        """Test search_plugins()"""
+        ret = self._search([SearchTestPlugin(), SearchTestErrorPlugin()])
+        self.assertEqual(
+            ret,
+            {
+                'search_test': (None, ['result']),
+                'search_test_error': ('Search failed', []),
+            },
+        )
+
+    @override_settings(
+        PROJECTROLES_SEARCH_MAX_WORKERS=2,
+        PROJECTROLES_SEARCH_TIMEOUT=SEARCH_TIMEOUT,
+    )
+    def test_search_timeout(self):
+        """Test search_plugins() with timed out plugin"""
+        start = time.monotonic()
+        ret = self._search([SearchTestSlowPlugin(), SearchTestPlugin()])
+        self.assertLess(time.monotonic() - start, SEARCH_SLOW_TIME)
+        self.assertEqual(
+            ret,
+            {
+                'search_test_slow': (
+                    SEARCH_TIMEOUT_MSG.format(timeout=SEARCH_TIMEOUT),
+                    [],
+                ),
+                'search_test': (None, ['result']),
+            },
+        )
+
+    @override_settings(
+        PROJECTROLES_SEARCH_MAX_WORKERS=3,
+        PROJECTROLES_SEARCH_TIMEOUT=SEARCH_SLOW_TIME * 3,
+    )
+    def test_search_concurrent(self):
+        """Test search_plugins() with multiple slow plugins"""
+        plugins = [SearchTestSlowPlugin(), SearchTestSlowPlugin()]
+        plugins[1].name = 'search_test_slow2'
+        start = time.monotonic()
+        ret = self._search(plugins)
+        # Plugins should be searched concurrently
+        self.assertLess(time.monotonic() - start, SEARCH_SLOW_TIME * 2)
+        self.assertEqual(ret['search_test_slow'], (None, ['slow_result']))
+        self.assertEqual(ret['search_test_slow2'], (None, ['slow_result']))
+
+    @override_settings(
+        PROJECTROLES_SEARCH_MAX_WORKERS=2,
+        PROJECTROLES_SEARCH_TIMEOUT=SEARCH_TIMEOUT,
+    )
+    def test_search_timeout_single(self):
+        """Test search_plugins() with single timed out plugin"""
+        start = time.monotonic()
+        ret = self._search([SearchTestSlowPlugin()])
+        self.assertLess(time.monotonic() - start, SEARCH_SLOW_TIME)
+        self.assertEqual(
+            ret['search_test_slow'],
+            (SEARCH_TIMEOUT_MSG.format(timeout=SEARCH_TIMEOUT), []),
+        )
+
+    @override_settings(
+        PROJECTROLES_SEARCH_MAX_WORKERS=2,
+        PROJECTROLES_SEARCH_TIMEOUT=SEARCH_TIMEOUT,
+    )
+    def test_search_timeout_plugin(self):
+        """Test search_plugins() with plugin timeout override"""
+        plugin = SearchTestSlowPlugin()
+        plugin.search_timeout = SEARCH_SLOW_TIME * 3
+        ret = self._search([plugin])
+        self.assertEqual(ret['search_test_slow'], (None, ['slow_result']))
+
+    @override_settings(
+        PROJECTROLES_SEARCH_MAX_WORKERS=1,
+        PROJECTROLES_SEARCH_TIMEOUT=SEARCH_SLOW_TIME * 1.5,
+    )
+    def test_search_timeout_queued(self):
+        """Test search_plugins() with plugin waiting for worker"""
+        plugins = [SearchTestSlowPlugin(), SearchTestSlowPlugin()]
+        plugins[1].name = 'search_test_slow2'
+        ret = self._search(plugins)
+        # Timeout should not include time spent waiting for worker
+        self.assertEqual(ret['search_test_slow'], (None, ['slow_result']))
+        self.assertEqual(ret['search_test_slow2'], (None, ['slow_result']))
+
+    @override_settings(
+        PROJECTROLES_SEARCH_MAX_WORKERS=1,
+        PROJECTROLES_SEARCH_TIMEOUT=SEARCH_TIMEOUT,
+    )
+    def test_search_timeout_blocked(self):
+        """Test search_plugins() with worker taken by timed out plugin"""
+        start = time.monotonic()
+        ret = self._search([SearchTestSlowPlugin(), SearchTestPlugin()])
+        self.assertLess(time.monotonic() - start, SEARCH_SLOW_TIME)
+        msg = SEARCH_TIMEOUT_MSG.format(timeout=SEARCH_TIMEOUT)
+        self.assertEqual(
+            ret,
+            {'search_test_slow': (msg, []), 'search_test': (msg, [])},
+        )
+
+    @override_settings(PROJECTROLES_SEARCH_MAX_WORKERS=0)
+    def test_search_no_workers(self):
+        """Test search_plugins() with searching in current thread"""
+        ret = self._search([SearchTestPlugin(), SearchTestSlowPlugin()])
+        self.assertEqual(
+            ret,
+            {
+                'search_test': (None, ['result']),
+                'search_test_slow': (None, ['slow_result']),
+            },
+        )
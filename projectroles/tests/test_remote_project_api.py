@@ -1102,6 +1102,7 @@ class TestSyncRemoteDataCreate(SyncRemoteDataTestBase):
             'archive': False,
             'full_title': SOURCE_CATEGORY_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': uuid.UUID(SOURCE_CATEGORY_UUID),
         }
         model_dict = model_to_dict(category_obj)
@@ -1119,6 +1120,7 @@ class TestSyncRemoteDataCreate(SyncRemoteDataTestBase):
             'archive': False,
             'full_title': SOURCE_PROJECT_FULL_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': uuid.UUID(SOURCE_PROJECT_UUID),
         }
         model_dict = model_to_dict(project_obj)
@@ -1467,6 +1469,7 @@ class TestSyncRemoteDataCreate(SyncRemoteDataTestBase):
             'archive': False,
             'full_title': SOURCE_CATEGORY_TITLE + ' / ' + new_project_title,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': uuid.UUID(new_project_uuid),
         }
         model_dict = model_to_dict(new_project_obj)
@@ -2033,6 +2036,7 @@ class TestSyncRemoteDataUpdate(
             'archive': False,
             'full_title': SOURCE_CATEGORY_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': uuid.UUID(SOURCE_CATEGORY_UUID),
         }
         model_dict = model_to_dict(self.category_obj)
@@ -2050,6 +2054,7 @@ class TestSyncRemoteDataUpdate(
             'archive': False,
             'full_title': SOURCE_PROJECT_FULL_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': uuid.UUID(SOURCE_PROJECT_UUID),
         }
         model_dict = model_to_dict(self.project_obj)
@@ -2611,6 +2616,7 @@ class TestSyncRemoteDataUpdate(
             'archive': False,
             'full_title': SOURCE_CATEGORY_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': uuid.UUID(SOURCE_CATEGORY_UUID),
         }
         model_dict = model_to_dict(self.category_obj)
@@ -2638,6 +2644,7 @@ class TestSyncRemoteDataUpdate(
             'archive': False,
             'full_title': SOURCE_PROJECT_FULL_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': uuid.UUID(SOURCE_PROJECT_UUID),
         }
         model_dict = model_to_dict(self.project_obj)
@@ -383,6 +383,76 @@ class TestHomeView(ProjectUITestBase):
             elem.find_element(By.CLASS_NAME, 'sodar-pr-project-findable')
         )
 
+    def test_project_list_expand(self):
+        """Test loading category children on expand"""
+        new_cat = self.make_project('NewCategory', PROJECT_TYPE_CATEGORY, None)
+        self.make_assignment(new_cat, self.user_owner, self.role_owner)
+        self.login_and_redirect(self.user_owner, self.url, **self.wait_kwargs)
+        # Only top level should be loaded
+        self.assertEqual(self._get_item_vis_count(), 2)
+        with self.assertRaises(NoSuchElementException):
+            self._get_project_row(self.project)
+        # No expand link for category without children
+        with self.assertRaises(NoSuchElementException):
+            self._get_project_row(new_cat).find_element(
+                By.CLASS_NAME, 'sodar-pr-project-list-expand'
+            )
+        link = self._get_project_row(self.category).find_element(
+            By.CLASS_NAME, 'sodar-pr-project-list-expand'
+        )
+        self.assertEqual(link.get_attribute('data-children'), '1')
+        link.click()
+        WebDriverWait(self.selenium, self.wait_time).until(
+            ec.presence_of_element_located(
+                (By.ID, f'sodar-pr-project-list-item-{self.project.sodar_uuid}')
+            )
+        )
+        self.assertEqual(self._get_item_vis_count(), 3)
+        elems = self.selenium.find_elements(
+            By.CLASS_NAME, 'sodar-pr-project-list-item'
+        )
+        self.assertEqual(
+            [e.get_attribute('data-uuid') for e in elems],
+            [
+                str(new_cat.sodar_uuid),
+                str(self.category.sodar_uuid),
+                str(self.project.sodar_uuid),
+            ],
+        )
+        # Collapse
+        self._get_project_row(self.category).find_element(
+            By.CLASS_NAME, 'sodar-pr-project-list-expand'
+        ).click()
+        self.assertEqual(self._get_item_vis_count(), 2)
+        with self.assertRaises(NoSuchElementException):
+            self._get_project_row(self.project)
+
+    def test_project_list_expand_single(self):
+        """Test automatically expanding single top level category"""
+        self.login_and_redirect(self.user_owner, self.url, **self.wait_kwargs)
+        self.assertEqual(self._get_item_vis_count(), 2)
+        link = self._get_project_row(self.category).find_element(
+            By.CLASS_NAME, 'sodar-pr-project-list-expand'
+        )
+        self.assertEqual(link.get_attribute('data-expanded'), '1')
+
+    def test_project_list_filter_collapsed(self):
+        """Test filtering project list items with collapsed category"""
+        new_cat = self.make_project('NewCategory', PROJECT_TYPE_CATEGORY, None)
+        self.make_assignment(new_cat, self.user_owner, self.role_owner)
+        self.login_and_redirect(self.user_owner, self.url, **self.wait_kwargs)
+        self.assertEqual(self._get_item_vis_count(), 2)
+        f_input = self.selenium.find_element(
+            By.ID, 'sodar-pr-project-list-filter'
+        )
+        f_input.send_keys('testproject')
+        WebDriverWait(self.selenium, self.wait_time).until(
+            ec.presence_of_element_located(
+                (By.ID, f'sodar-pr-project-list-item-{self.project.sodar_uuid}')
+            )
+        )
+        self.assertEqual(self._get_item_vis_count(), 1)
+
     def test_project_list_filter(self):
         """Test filtering project list items"""
         self.login_and_redirect(self.user_owner, self.url, **self.wait_kwargs)
@@ -717,7 +787,7 @@ class TestHomeView(ProjectUITestBase):
         # Create additional categories to fill first page
         for i in range(1, 10):
             c = self.make_project(
-                f'Additional Category {i}', PROJECT_TYPE_CATEGORY, None
+                f'Additional Category {i}', PROJECT_TYPE_CATEGORY, self.category
             )
             self.make_assignment(c, self.user_owner, self.role_owner)
         self.login_and_redirect(self.user_owner, self.url, **self.wait_kwargs)
@@ -728,7 +798,7 @@ class TestHomeView(ProjectUITestBase):
         """Test project list pagination updating on second page"""
         for i in range(1, 10):
             c = self.make_project(
-                f'Additional Category {i}', PROJECT_TYPE_CATEGORY, None
+                f'Additional Category {i}', PROJECT_TYPE_CATEGORY, self.category
             )
             self.make_assignment(c, self.user_owner, self.role_owner)
         self.login_and_redirect(self.user_owner, self.url, **self.wait_kwargs)
@@ -766,7 +836,7 @@ class TestHomeView(ProjectUITestBase):
         """Test project list pagination control"""
         for i in range(1, 10):
             c = self.make_project(
-                f'Additional Category {i}', PROJECT_TYPE_CATEGORY, None
+                f'Additional Category {i}', PROJECT_TYPE_CATEGORY, self.category
             )
             self.make_assignment(c, self.user_owner, self.role_owner)
         self.assertEqual(
@@ -814,7 +884,7 @@ class TestHomeView(ProjectUITestBase):
         )
         for i in range(1, 10):
             c = self.make_project(
-                f'Additional Category {i}', PROJECT_TYPE_CATEGORY, None
+                f'Additional Category {i}', PROJECT_TYPE_CATEGORY, self.category
             )
             self.make_assignment(c, self.user_owner, self.role_owner)
         self.login_and_redirect(self.user_owner, self.url, **self.wait_kwargs)
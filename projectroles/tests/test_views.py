@@ -1249,6 +1249,7 @@ class TestProjectCreateView(
             'archive': False,
             'full_title': NEW_CAT_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': category.sodar_uuid,
         }
         model_dict = model_to_dict(category)
@@ -1308,6 +1309,7 @@ class TestProjectCreateView(
             'archive': False,
             'full_title': 'TestCategory / TestProject',
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': project.sodar_uuid,
         }
         model_dict = model_to_dict(project)
@@ -2031,6 +2033,7 @@ class TestProjectUpdateView(
             'archive': False,
             'full_title': category_new.title + CAT_DELIMITER + 'updated title',
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': self.project.sodar_uuid,
         }
         model_dict = model_to_dict(self.project)
@@ -2120,6 +2123,7 @@ class TestProjectUpdateView(
             'archive': False,
             'full_title': category_new.title + CAT_DELIMITER + 'updated title',
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': self.project.sodar_uuid,
         }
         model_dict = model_to_dict(self.project)
@@ -2241,6 +2245,7 @@ class TestProjectUpdateView(
             'archive': False,
             'full_title': 'updated title',
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': self.category.sodar_uuid,
         }
         model_dict = model_to_dict(self.category)
@@ -2,6 +2,7 @@
 
 import json
 
+from django.contrib.auth import get_user_model
 from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
@@ -20,9 +21,11 @@ from projectroles.tests.test_models import (
     RemoteProjectMixin,
 )
 from projectroles.utils import build_secret
+from projectroles.views_ajax import USER_AUTOCOMPLETE_LIMIT
 
 from filesfolders.tests.test_models import FileMixin
 
+from timeline.models import TimelineEvent
 from timeline.tests.test_models import (
     TimelineEventMixin,
     TimelineEventStatusMixin,
@@ -31,6 +34,7 @@ from timeline.tests.test_models import (
 app_links = AppLinkAPI()
 app_settings = AppSettingAPI()
 plugin_api = PluginAPI()
+User = get_user_model()
 
 # SODAR constants
 PROJECT_TYPE_CATEGORY = SODAR_CONSTANTS['PROJECT_TYPE_CATEGORY']
@@ -50,26 +54,28 @@ class TestProjectListAjaxView(
     """Tests for ProjectListAjaxView"""
 
     def setUp(self):
-        super().setUp()
-        self.user_owner_cat = self.make_user('user_owner_cat')
-        self.user_contributor_cat = self.make_user('user_contributor_cat')
-        self.user_owner = self.make_user('user_owner')
-        self.user_no_roles = self.make_user('user_no_roles')
-        self.category = self.make_project(
-            'TestCategory', PROJECT_TYPE_CATEGORY, None
-        )
-        self.owner_as_cat = self.make_assignment(
-            self.category, self.user_owner_cat, self.role_owner
-        )
-        self.project = self.make_project(
-            'TestProject', PROJECT_TYPE_PROJECT, self.category
-        )
-        self.owner_as = self.make_assignment(
-            self.project, self.user_owner, self.role_owner
-        )
-        self.cat_contributor_as = self.make_assignment(
-            self.project, self.user_contributor_cat, self.role_contributor
-        )
+        # Commit setup data to enable ETags
+        with self.captureOnCommitCallbacks(execute=True):
+            super().setUp()
+            self.user_owner_cat = self.make_user('user_owner_cat')
+            self.user_contributor_cat = self.make_user('user_contributor_cat')
+            self.user_owner = self.make_user('user_owner')
+            self.user_no_roles = self.make_user('user_no_roles')
+            self.category = self.make_project(
+                'TestCategory', PROJECT_TYPE_CATEGORY, None
+            )
+            self.owner_as_cat = self.make_assignment(
+                self.category, self.user_owner_cat, self.role_owner
+            )
+            self.project = self.make_project(
+                'TestProject', PROJECT_TYPE_PROJECT, self.category
+            )
+            self.owner_as = self.make_assignment(
+                self.project, self.user_owner, self.role_owner
+            )
+            self.cat_contributor_as = self.make_assignment(
+                self.project, self.user_contributor_cat, self.role_contributor
+            )
         self.url = reverse('projectroles:ajax_project_list')
 
     def test_get(self):
@@ -143,6 +149,141 @@ class TestProjectListAjaxView(
         }
         self.assertEqual(response.data, expected)
 
+    def test_get_depth(self):
+        """Test GET with depth"""
+        with self.login(self.user):
+            response = self.client.get(self.url + '?depth=1')
+        self.assertEqual(response.status_code, 200)
+        pd = response.data['projects']
+        self.assertEqual(len(pd), 1)
+        self.assertEqual(pd[0]['uuid'], str(self.category.sodar_uuid))
+        self.assertEqual(pd[0]['children'], 1)
+        self.assertNotIn('project_count', response.data)
+        self.assertEqual(response.data['total_count'], 2)
+        self.assertEqual(response.data['starred_count'], 0)
+
+    def test_get_depth_parent(self):
+        """Test GET with depth and parent"""
+        sub_cat = self.make_project(
+            'SubCategory', PROJECT_TYPE_CATEGORY, self.category
+        )
+        self.make_project('SubProject', PROJECT_TYPE_PROJECT, sub_cat)
+        with self.login(self.user):
+            response = self.client.get(
+                self.url + '?parent={}&depth=1'.format(self.category.sodar_uuid)
+            )
+        self.assertEqual(response.status_code, 200)
+        pd = response.data['projects']
+        self.assertEqual(
+            [p['uuid'] for p in pd],
+            [str(sub_cat.sodar_uuid), str(self.project.sodar_uuid)],
+        )
+        self.assertEqual(pd[0]['children'], 1)
+        self.assertNotIn('children', pd[1])
+        self.assertEqual(response.data['parent_depth'], 1)
+
+    def test_get_depth_no_roles(self):
+        """Test GET with depth as user with role in one child"""
+        new_project = self.make_project(
+            'NewProject', PROJECT_TYPE_PROJECT, self.category
+        )
+        self.make_assignment(new_project, self.user_no_roles, self.role_guest)
+        with self.login(self.user_no_roles):
+            response = self.client.get(self.url + '?depth=1')
+        self.assertEqual(response.status_code, 200)
+        pd = response.data['projects']
+        self.assertEqual(len(pd), 1)
+        self.assertEqual(pd[0]['children'], 1)  # Only visible children
+
+    def test_get_limit(self):
+        """Test GET with offset and limit"""
+        with self.login(self.user):
+            response = self.client.get(self.url + '?offset=1&limit=1')
+        self.assertEqual(response.status_code, 200)
+        pd = response.data['projects']
+        self.assertEqual(len(pd), 1)
+        self.assertEqual(pd[0]['uuid'], str(self.project.sodar_uuid))
+        self.assertEqual(response.data['project_count'], 2)
+
+    def test_get_depth_invalid(self):
+        """Test GET with invalid depth (should fail)"""
+        with self.login(self.user):
+            response = self.client.get(self.url + '?depth=x')
+        self.assertEqual(response.status_code, 400)
+        with self.login(self.user):
+            response = self.client.get(self.url + '?depth=-1')
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_etag(self):
+        """Test GET with If-None-Match header"""
+        with self.login(self.user_owner):
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+            etag = response.headers['ETag']
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_etag_starred(self):
+        """Test GET with If-None-Match header and starred project"""
+        with self.login(self.user_owner):
+            response = self.client.get(self.url)
+            etag = response.headers['ETag']
+            app_settings.set(
+                APP_NAME,
+                'project_star',
+                True,
+                project=self.project,
+                user=self.user_owner,
+            )
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['projects'][1]['starred'], True)
+
+    def test_get_etag_block(self):
+        """Test GET with If-None-Match header and blocked project"""
+        with self.login(self.user_owner):
+            response = self.client.get(self.url)
+            etag = response.headers['ETag']
+            app_settings.set(
+                APP_NAME, 'project_access_block', True, project=self.project
+            )
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['projects'][1]['blocked'], True)
+
+    def test_get_etag_commit(self):
+        """Test GET with If-None-Match header and committed change"""
+        with self.login(self.user_owner):
+            response = self.client.get(self.url)
+            etag = response.headers['ETag']
+            with self.captureOnCommitCallbacks(execute=True):
+                app_settings.set(
+                    APP_NAME,
+                    'project_star',
+                    True,
+                    project=self.project,
+                    user=self.user_owner,
+                )
+                # No ETag should be returned for uncommitted changes
+                response = self.client.get(self.url)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn('ETag', response.headers)
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.data['projects'][1]['starred'], True)
+
+    def test_get_etag_parent(self):
+        """Test GET with If-None-Match header from different parent"""
+        with self.login(self.user_owner):
+            response = self.client.get(self.url)
+            etag = response.headers['ETag']
+            response = self.client.get(
+                self.url + '?parent=' + str(self.category.sodar_uuid),
+                HTTP_IF_NONE_MATCH=etag,
+            )
+        self.assertEqual(response.status_code, 200)
+
     def test_get_highlight(self):
         """Test GET with highlight app setting enabled"""
         app_settings.set(
@@ -1143,6 +1284,38 @@ class TestUserAutocompleteAjaxView(
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]['id'], str(self.user_owner.sodar_uuid))
 
+    def test_get_query(self):
+        """Test GET with query"""
+        with self.login(self.user):
+            response = self.client.get(self.url, {'q': 'OWNER'})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['id'], str(self.user_owner.sodar_uuid))
+
+    def test_get_query_name(self):
+        """Test GET with query for name"""
+        self.user_no_roles.name = 'Some Owner'
+        self.user_no_roles.save()
+        with self.login(self.user):
+            response = self.client.get(self.url, {'q': 'some own'})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['id'], str(self.user_no_roles.sodar_uuid))
+
+    def test_get_limit(self):
+        """Test GET with result limit"""
+        User.objects.bulk_create(
+            [User(username=f'user{i}') for i in range(USER_AUTOCOMPLETE_LIMIT)]
+        )
+        with self.login(self.user):
+            response = self.client.get(self.url, {'page': 5})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data['results']), 10)
+        self.assertEqual(data['pagination']['more'], False)
+
     def test_get_project_exclude(self):
         """Test GET with project_exclude scope"""
         data = {
@@ -1292,68 +1465,72 @@ class TestSearchResultsAjaxView(
     UIViewTestBase,
 ):
     def setUp(self):
-        super().setUp()
-        self.url = reverse('projectroles:ajax_search')
-        self.category = self.make_project(
-            'TestCategory', PROJECT_TYPE_CATEGORY, None
-        )
-        self.project = self.make_project(
-            'TestProject', PROJECT_TYPE_PROJECT, self.category
-        )
-        self.owner_as = self.make_assignment(
-            self.project, self.user, self.role_owner
-        )
-        self.plugins = [
-            p
-            for p in plugin_api.get_active_plugins(plugin_type='project_app')
-            if p.search_enable
-        ]
-        self.project2 = self.make_project(
-            'AnotherProject',
-            PROJECT_TYPE_PROJECT,
-            self.category,
-            description='xxx',
-        )
-        self.cat_owner_as = self.make_assignment(
-            self.project2, self.user, self.role_owner
-        )
-        self.event = self.make_event(
-            project=self.project2,
-            app=APP_NAME,
-            user=self.user,
-            event_name='test_event',
-            description='description',
-            classified=False,
-            extra_data={'test_key': 'test_val'},
-        )
-        self.make_event_status(
-            event=self.event,
-            status_type='SUBMIT',
-            description='SUBMIT',
-            extra_data={'test_key': 'test_val'},
-        )
-        self.file = self.make_file(
-            name='file.txt',
-            file_name='file.txt',
-            file_content=bytes('content'.encode('utf-8')),
-            project=self.project,
-            folder=None,
-            owner=self.user,
-            description='',
-            public_url=True,
-            secret=build_secret(),
-        )
-        self.other_file = self.make_file(
-            name='other file.txt',
-            file_name='other file.txt',
-            file_content=bytes('My name contains a space'.encode('utf-8')),
-            project=self.project,
-            folder=None,
-            owner=self.user,
-            description='',
-            public_url=True,
-            secret=build_secret(),
-        )
+        # Commit setup data to enable the search cache
+        with self.captureOnCommitCallbacks(execute=True):
+            super().setUp()
+            self.url = reverse('projectroles:ajax_search')
+            self.category = self.make_project(
+                'TestCategory', PROJECT_TYPE_CATEGORY, None
+            )
+            self.project = self.make_project(
+                'TestProject', PROJECT_TYPE_PROJECT, self.category
+            )
+            self.owner_as = self.make_assignment(
+                self.project, self.user, self.role_owner
+            )
+            self.plugins = [
+                p
+                for p in plugin_api.get_active_plugins(
+                    plugin_type='project_app'
+                )
+                if p.search_enable
+            ]
+            self.project2 = self.make_project(
+                'AnotherProject',
+                PROJECT_TYPE_PROJECT,
+                self.category,
+                description='xxx',
+            )
+            self.cat_owner_as = self.make_assignment(
+                self.project2, self.user, self.role_owner
+            )
+            self.event = self.make_event(
+                project=self.project2,
+                app=APP_NAME,
+                user=self.user,
+                event_name='test_event',
+                description='description',
+                classified=False,
+                extra_data={'test_key': 'test_val'},
+            )
+            self.make_event_status(
+                event=self.event,
+                status_type='SUBMIT',
+                description='SUBMIT',
+                extra_data={'test_key': 'test_val'},
+            )
+            self.file = self.make_file(
+                name='file.txt',
+                file_name='file.txt',
+                file_content=bytes('content'.encode('utf-8')),
+                project=self.project,
+                folder=None,
+                owner=self.user,
+                description='',
+                public_url=True,
+                secret=build_secret(),
+            )
+            self.other_file = self.make_file(
+                name='other file.txt',
+                file_name='other file.txt',
+                file_content=bytes('My name contains a space'.encode('utf-8')),
+                project=self.project,
+                folder=None,
+                owner=self.user,
+                description='',
+                public_url=True,
+                secret=build_secret(),
+            )
 
     def _get_app_results(self, user, terms, keywords={}):
         """Make a POST request to return app search results"""
@@ -1634,3 +1811,43 @@ class TestSearchResultsAjaxView(
         self.assertEqual(len(results['filesfolders'][0]['rows']), 2)
         self.assertEqual(len(results['timeline']), 1)
         self.assertEqual(len(results['timeline'][0]['rows']), 1)
+
+    def _post_cached(self, terms: list[str]) -> list[dict]:
+        """Make a POST request for timeline results as a logged in user"""
+        response = self.client.post(
+            self.url,
+            {
+                'terms': json.dumps(terms),
+                'keywords': '{}',
+                'plugin': 'timeline',
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results'][0]['rows']
+
+    def test_post_cache(self):
+        """Test POST with cached results"""
+        with self.login(self.user):
+            self.assertEqual(len(self._post_cached(['test_event'])), 1)
+            # Update without signals, cached results should be returned
+            TimelineEvent.objects.filter(pk=self.event.pk).update(
+                search_text=''
+            )
+            self.assertEqual(len(self._post_cached([' test_event'])), 1)
+
+    def test_post_cache_invalidate(self):
+        """Test POST with cached results after model update"""
+        with self.login(self.user):
+            self.assertEqual(len(self._post_cached(['test_event'])), 1)
+            self.event.delete()
+            self.assertEqual(len(self._post_cached(['test_event'])), 0)
+
+    @override_settings(PROJECTROLES_SEARCH_CACHE_EXCLUDE=['timeline'])
+    def test_post_cache_exclude(self):
+        """Test POST with plugin excluded from cache"""
+        with self.login(self.user):
+            self.assertEqual(len(self._post_cached(['test_event'])), 1)
+            TimelineEvent.objects.filter(pk=self.event.pk).update(
+                search_text=''
+            )
+            self.assertEqual(len(self._post_cached(['test_event'])), 0)
@@ -3,14 +3,17 @@
 import json
 
 from typing import Optional
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core import mail
+from django.db import connection
 from django.db.models import QuerySet
 from django.forms.models import model_to_dict
 
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -55,7 +58,7 @@ from projectroles.tests.test_views import (
     REMOTE_SITE_SECRET,
 )
 from projectroles.utils import build_secret
-from projectroles.views import PROJECT_BLOCK_MSG
+from projectroles.views import PROJECT_BLOCK_MSG, RoleAssignmentModifyMixin
 
 
 app_settings = AppSettingAPI()
@@ -113,8 +116,10 @@ class TestProjectListAPIView(ProjectrolesAPIViewTestBase):
     """Tests for ProjectListAPIView"""
 
     def setUp(self):
-        super().setUp()
-        self.user_new = self.make_user('user_new')
+        # Commit setup data to enable ETags
+        with self.captureOnCommitCallbacks(execute=True):
+            super().setUp()
+            self.user_new = self.make_user('user_new')
         self.url = reverse('projectroles:api_project_list')
 
     def test_get(self):
@@ -172,6 +177,58 @@ class TestProjectListAPIView(ProjectrolesAPIViewTestBase):
         ]
         self.assertEqual(response_data, expected)
 
+    def test_get_etag(self):
+        """Test GET with If-None-Match header"""
+        response = self.request_knox(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+        response = self.request_knox(
+            self.url, header={'HTTP_IF_NONE_MATCH': etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_get_etag_modified(self):
+        """Test GET with If-None-Match header and modified project"""
+        response = self.request_knox(self.url)
+        etag = response.headers['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.description = 'Updated description'
+            self.project.save()
+        response = self.request_knox(
+            self.url, header={'HTTP_IF_NONE_MATCH': etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_get_etag_role(self):
+        """Test GET with If-None-Match header and new role"""
+        token = self.get_token(self.user_new)
+        response = self.request_knox(self.url, token=token)
+        etag = response.headers['ETag']
+        self.make_assignment(self.project, self.user_new, self.role_guest)
+        response = self.request_knox(
+            self.url, token=token, header={'HTTP_IF_NONE_MATCH': etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)), 1)
+
+    def test_get_etag_role_other_user(self):
+        """Test GET with If-None-Match header and new role for other user"""
+        token = self.get_token(self.user_owner)
+        response = self.request_knox(self.url, token=token)
+        etag = response.headers['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            role_as = self.make_assignment(
+                self.project, self.user_new, self.role_guest
+            )
+        response = self.request_knox(
+            self.url, token=token, header={'HTTP_IF_NONE_MATCH': etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertIn(str(role_as.sodar_uuid), response_data[0]['roles'])
+
     def test_get_cat_owner(self):
         """Test GET as category owner"""
         response = self.request_knox(
@@ -319,6 +376,124 @@ class TestProjectListAPIView(ProjectrolesAPIViewTestBase):
         }
         self.assertEqual(response_data, expected)
 
+    def test_get_cursor(self):
+        """Test GET with cursor pagination"""
+        url = self.url + '?cursor='
+        response = self.request_knox(url)
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data['results']), 1)
+        self.assertEqual(
+            response_data['results'][0]['sodar_uuid'],
+            str(self.category.sodar_uuid),
+        )
+        self.assertIsNone(response_data['previous'])
+        self.assertNotIn('count', response_data)
+        # Follow next link
+        response = self.request_knox(
+            response_data['next'].replace(TEST_SERVER_URL, '')
+        )
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data['results']), 1)
+        self.assertEqual(
+            response_data['results'][0]['sodar_uuid'],
+            str(self.project.sodar_uuid),
+        )
+        self.assertIsNone(response_data['next'])
+        self.assertIsNotNone(response_data['previous'])
+
+    def test_get_cursor_owner(self):
+        """Test GET with cursor pagination as project owner"""
+        url = self.url + '?cursor='
+        response = self.request_knox(url, token=self.get_token(self.user_owner))
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data['results']), 1)
+        self.assertEqual(
+            response_data['results'][0]['sodar_uuid'],
+            str(self.project.sodar_uuid),
+        )
+        self.assertIsNone(response_data['next'])
+
+    def test_get_query_count(self):
+        """Test GET query count with multiple projects and roles"""
+        token = self.get_token(self.user_owner_cat)
+
+        def _get_query_count():
+            self.request_knox(self.url, token=token)  # Warm up caches
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.request_knox(self.url, token=token)
+            self.assertEqual(response.status_code, 200)
+            return len(json.loads(response.content)), len(ctx.captured_queries)
+
+        project_count, query_count = _get_query_count()
+        self.assertEqual(project_count, 2)
+        for i in range(5):
+            project = self.make_project(
+                f'Project{i}', PROJECT_TYPE_PROJECT, self.category
+            )
+            self.make_assignment(project, self.user_owner, self.role_owner)
+            self.make_assignment(project, self.user_new, self.role_guest)
+        project_count, new_query_count = _get_query_count()
+        self.assertEqual(project_count, 7)
+        self.assertEqual(new_query_count, query_count)
+
+    def test_get_fields(self):
+        """Test GET with fields query string"""
+        url = self.url + '?fields=sodar_uuid,full_title'
+        response = self.request_knox(url)
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        expected = [
+            {
+                'full_title': self.category.full_title,
+                'sodar_uuid': str(self.category.sodar_uuid),
+            },
+            {
+                'full_title': self.project.full_title,
+                'sodar_uuid': str(self.project.sodar_uuid),
+            },
+        ]
+        self.assertEqual(response_data, expected)
+
+    def test_get_fields_finder(self):
+        """Test GET with fields query string and finder role"""
+        self.make_assignment(self.category, self.user_new, self.role_finder)
+        url = self.url + '?fields=sodar_uuid,roles'
+        response = self.request_knox(url, token=self.get_token(self.user_new))
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data), 2)
+        self.assertEqual(set(response_data[0].keys()), {'sodar_uuid', 'roles'})
+        self.assertEqual(
+            response_data[1], {'sodar_uuid': str(self.project.sodar_uuid)}
+        )
+
+    def test_get_omit(self):
+        """Test GET with omit query string"""
+        url = self.url + '?omit=roles,children,readme'
+        response = self.request_knox(url)
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data), 2)
+        for p in response_data:
+            self.assertNotIn('roles', p)
+            self.assertNotIn('children', p)
+            self.assertNotIn('readme', p)
+            self.assertIn('full_title', p)
+            self.assertIn('sodar_uuid', p)
+
+    def test_get_fields_query_count(self):
+        """Test GET query count with fields query string"""
+        self.request_knox(self.url)  # Warm up caches
+        with CaptureQueriesContext(connection) as ctx:
+            self.request_knox(self.url)
+        query_count = len(ctx.captured_queries)
+        with CaptureQueriesContext(connection) as ctx:
+            self.request_knox(self.url + '?fields=sodar_uuid,full_title')
+        self.assertLess(len(ctx.captured_queries), query_count)
+
     def test_get_v1_1(self):
         """Test GET with API v1.1"""
         response = self.request_knox(self.url, version='1.1')
@@ -562,6 +737,7 @@ class TestProjectCreateAPIView(
             'archive': False,
             'full_title': new_category.title,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': new_category.sodar_uuid,
         }
         self.assertEqual(model_dict, expected)
@@ -616,6 +792,7 @@ class TestProjectCreateAPIView(
             + CAT_DELIMITER
             + new_category.title,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': new_category.sodar_uuid,
         }
         self.assertEqual(model_dict, expected)
@@ -685,6 +862,7 @@ class TestProjectCreateAPIView(
             + CAT_DELIMITER
             + new_project.title,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': new_project.sodar_uuid,
         }
         self.assertEqual(model_dict, expected)
@@ -1016,6 +1194,7 @@ class TestProjectUpdateAPIView(
             'archive': False,
             'full_title': UPDATED_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': self.category.sodar_uuid,
         }
         self.assertEqual(model_dict, expected)
@@ -1085,6 +1264,7 @@ class TestProjectUpdateAPIView(
             'archive': False,
             'full_title': self.category.title + CAT_DELIMITER + UPDATED_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': self.project.sodar_uuid,
         }
         self.assertEqual(model_dict, expected)
@@ -1145,6 +1325,7 @@ class TestProjectUpdateAPIView(
             'archive': False,
             'full_title': UPDATED_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': self.category.sodar_uuid,
         }
         self.assertEqual(model_dict, expected)
@@ -1200,6 +1381,7 @@ class TestProjectUpdateAPIView(
             'archive': False,
             'full_title': self.category.title + CAT_DELIMITER + UPDATED_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': self.project.sodar_uuid,
         }
         self.assertEqual(model_dict, expected)
@@ -1397,6 +1579,7 @@ class TestProjectUpdateAPIView(
             'archive': False,
             'full_title': self.category.title + CAT_DELIMITER + UPDATED_TITLE,
             'has_public_children': False,
+            'public_children_count': 0,
             'sodar_uuid': self.project.sodar_uuid,
         }
         self.assertEqual(model_dict, expected)
@@ -1806,6 +1989,328 @@ class TestRoleAssignmentCreateAPIView(
         )
 
 
+class TestRoleAssignmentBulkCreateAPIView(
+    RemoteSiteMixin, RemoteProjectMixin, ProjectrolesAPIViewTestBase
+):
+    """Tests for RoleAssignmentBulkCreateAPIView"""
+
+    @classmethod
+    def _get_bulk_tl(cls) -> QuerySet:
+        return TimelineEvent.objects.filter(event_name='role_bulk_create')
+
+    def _get_entry(
+        self, project: Project, user: User, role: str
+    ) -> dict[str, str]:
+        return {
+            'project': str(project.sodar_uuid),
+            'user': str(user.sodar_uuid),
+            'role': role,
+        }
+
+    def setUp(self):
+        super().setUp()
+        self.app_alert_model = plugin_api.get_backend_api(
+            'appalerts_backend'
+        ).get_model()
+        self.assign_user = self.make_user('assign_user')
+        self.assign_user2 = self.make_user('assign_user2')
+        self.url = reverse('projectroles:api_role_bulk_create')
+
+    def test_post(self):
+        """Test RoleAssignmentBulkCreateAPIView POST"""
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+        self.assertEqual(self._get_bulk_tl().count(), 0)
+        self.assertEqual(len(mail.outbox), 0)
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                ),
+                self._get_entry(
+                    self.project, self.assign_user2, PROJECT_ROLE_GUEST
+                ),
+                self._get_entry(
+                    self.category, self.assign_user, PROJECT_ROLE_GUEST
+                ),
+            ]
+        }
+        response = self.request_knox(self.url, method='POST', data=post_data)
+
+        self.assertEqual(response.status_code, 201, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 5)
+        role_as = RoleAssignment.objects.get(
+            project=self.project, user=self.assign_user
+        )
+        self.assertEqual(role_as.role, self.role_contributor)
+        self.assertEqual(
+            RoleAssignment.objects.get(
+                project=self.project, user=self.assign_user2
+            ).role,
+            self.role_guest,
+        )
+        self.assertEqual(
+            RoleAssignment.objects.get(
+                project=self.category, user=self.assign_user
+            ).role,
+            self.role_guest,
+        )
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data['roles']), 3)
+        expected = {
+            'project': str(self.project.sodar_uuid),
+            'role': PROJECT_ROLE_CONTRIBUTOR,
+            'user': str(self.assign_user.sodar_uuid),
+            'sodar_uuid': str(role_as.sodar_uuid),
+        }
+        self.assertEqual(response_data['roles'][0], expected)
+        # Effective roles should be updated
+        self.assertEqual(self.project.get_role(self.assign_user), role_as)
+        self.assertEqual(
+            self.project.get_role(self.assign_user, inherited_only=True).role,
+            self.role_guest,
+        )
+        # One timeline event per project
+        self.assertEqual(self._get_bulk_tl().count(), 2)
+        self.assertEqual(
+            self.app_alert_model.objects.filter(
+                alert_name='role_create'
+            ).count(),
+            3,
+        )
+        # One email per user
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_post_owner(self):
+        """Test POST with owner role (should fail)"""
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                ),
+                self._get_entry(
+                    self.project, self.assign_user2, PROJECT_ROLE_OWNER
+                ),
+            ]
+        }
+        response = self.request_knox(self.url, method='POST', data=post_data)
+        self.assertEqual(response.status_code, 400, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+        self.assertEqual(self._get_bulk_tl().count(), 0)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_post_existing(self):
+        """Test POST with existing role in project (should fail)"""
+        self.make_assignment(self.project, self.assign_user, self.role_guest)
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                ),
+                self._get_entry(
+                    self.project, self.assign_user2, PROJECT_ROLE_CONTRIBUTOR
+                ),
+            ]
+        }
+        response = self.request_knox(self.url, method='POST', data=post_data)
+        self.assertEqual(response.status_code, 400, msg=response.content)
+        self.assertIn(
+            f'in project (UUID={self.project.sodar_uuid})',
+            response.content.decode(),
+        )
+        self.assertEqual(RoleAssignment.objects.count(), 3)
+
+    def test_post_duplicate(self):
+        """Test POST with duplicate entries (should fail)"""
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                ),
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_GUEST
+                ),
+            ]
+        }
+        response = self.request_knox(self.url, method='POST', data=post_data)
+        self.assertEqual(response.status_code, 400, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+
+    def test_post_inherited_demote(self):
+        """Test POST with demoted role for user with inherited role (should fail)"""
+        self.make_assignment(
+            self.category, self.assign_user, self.role_delegate
+        )
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                )
+            ]
+        }
+        response = self.request_knox(self.url, method='POST', data=post_data)
+        self.assertEqual(response.status_code, 400, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 3)
+
+    def test_post_delegate_limit(self):
+        """Test POST with delegate limit exceeded in request (should fail)"""
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_DELEGATE
+                ),
+                self._get_entry(
+                    self.project, self.assign_user2, PROJECT_ROLE_DELEGATE
+                ),
+            ]
+        }
+        response = self.request_knox(self.url, method='POST', data=post_data)
+        self.assertEqual(response.status_code, 400, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+
+    def test_post_invalid_user(self):
+        """Test POST with invalid user UUID (should fail)"""
+        post_data = {
+            'roles': [
+                {
+                    'project': str(self.project.sodar_uuid),
+                    'user': INVALID_UUID,
+                    'role': PROJECT_ROLE_CONTRIBUTOR,
+                }
+            ]
+        }
+        response = self.request_knox(self.url, method='POST', data=post_data)
+        self.assertEqual(response.status_code, 400, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+
+    def test_post_no_perms(self):
+        """Test POST as owner without perms in one project (should fail)"""
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                ),
+                self._get_entry(
+                    self.category, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                ),
+            ]
+        }
+        response = self.request_knox(
+            self.url,
+            method='POST',
+            data=post_data,
+            token=self.get_token(self.user_owner),
+        )
+        self.assertEqual(response.status_code, 403, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+
+    def test_post_owner_user(self):
+        """Test POST as project owner"""
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                ),
+                self._get_entry(
+                    self.project, self.assign_user2, PROJECT_ROLE_GUEST
+                ),
+            ]
+        }
+        response = self.request_knox(
+            self.url,
+            method='POST',
+            data=post_data,
+            token=self.get_token(self.user_owner),
+        )
+        self.assertEqual(response.status_code, 201, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 4)
+        self.assertEqual(self._get_bulk_tl().count(), 1)
+
+    @override_settings(PROJECTROLES_SITE_MODE=SITE_MODE_TARGET)
+    def test_post_remote(self):
+        """Test POST for role in remote project (should fail)"""
+        source_site = self.make_site(
+            name=REMOTE_SITE_NAME,
+            url=REMOTE_SITE_URL,
+            mode=SITE_MODE_SOURCE,
+            description=REMOTE_SITE_DESC,
+            secret=REMOTE_SITE_SECRET,
+        )
+        self.make_remote_project(
+            project_uuid=self.project.sodar_uuid,
+            project=self.project,
+            site=source_site,
+            level=SODAR_CONSTANTS['REMOTE_LEVEL_READ_ROLES'],
+        )
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                )
+            ]
+        }
+        response = self.request_knox(self.url, method='POST', data=post_data)
+        self.assertEqual(response.status_code, 400, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+
+    def test_post_v2_0(self):
+        """Test POST with API version 2.0 (should fail)"""
+        post_data = {
+            'roles': [
+                self._get_entry(
+                    self.project, self.assign_user, PROJECT_ROLE_CONTRIBUTOR
+                )
+            ]
+        }
+        response = self.request_knox(
+            self.url, method='POST', data=post_data, version='2.0'
+        )
+        self.assertEqual(response.status_code, 406, msg=response.content)
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+
+    @override_settings(PROJECTROLES_ENABLE_MODIFY_API=True)
+    def test_create_assignments_bulk_modify_api_revert(self):
+        """Test create_assignments_bulk() with failed modify API call"""
+        calls = []
+
+        def _call_modify_api(method_name, revert_name, method_args):
+            calls.append((method_name, method_args[0]))
+            if (
+                method_name == 'perform_role_bulk_create'
+                and method_args[0] == self.project
+            ):
+                raise Exception('Test exception')
+
+        data = [
+            {
+                'project': self.category,
+                'user': self.assign_user,
+                'role': self.role_guest,
+            },
+            {
+                'project': self.project,
+                'user': self.assign_user2,
+                'role': self.role_guest,
+            },
+        ]
+        with patch.object(
+            RoleAssignmentModifyMixin,
+            'call_project_modify_api',
+            side_effect=_call_modify_api,
+        ):
+            with self.assertRaises(Exception):
+                RoleAssignmentModifyMixin().create_assignments_bulk(data)
+        # Actions for previously modified project should be reverted
+        self.assertEqual(
+            calls,
+            [
+                ('perform_role_bulk_create', self.category),
+                ('perform_role_bulk_create', self.project),
+                ('revert_role_bulk_create', self.category),
+            ],
+        )
+        self.assertEqual(RoleAssignment.objects.count(), 2)
+
+
 class TestRoleAssignmentUpdateAPIView(
     RemoteSiteMixin, RemoteProjectMixin, ProjectrolesAPIViewTestBase
 ):
@@ -3122,6 +3627,22 @@ class TestProjectSettingRetrieveAPIView(
         self.assertEqual(response_data, expected)
         self.assertIsInstance(AppSetting.objects.get(**q_kwargs), AppSetting)
 
+    def test_get_project_fields(self):
+        """Test GET with fields query string"""
+        setting_name = 'project_str_setting'
+        get_data = {
+            'plugin_name': APP_NAME_EX,
+            'setting_name': setting_name,
+            'fields': 'plugin_name,value',
+        }
+        response = self.request_knox(self.url, data=get_data)
+        self.assertEqual(response.status_code, 200, msg=response.content)
+        expected = {
+            'plugin_name': APP_NAME_EX,
+            'value': self.project_str_setting['value'],
+        }
+        self.assertEqual(json.loads(response.content), expected)
+
     def test_get_project_user(self):
         """Test GET with PROJECT_USER scope setting"""
         setting_name = 'project_user_str_setting'
@@ -3790,6 +4311,35 @@ class TestUserListAPIView(ProjectrolesAPIViewTestBase):
         ]
         self.assertEqual(response_data, expected)
 
+    def test_get_fields(self):
+        """Test GET with fields query string"""
+        url = self.url + '?fields=username'
+        response = self.request_knox(url)
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        expected = [
+            {'username': u.username}
+            for u in [
+                self.user,
+                self.user_owner_cat,
+                self.user_owner,
+                self.user_ldap,
+            ]
+        ]
+        self.assertEqual(response_data, expected)
+
+    def test_get_omit(self):
+        """Test GET with omit query string"""
+        url = self.url + '?omit=additional_emails,auth_type'
+        response = self.request_knox(url)
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.content)
+        self.assertEqual(len(response_data), 4)
+        expected = self.get_serialized_user(self.user)
+        expected.pop('additional_emails')
+        expected.pop('auth_type')
+        self.assertEqual(response_data[0], expected)
+
     def test_get_pagination(self):
         """Test GET with pagination"""
         url = self.url + '?page=1'
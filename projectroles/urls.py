@@ -286,6 +286,11 @@ urls_api = [
         view=views_api.RoleAssignmentCreateAPIView.as_view(),
         name='api_role_create',
     ),
+    path(
+        route='api/roles/bulk-create',
+        view=views_api.RoleAssignmentBulkCreateAPIView.as_view(),
+        name='api_role_bulk_create',
+    ),
     path(
         route='api/roles/update/<uuid:roleassignment>',
         view=views_api.RoleAssignmentUpdateAPIView.as_view(),
@@ -5,7 +5,7 @@ import logging
 import re
 import shlex
 
-from ipaddress import ip_address, ip_network
+from collections import defaultdict
 from typing import Any, Optional, Union
 from urllib.parse import unquote_plus, urlparse
 
@@ -35,6 +35,13 @@ from rules.contrib.views import PermissionRequiredMixin, redirect_to_login
 
 from projectroles import email
 from projectroles.app_settings import AppSettingAPI
+from projectroles.cache import (
+    bump_perm_generation,
+    clear_role_memo,
+    has_perm_cached,
+    PERM_GEN_PROJECT,
+    PERM_GEN_USER,
+)
 from projectroles.forms import (
     ProjectForm,
     RoleAssignmentForm,
@@ -44,10 +51,12 @@ from projectroles.forms import (
     RoleAssignmentOwnerTransferForm,
     LocalUserForm,
 )
+from projectroles.ip_access import check_ip_access
 from projectroles.models import (
     Project,
     Role,
     RoleAssignment,
+    EffectiveRole,
     ProjectInvite,
     RemoteSite,
     RemoteProject,
@@ -339,33 +348,8 @@ class ProjectPermissionMixin(PermissionRequiredMixin, ProjectAccessMixin):
             self.request.user.is_superuser
             or project.is_owner_or_delegate(self.request.user)
         )
-        if not perm_override and app_settings.get(
-            APP_NAME, 'ip_restrict', project
-        ):
-            for k in (
-                'HTTP_X_FORWARDED_FOR',
-                'X_FORWARDED_FOR',
-                'FORWARDED',
-                'REMOTE_ADDR',
-            ):
-                v = self.request.META.get(k)
-                if v:
-                    client_address = ip_address(v.split(',')[0])
-                    break
-            else:  # Can't fetch client IP address
-                return False
-
-            ips = app_settings.get(APP_NAME, 'ip_allow_list', project)
-            if not ips:
-                return False
-            for ip in [s.strip() for s in ips.split(',')]:
-                if '/' in ip:
-                    if client_address in ip_network(ip):
-                        break
-                elif client_address == ip_address(ip):
-                    break
-            else:
-                return False
+        if not perm_override and not check_ip_access(self.request, project):
+            return False
 
         # Disable project app access for categories unless specifically enabled
         if project.is_category():
@@ -379,7 +363,10 @@ class ProjectPermissionMixin(PermissionRequiredMixin, ProjectAccessMixin):
         # Disable access for non-owner/delegate if remote project is revoked
         if project.is_revoked() and not perm_override:
             return False
-        return super().has_permission()
+        return all(
+            has_perm_cached(self.request.user, perm, project)
+            for perm in self.get_permission_required()
+        )
 
     def get_queryset(self, *args, **kwargs):
         """
@@ -893,7 +880,7 @@ class ProjectModifyPluginViewMixin:
                 if revert_name:
                     for cp in called_plugins:
                         try:
-                            cp.getattr(revert_name)(*method_args)
+                            getattr(cp, revert_name)(*method_args)
                         except Exception as ex_revert:
                             logger.error(
                                 f'Exception in {method_name}() for plugin '
@@ -1036,10 +1023,13 @@ class ProjectModifyMixin(ProjectModifyPluginViewMixin):
                 }
 
         # Settings
+        old_values = app_settings.get_many(
+            [tuple(k.split('.')[1:3]) for k in project_settings.keys()],
+            project=project,
+            validate=False,
+        )
         for k, v in project_settings.items():
-            p_name = k.split('.')[1]
-            s_name = k.split('.')[2]
-            old_v = app_settings.get(p_name, s_name, project)
+            old_v = old_values[tuple(k.split('.')[1:3])]
             if old_v != v:
                 extra_data[k] = v
                 upd_fields.append(k)
@@ -1100,23 +1090,18 @@ class ProjectModifyMixin(ProjectModifyPluginViewMixin):
     def _update_settings(cls, project: Project, project_settings: dict):
         """Update project settings"""
         is_remote = project.is_remote()
+        values = {}
         for k, v in project_settings.items():
             _, plugin_name, setting_name = k.split('.', 3)
             # Skip updating global settings on target site
             if is_remote:
-                # TODO: Optimize (this can require a lot of queries)
                 s_def = app_settings.get_definition(
                     setting_name, plugin_name=plugin_name
                 )
                 if s_def.global_edit:
                     continue
-            app_settings.set(
-                plugin_name=k.split('.')[1],
-                setting_name=k.split('.')[2],
-                value=v,
-                project=project,
-                validate=True,
-            )
+            values[(plugin_name, setting_name)] = v
+        app_settings.set_many(values, project=project, validate=True)
 
     def _create_timeline_event(
         self,
@@ -1400,19 +1385,6 @@ class ProjectModifyMixin(ProjectModifyPluginViewMixin):
                 'perform_project_modify', 'revert_project_modify', args
             )
 
-        # If public access was updated, update has_public_children for parents
-        if (
-            old_project
-            and project.parent
-            and old_project.public_access != project.public_access
-        ):
-            try:
-                project._update_public_children()
-            except Exception as ex:
-                logger.error(
-                    f'Exception in updating has_public_children(): {ex}'
-                )
-
         # Once all is done, update timeline event, create alerts and emails
         if tl_event:
             tl_event.set_status(self._get_timeline_ok_status())
@@ -2144,6 +2116,134 @@ class RoleAssignmentModifyMixin(ProjectModifyPluginViewMixin):
                 )
         return role_as
 
+    @transaction.atomic
+    def create_assignments_bulk(
+        self,
+        data: list[dict],
+        request: Optional[HttpRequest] = None,
+        notify: bool = True,
+    ) -> list[RoleAssignment]:
+        """
+        Create multiple RoleAssignment objects in bulk. Expects data to be
+        validated beforehand. Creates one timeline event per project, calls
+        ProjectModifyPluginAPIMixin methods once per project if enabled in
+        your plugin and sends one email per user. If the methods fail for a
+        project, actions for previously modified projects are reverted.
+
+        :param data: List of dicts with project, user and role
+        :param request: Request initiating the action or None
+        :param notify: Add app alerts and send email if True (default=True)
+        :return: List of created RoleAssignment objects
+        """
+        app_alerts = plugin_api.get_backend_api('appalerts_backend')
+        timeline = plugin_api.get_backend_api('timeline_backend')
+        role_assignments = RoleAssignment.objects.bulk_create(
+            [
+                RoleAssignment(
+                    project=d['project'], user=d['user'], role=d['role']
+                )
+                for d in data
+            ]
+        )
+        # Update effective roles and caches, as save() is not called
+        EffectiveRole.objects.add_assignments(role_assignments)
+        clear_role_memo()
+        bump_perm_generation(
+            PERM_GEN_USER, list({a.user_id for a in role_assignments})
+        )
+        bump_perm_generation(
+            PERM_GEN_PROJECT, list({a.project_id for a in role_assignments})
+        )
+        project_roles = defaultdict(list)
+        for a in role_assignments:
+            project_roles[a.project].append(a)
+
+        modified = []
+        for project, p_roles in project_roles.items():
+            tl_event = None
+            if timeline:
+                tl_event = timeline.add_event(
+                    project=project,
+                    app_name=APP_NAME,
+                    user=request.user if request else None,
+                    event_name='role_bulk_create',
+                    description=f'create {len(p_roles)} roles in bulk',
+                    extra_data={
+                        'roles': [
+                            {
+                                'user': str(a.user.sodar_uuid),
+                                'username': a.user.username,
+                                'role': a.role.name,
+                            }
+                            for a in p_roles
+                        ]
+                    },
+                )
+            # Call for additional actions for role creation in plugins
+            if getattr(settings, 'PROJECTROLES_ENABLE_MODIFY_API', False):
+                args = [project, p_roles, request]
+                try:
+                    self.call_project_modify_api(
+                        'perform_role_bulk_create',
+                        'revert_role_bulk_create',
+                        args,
+                    )
+                except Exception:
+                    # Revert actions for projects modified before failure
+                    for m_args in modified:
+                        try:
+                            self.call_project_modify_api(
+                                'revert_role_bulk_create', None, m_args
+                            )
+                        except Exception:
+                            pass  # Logged in call_project_modify_api()
+                    raise
+                modified.append(args)
+            if tl_event:
+                tl_event.set_status('OK')
+
+        if not notify or not request:
+            return role_assignments
+        notify_roles = [a for a in role_assignments if a.user != request.user]
+        notify_settings = {
+            u: app_settings.get_many(
+                [
+                    (APP_NAME, 'notify_alert_role'),
+                    (APP_NAME, 'notify_email_role'),
+                ],
+                user=u,
+            )
+            for u in {a.user for a in notify_roles}
+        }
+        if app_alerts:
+            alert_users = defaultdict(list)
+            for a in notify_roles:
+                if notify_settings[a.user][(APP_NAME, 'notify_alert_role')]:
+                    alert_users[(a.project, a.role)].append(a.user)
+            for (project, role), users in alert_users.items():
+                app_alerts.add_alerts(
+                    app_name=APP_NAME,
+                    alert_name='role_create',
+                    users=users,
+                    message=ROLE_CREATE_MSG.format(
+                        project=project.title, role=role.name
+                    ),
+                    url=reverse(
+                        'projectroles:detail',
+                        kwargs={'project': project.sodar_uuid},
+                    ),
+                    project=project,
+                )
+        email_roles = [
+            a
+            for a in notify_roles
+            if SEND_EMAIL
+            and notify_settings[a.user][(APP_NAME, 'notify_email_role')]
+        ]
+        if email_roles:
+            email.send_role_bulk_create_mail(email_roles, request)
+        return role_assignments
+
 
 class RoleAssignmentModifyFormMixin(RoleAssignmentModifyMixin, ModelFormMixin):
     """Mixin for RoleAssignment creation and updating in Django form views"""
@@ -3678,10 +3778,12 @@ class SiteAppSettingsView(
 
     def form_valid(self, form):
         result = super().form_valid(form)
+        values = {}
         for k, v in form.cleaned_data.items():
             if k.startswith('settings.'):
                 _, plugin_name, setting_name = k.split('.', 3)
-                app_settings.set(plugin_name, setting_name, v)
+                values[(plugin_name, setting_name)] = v
+        app_settings.set_many(values)
         messages.success(self.request, SITE_SETTING_UPDATE_MSG)
         return result
 
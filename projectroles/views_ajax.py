@@ -6,13 +6,19 @@ import uuid
 
 from typing import Any, Optional
 
+from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator
-from django.db.models import Q, QuerySet
+from django.db.models import Count, Q, QuerySet
+from django.db.models.functions import Lower
 from django.http import JsonResponse, HttpResponseForbidden
 from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from dal import autocomplete
 
@@ -25,8 +31,15 @@ from rules.contrib.views import PermissionRequiredMixin
 
 from projectroles.app_links import AppLinkAPI
 from projectroles.app_settings import AppSettingAPI
+from projectroles.cache import (
+    get_project_list_etag,
+    get_search_cache_key,
+    get_search_cache_timeout,
+)
 from projectroles.models import (
+    EffectiveRole,
     Project,
+    ProjectAncestor,
     RoleAssignment,
     RemoteProject,
     AppSetting,
@@ -70,6 +83,7 @@ SITE_MODE_SOURCE = SODAR_CONSTANTS['SITE_MODE_SOURCE']
 # Local constants
 APP_NAME = 'projectroles'
 CAT_STAT_ATTRS = ['title', 'value', 'unit', 'description', 'icon', 'prefix']
+USER_AUTOCOMPLETE_LIMIT = 50
 
 
 # Base Classes and Mixins ------------------------------------------------------
@@ -132,7 +146,19 @@ class SODARBaseProjectAjaxView(ProjectAccessMixin, SODARBaseAjaxView):
 
 
 class ProjectListAjaxView(SODARBaseAjaxView):
-    """View to retrieve project list entries from the client"""
+    """
+    View to retrieve project list entries from the client.
+
+    Optional GET arguments:
+
+    - ``parent``: UUID of category under which projects are listed
+    - ``depth``: Number of levels to return under parent, includes visible
+      child counts for categories along with total and starred entry counts
+      under parent (int)
+    - ``offset`` and ``limit``: Return one page of entries (int)
+
+    Supports conditional requests with ``ETag`` and ``If-None-Match`` headers.
+    """
 
     allow_anonymous = True
 
@@ -142,7 +168,7 @@ class ProjectListAjaxView(SODARBaseAjaxView):
         user: User,
         public_stat_cats: list[Project],
         parent: Optional[Project] = None,
-    ) -> list[Project]:
+    ) -> QuerySet[Project]:
         """
         Return a flat list of categories and projects the user can view.
 
@@ -150,65 +176,82 @@ class ProjectListAjaxView(SODARBaseAjaxView):
         :param public_stat_cats: List of Project objects with
                                  category_public_stats enabled
         :param parent: Project object of type CATEGORY or None
+        :return: QuerySet of Project objects
         """
-        project_list = (
-            Project.objects.all()
-            .select_related('parent')
-            .order_by('full_title')
-        )
         # Filter out parents
-        parent_prefix = parent.full_title + CAT_DELIMITER if parent else None
-        if parent_prefix:
-            project_list = project_list.filter(
-                full_title__startswith=parent_prefix
+        if parent:
+            project_list = Project.objects.descendants_of(parent)
+        else:
+            project_list = Project.objects.all()
+        project_list = project_list.select_related('parent')
+        if user.is_superuser:
+            # No further querying needed for superuser
+            return project_list.order_by('full_title')
+        visible_q = (
+            Q(public_access__isnull=False)
+            | Q(has_public_children=True)
+            | Q(pk__in=[p.pk for p in public_stat_cats])
+        )
+        if user.is_authenticated:
+            # Local roles in project or any of its parent categories
+            # NOTE: Not using EffectiveRole here as that would exclude finder
+            #       role for projects under categories
+            visible_q |= Q(
+                pk__in=ProjectAncestor.objects.filter(
+                    ancestor__local_roles__user=user
+                ).values('descendant')
             )
-        # Get public stats cat UUIDs
-        stats_uuids = [p.sodar_uuid for p in public_stat_cats]
-        # Filter by user type
-        if user.is_anonymous:
-            project_list = project_list.filter(
-                Q(public_access__isnull=False)
-                | Q(has_public_children=True)
-                | Q(sodar_uuid__in=stats_uuids)
+        visible = project_list.filter(visible_q).values('pk')
+        # Include parent categories of visible projects for non-superusers
+        return project_list.filter(
+            Q(pk__in=visible)
+            | Q(
+                pk__in=ProjectAncestor.objects.filter(
+                    descendant__in=visible
+                ).values('ancestor')
             )
-        elif not user.is_superuser:
-            # Quick and dirty filtering for inheritance using full_title
-            # role_owner = Role.objects.filter(name=PROJECT_ROLE_OWNER).first()
-            role_cats = [
-                r.project.full_title + CAT_DELIMITER
-                for r in RoleAssignment.objects.filter(
-                    project__type=PROJECT_TYPE_CATEGORY,
-                    user=user,
-                )
-            ]
-            # NOTE: Not using get_role() here as that would exclude finder role
-            project_list = [
-                p
-                for p in project_list
-                if p.public_access
-                or p.has_public_children
-                or any(p.full_title.startswith(c) for c in role_cats)
-                or p.local_roles.filter(user=user).count() > 0
-                or p in public_stat_cats
-            ]
-        if user.is_superuser:
-            return project_list  # No further querying needed for superuser
+        ).order_by(Lower('full_title'))
 
-        # Populate final list with parent categories for non-superusers
-        ret = []
-        prev_parent = None
-        for p in project_list:
-            ret.append(p)
-            p_parent = p.parent
-            if p_parent == prev_parent or not p_parent or p_parent in ret:
-                continue  # Skip already collected parents
-            while p_parent and p_parent != parent:
-                if p_parent not in ret:
-                    ret.append(p_parent)
-                p_parent = p_parent.parent
-            prev_parent = p.parent
-        # Sort by full title
-        return sorted(ret, key=lambda x: x.full_title.lower())
+    @classmethod
+    def _filter_depth(
+        cls,
+        projects: QuerySet[Project],
+        depth: int,
+        parent: Optional[Project] = None,
+    ) -> QuerySet[Project]:
+        """
+        Limit projects to a number of levels under parent.
+
+        :param projects: QuerySet of Project objects
+        :param depth: Number of levels to include (int)
+        :param parent: Project object of type CATEGORY or None
+        :return: QuerySet of Project objects
+        """
+        if parent:
+            links = ProjectAncestor.objects.filter(
+                ancestor=parent, depth__lte=depth
+            )
+        else:  # Count levels from top level categories and projects
+            links = ProjectAncestor.objects.filter(
+                ancestor__parent__isnull=True, depth__lt=depth
+            )
+        return projects.filter(pk__in=links.values('descendant'))
+
+    @classmethod
+    def _get_child_counts(cls, projects: QuerySet[Project]) -> dict[int, int]:
+        """
+        Return number of direct children for each parent category within
+        projects.
+
+        :param projects: QuerySet of Project objects
+        :return: Dict of child counts with parent primary keys as keys
+        """
+        return dict(
+            projects.order_by()
+            .values('parent')
+            .annotate(count=Count('pk'))
+            .values_list('parent', 'count')
+        )
 
     @classmethod
     def _get_access(
@@ -267,6 +310,7 @@ class ProjectListAjaxView(SODARBaseAjaxView):
             return False
         return True
 
+    @method_decorator(condition(etag_func=get_project_list_etag))
     def get(self, request, *args, **kwargs):
         parent_uuid = request.GET.get('parent', None)
         parent = (
@@ -280,6 +324,20 @@ class ProjectListAjaxView(SODARBaseAjaxView):
                 },
                 status=400,
             )
+        try:
+            depth = int(request.GET.get('depth', 0))
+            offset = int(request.GET.get('offset', 0))
+            limit = int(request.GET.get('limit', 0))
+        except ValueError:
+            return Response(
+                {'detail': 'Invalid value for depth, offset or limit'},
+                status=400,
+            )
+        if depth < 0 or offset < 0 or limit < 0:
+            return Response(
+                {'detail': 'Depth, offset and limit must be positive'},
+                status=400,
+            )
         public_stat_cats = [
             s.project
             for s in AppSetting.objects.filter(
@@ -288,6 +346,15 @@ class ProjectListAjaxView(SODARBaseAjaxView):
         ]
 
         projects = self._get_projects(request.user, public_stat_cats, parent)
+        all_projects = projects
+        child_counts = None
+        project_count = None
+        if depth:
+            child_counts = self._get_child_counts(projects)
+            projects = self._filter_depth(projects, depth, parent)
+        if limit:
+            project_count = projects.count()
+            projects = projects[offset : offset + limit]
         # NOTE: Generally, manipulating AppSetting objects directly is not
         #       advised, but in this case it's pertinent for optimization :)
         blocked_projects = [
@@ -355,6 +422,8 @@ class ProjectListAjaxView(SODARBaseAjaxView):
             }
             if p.is_project():
                 rp['blocked'] = p in blocked_projects
+            elif child_counts is not None:
+                rp['children'] = child_counts.get(p.pk, 0)
             ret_projects.append(rp)
         ret = {
             'projects': ret_projects,
@@ -367,6 +436,13 @@ class ProjectListAjaxView(SODARBaseAjaxView):
                 ),
             },
         }
+        if project_count is not None:
+            ret['project_count'] = project_count
+        if depth:
+            ret['total_count'] = all_projects.count()
+            ret['starred_count'] = all_projects.filter(
+                pk__in=[p.pk for p in starred_projects]
+            ).count()
 
         if len(ret['projects']) == 0:
             np_prefix = 'No {} '.format(
@@ -394,46 +470,50 @@ class ProjectListColumnAjaxView(SODARBaseAjaxView):
     allow_anonymous = True
 
     @classmethod
-    def _get_column_value(
+    def _get_column_values(
         cls,
         app_plugin: Any,
         column_id: str,
-        project: Project,
+        projects: list[Project],
         user: User,
     ) -> dict:
         """
-        Return project list extra column value for a specific project and
-        column.
+        Return project list extra column values for multiple projects in a
+        specific column.
 
         :param app_plugin: Project app plugin object
         :param column_id: Column ID string corresponding to
                           plugin.project_list_columns (string)
-        :param project: Project object
+        :param projects: List of Project objects
         :param user: User object
-        :return: Dict
+        :return: Dict with project UUIDs as keys
         """
         try:
-            val = app_plugin.get_project_list_value(column_id, project, user)
-            return {'html': str(val) if val is not None else ''}
+            vals = app_plugin.get_project_list_values(column_id, projects, user)
         except Exception as ex:
             logger.error(
-                'Exception in {}.get_project_list_value(): "{}" '
-                '(column_id={}; project={}; user={})'.format(
+                'Exception in {}.get_project_list_values(): "{}" '
+                '(column_id={}; projects={}; user={})'.format(
                     app_plugin.name,
                     ex,
                     column_id,
-                    project.sodar_uuid,
+                    ', '.join(str(p.sodar_uuid) for p in projects),
                     user.username,
                 )
             )
-            return {'html': ''}
+            vals = {}
+        ret = {}
+        for p in projects:
+            val = vals.get(p.sodar_uuid)
+            ret[p.sodar_uuid] = {'html': str(val) if val is not None else ''}
+        return ret
 
     def post(self, request, *args, **kwargs):
         ret = {}
         projects = Project.objects.filter(
             type=PROJECT_TYPE_PROJECT,
             sodar_uuid__in=request.data.get('projects'),
-        )
+        ).select_related('public_access')
         plugins = [
             ap
             for ap in plugin_api.get_active_plugins(plugin_type='project_app')
@@ -443,6 +523,9 @@ class ProjectListColumnAjaxView(SODARBaseAjaxView):
                 or getattr(settings, 'FILESFOLDERS_SHOW_LIST_COLUMNS', False)
             )
         ]
+        # Resolve roles in bulk, also memoizing them for permission checks
+        RoleAssignment.objects.get_effective_roles(request.user, projects)
+        view_projects = []
         for project in projects:
             # Only provide results for projects in which user has access
             if not request.user.has_perm('projectroles.view_project', project):
@@ -451,14 +534,15 @@ class ProjectListColumnAjaxView(SODARBaseAjaxView):
                     f'not authorized to view project {project.get_log_title()}'
                 )
                 continue
-            p_uuid = str(project.sodar_uuid)
-            ret[p_uuid] = {}
-            for app_plugin in plugins:
-                ret[p_uuid][app_plugin.name] = {}
-                for k, v in app_plugin.project_list_columns.items():
-                    ret[p_uuid][app_plugin.name][k] = self._get_column_value(
-                        app_plugin, k, project, request.user
-                    )
+            view_projects.append(project)
+            ret[str(project.sodar_uuid)] = {}
+        for app_plugin in plugins:
+            for k in app_plugin.project_list_columns.keys():
+                vals = self._get_column_values(
+                    app_plugin, k, view_projects, request.user
+                )
+                for p_uuid, val in vals.items():
+                    ret[str(p_uuid)].setdefault(app_plugin.name, {})[k] = val
         return Response(ret, status=200)
 
 
@@ -468,14 +552,13 @@ class ProjectListRoleAjaxView(SODARBaseAjaxView):
     allow_anonymous = True
 
     @classmethod
-    def _get_user_role(cls, project: Project, user: User) -> dict:
+    def _get_user_role(
+        cls, project: Project, role_as: Optional[RoleAssignment]
+    ) -> dict:
         """Return user role for project"""
         ret = {'name': None, 'class': None}
-        role_as = None
-        if user.is_authenticated:
-            role_as = project.get_role(user)
-            if role_as:
-                ret['name'] = role_as.role.name.split(' ')[1].capitalize()
+        if role_as:
+            ret['name'] = role_as.role.name.split(' ')[1].capitalize()
         if project.public_access and not role_as:
             ret['name'] = project.public_access.name.split(' ')[1].capitalize()
         if not ret['name']:
@@ -487,6 +570,10 @@ class ProjectListRoleAjaxView(SODARBaseAjaxView):
         ret = {}
         projects = Project.objects.filter(
             sodar_uuid__in=request.data.get('projects'),
+        ).select_related('public_access')
+        # Resolve roles in bulk, also memoizing them for permission checks
+        roles = RoleAssignment.objects.get_effective_roles(
+            request.user, projects
         )
         for project in projects:
             # Only provide results for projects in which user has access
@@ -497,13 +584,17 @@ class ProjectListRoleAjaxView(SODARBaseAjaxView):
                 )
                 continue
             ret[str(project.sodar_uuid)] = self._get_user_role(
-                project, request.user
+                project, roles[project.pk]
             )
         return Response(ret, status=200)
 
 
 class PluginSearchResultsAjaxView(SODARBaseAjaxView):
-    """View for retrieving search results"""
+    """
+    View for retrieving search results. Results are cached for
+    PROJECTROLES_SEARCH_CACHE_TIMEOUT seconds per user, plugin, terms and
+    keywords.
+    """
 
     http_method_names = ['post']
 
@@ -533,18 +624,25 @@ class PluginSearchResultsAjaxView(SODARBaseAjaxView):
                 [],
             )
         rows = []
-        for project in Project.objects.find(
+        found_projects = Project.objects.find(
             terms,
             projects,
             project_type='PROJECT',
             keywords=keywords,
-        ):
+        ).select_related('parent')
+        # Resolve roles in projects and parents in bulk
+        roles = RoleAssignment.objects.get_effective_roles(
+            user,
+            set(found_projects)
+            | {p.parent for p in found_projects if p.parent},
+        )
+        for project in found_projects:
             can_view_project = project.public_access or user.has_perm(
                 'projectroles.view_project', project
             )
             can_find_project = can_view_project
             if user.is_authenticated and project.parent:
-                parent_as = project.parent.get_role(user)
+                parent_as = roles[project.parent_id]
                 if (
                     parent_as
                     and parent_as.role.rank >= ROLE_RANKING[PROJECT_ROLE_FINDER]
@@ -651,23 +749,40 @@ class PluginSearchResultsAjaxView(SODARBaseAjaxView):
                 f'of type "{search_type}".',
                 [],
             )
-        try:
-            app_results = plugin.search(terms, user, projects, **keywords)
-            return (None, app_results)
-        except Exception as ex:
-            if settings.DEBUG:
-                raise ex
-            logger.error(
-                'Exception raised by search() in {}: "{}" ({})'.format(
-                    plugin.name,
-                    ex,
-                    f'terms={terms}; '
-                    f'user={user}; '
-                    f'projects={projects}; '
-                    f'keywords={keywords}',
-                )
+        return plugin_api.search_plugins(
+            [plugin], terms, user, projects, keywords
+        )[plugin.name]
+
+    @classmethod
+    def _get_cache_key(
+        cls, user: User, plugin_name: str, terms: list[str], keywords: dict
+    ) -> Optional[str]:
+        """
+        Return cache key for plugin search results.
+
+        :param user: user who initiated the search
+        :param plugin_name: the plugin which should be searched
+        :param terms: Search terms (list of strings)
+        :param keywords: Optional keywords (dictionary or None)
+        :return: String or None if results should not be cached
+        """
+        if not get_search_cache_timeout(plugin_name):
+            return None
+        if plugin_name == 'projectroles':
+            app_label = plugin_name
+        else:
+            plugin = plugin_api.get_app_plugin(plugin_name)
+            app_config = (
+                apps.get_containing_app_config(plugin.__module__)
+                if plugin
+                else None
             )
-            return (str(ex), [])
+            if not app_config:
+                return None
+            app_label = app_config.label
+        return get_search_cache_key(
+            user, plugin_name, app_label, terms, keywords
+        )
 
     def dispatch(self, request, *args, **kwargs):
         if not getattr(settings, 'PROJECTROLES_ENABLE_SEARCH', False):
@@ -691,12 +806,20 @@ class PluginSearchResultsAjaxView(SODARBaseAjaxView):
             )
         search_terms = json.loads(data['terms'])
         search_keywords = json.loads(data['keywords'])
+        plugin_name = data['plugin']
+        cache_key = self._get_cache_key(
+            request.user, plugin_name, search_terms, search_keywords
+        )
+        if cache_key:
+            ret = cache.get(cache_key)
+            if ret is not None:
+                return JsonResponse(ret)
         if 'project' in search_keywords:
             try:
                 sodar_uuid = uuid.UUID(search_keywords['project'])
                 parent = Project.objects.get(sodar_uuid=sodar_uuid)
-                search_projects = Project.objects.filter(
-                    full_title__startswith=parent.full_title
+                search_projects = Project.objects.descendants_of(
+                    parent, include_self=True
                 )
             except ValueError:
                 # Not a valid UUID, trying to match project title directly
@@ -708,7 +831,7 @@ class PluginSearchResultsAjaxView(SODARBaseAjaxView):
         else:
             search_projects = Project.objects.all()
 
-        if (plugin_name := data['plugin']) == 'projectroles':
+        if plugin_name == 'projectroles':
             error, results = self._get_projectroles_search_results(
                 request.user,
                 search_terms,
@@ -723,9 +846,13 @@ class PluginSearchResultsAjaxView(SODARBaseAjaxView):
                 search_projects,
                 search_keywords,
             )
-        return JsonResponse(
-            {'error': error, 'results': [res.to_dict() for res in results]}
-        )
+        ret = {'error': error, 'results': [res.to_dict() for res in results]}
+        # Do not cache errors, e.g. timeouts
+        if cache_key and not error:
+            cache.set(
+                cache_key, ret, timeout=get_search_cache_timeout(plugin_name)
+            )
+        return JsonResponse(ret)
 
 
 class CategoryStatisticsAjaxView(SODARBaseAjaxView):
@@ -746,10 +873,11 @@ class CategoryStatisticsAjaxView(SODARBaseAjaxView):
         ret = []
         # Project count
         title = get_display_name(PROJECT_TYPE_PROJECT, title=True, plural=True)
-        val = Project.objects.filter(
-            type=PROJECT_TYPE_PROJECT,
-            full_title__startswith=category.full_title + CAT_DELIMITER,
-        ).count()
+        val = (
+            Project.objects.descendants_of(category)
+            .filter(type=PROJECT_TYPE_PROJECT)
+            .count()
+        )
         desc = '{} in this {}'.format(
             get_display_name(PROJECT_TYPE_PROJECT, plural=True, title=True),
             get_display_name(PROJECT_TYPE_CATEGORY),
@@ -764,14 +892,13 @@ class CategoryStatisticsAjaxView(SODARBaseAjaxView):
             )
         )
         # User count
-        children = Project.objects.filter(
-            full_title__startswith=category.full_title + CAT_DELIMITER,
-        )
         title = 'Members'
         # NOTE: We need order_by() for distinct() to work
         val = (
             RoleAssignment.objects.filter(
-                project__in=[category] + list(children)
+                project__in=Project.objects.descendants_of(
+                    category, include_self=True
+                )
             )
             .values_list('user', flat=True)
             .distinct()
@@ -1004,6 +1131,9 @@ class UserAutocompleteAjaxView(autocomplete.Select2QuerySetView):
         - "project": project UUID
         - "scope": string for expected scope (all/project/project_exclude)
         - "exclude": list of explicit User.sodar_uuid to exclude from queryset
+
+        Results are ordered by similarity to the query and limited to
+        USER_AUTOCOMPLETE_LIMIT users.
         """
         current_user = self.request.user
         project_uuid = self.forwarded.get('project', None)
@@ -1019,7 +1149,9 @@ class UserAutocompleteAjaxView(autocomplete.Select2QuerySetView):
                 'projectroles.view_project', project
             ):
                 return User.objects.none()
-            project_users = [a.user.pk for a in project.get_roles()]
+            project_users = EffectiveRole.objects.filter(
+                project=project
+            ).values('user')
             if scope == 'project':  # Limit choices to current project users
                 qs = qs.filter(pk__in=project_users)
             elif scope == 'project_exclude':  # Exclude project users
@@ -1034,16 +1166,18 @@ class UserAutocompleteAjaxView(autocomplete.Select2QuerySetView):
         # Exclude UUIDs explicitly given
         if exclude_uuids:
             qs = qs.exclude(sodar_uuid__in=exclude_uuids)
-        # Finally, filter by query
+        # Finally, filter by query and rank by similarity
         if self.q:
-            qs = qs.filter(
-                Q(username__icontains=self.q)
-                | Q(first_name__icontains=self.q)
-                | Q(last_name__icontains=self.q)
-                | Q(name__icontains=self.q)
-                | Q(email__icontains=self.q)
+            qs = (
+                qs.filter(search_text__icontains=self.q)
+                .annotate(
+                    similarity=TrigramWordSimilarity(self.q, 'search_text')
+                )
+                .order_by('-similarity', 'name')
             )
-        return qs.order_by('name')
+        else:
+            qs = qs.order_by('name')
+        return qs[:USER_AUTOCOMPLETE_LIMIT]
 
     def get_result_label(self, user):
         """Display options with name, username and email address"""
@@ -10,8 +10,11 @@ from django.conf import settings
 from django.contrib import auth
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
+from django.db.models import Q
 from django.http import HttpRequest
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
 from rest_framework import serializers
 from rest_framework.exceptions import (
@@ -27,7 +30,10 @@ from rest_framework.generics import (
     UpdateAPIView,
     DestroyAPIView,
 )
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import (
+    CursorPagination,
+    PageNumberPagination,
+)
 from rest_framework.permissions import (
     BasePermission,
     AllowAny,
@@ -41,16 +47,18 @@ from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, inline_serializer
 
 from projectroles.app_settings import AppSettingAPI
+from projectroles.cache import get_project_list_etag, has_perm_cached
 from projectroles.forms import INVITE_EXISTS_MSG
+from projectroles.ip_access import check_ip_access
 from projectroles.models import (
     Project,
+    ProjectAncestor,
     Role,
     RoleAssignment,
     ProjectInvite,
     RemoteSite,
     AppSetting,
     SODAR_CONSTANTS,
-    CAT_DELIMITER,
     ROLE_RANKING,
     ROLE_PROJECT_TYPE_ERROR_MSG,
 )
@@ -59,6 +67,7 @@ from projectroles.remote_projects import RemoteProjectAPI
 from projectroles.serializers import (
     ProjectSerializer,
     RoleAssignmentSerializer,
+    RoleAssignmentBulkCreateSerializer,
     ProjectInviteSerializer,
     AppSettingSerializer,
     SODARUserSerializer,
@@ -101,8 +110,8 @@ APP_SETTING_SCOPE_PROJECT_USER = SODAR_CONSTANTS[
 PROJECTROLES_API_MEDIA_TYPE = (
     'application/vnd.bihealth.sodar-core.projectroles+json'
 )
-PROJECTROLES_API_DEFAULT_VERSION = '2.0'
-PROJECTROLES_API_ALLOWED_VERSIONS = ['1.0', '1.1', '2.0']
+PROJECTROLES_API_DEFAULT_VERSION = '2.1'
+PROJECTROLES_API_ALLOWED_VERSIONS = ['1.0', '1.1', '2.0', '2.1']
 SYNC_API_MEDIA_TYPE = (
     'application/vnd.bihealth.sodar-core.projectroles.sync+json'
 )
@@ -133,6 +142,7 @@ CAT_PUBLIC_STATS_API_MSG = (
 )
 VERSION_1_1 = parse_version('1.1')
 VERSION_2_0 = parse_version('2.0')
+VERSION_2_1 = parse_version('2.1')
 
 
 # Permission / Versioning / Renderer Classes -----------------------------------
@@ -180,49 +190,6 @@ class SODARAPIProjectPermission(ProjectAccessMixin, BasePermission):
                 INVALID_PROJECT_TYPE_MSG.format(project_type=project.type)
             )
 
-        # Prohibit access if project_access_block is set
-        if (
-            not request.user.is_superuser
-            and project.is_project()
-            and app_settings.get(
-                APP_NAME, 'project_access_block', project=project
-            )
-        ):
-            raise PermissionDenied(
-                PROJECT_BLOCK_MSG.format(
-                    project_type=get_display_name(project.type)
-                )
-            )
-
-        owner_or_delegate = project.is_owner_or_delegate(request.user)
-        if not (
-            request.user.is_superuser or owner_or_delegate
-        ) and app_settings.get(APP_NAME, 'ip_restrict', project):
-            for k in (
-                'HTTP_X_FORWARDED_FOR',
-                'X_FORWARDED_FOR',
-                'FORWARDED',
-                'REMOTE_ADDR',
-            ):
-                v = request.META.get(k)
-                if v:
-                    client_address = ip_address(v.split(',')[0])
-                    break
-            else:  # Can't fetch client IP address
-                return False
-
-            ips = app_settings.get(APP_NAME, 'ip_allow_list', project)
-            if not ips:
-                return False
-            for ip in [s.strip() for s in ips.split(',')]:
-                if '/' in ip:
-                    if client_address in ip_network(ip):
-                        break
-                elif client_address == ip_address(ip):
-                    break
-            else:
-                return False
-
         if not hasattr(view, 'permission_required') and (
             not hasattr(view, 'get_permission_required')
             or not callable(getattr(view, 'get_permission_required', None))
@@ -241,7 +208,42 @@ class SODARAPIProjectPermission(ProjectAccessMixin, BasePermission):
         if isinstance(perm, (list, tuple)) and len(perm) > 0:
             # TODO: TBD: Raise exception / log warning if given multiple perms?
             perm = perm[0]
-        return request.user.has_perm(perm, project)
+        return self.has_project_permission(request, project, perm)
+
+    @classmethod
+    def has_project_permission(
+        cls, request: HttpRequest, project: Project, perm: str
+    ) -> bool:
+        """
+        Check project access and permission for the requesting user. Can also
+        be used for projects not set in view kwargs, e.g. in bulk operations.
+
+        :param request: HttpRequest object
+        :param project: Project object
+        :param perm: Permission name (string)
+        :raise: PermissionDenied if access to project is blocked
+        :return: Boolean
+        """
+        # Prohibit access if project_access_block is set
+        if (
+            not request.user.is_superuser
+            and project.is_project()
+            and app_settings.get(
+                APP_NAME, 'project_access_block', project=project
+            )
+        ):
+            raise PermissionDenied(
+                PROJECT_BLOCK_MSG.format(
+                    project_type=get_display_name(project.type)
+                )
+            )
+
+        owner_or_delegate = project.is_owner_or_delegate(request.user)
+        if not (
+            request.user.is_superuser or owner_or_delegate
+        ) and not check_ip_access(request, project):
+            return False
+        return has_perm_cached(request.user, perm, project)
 
 
 # Base API View Mixins ---------------------------------------------------------
@@ -341,6 +343,37 @@ class SODARPageNumberPagination(PageNumberPagination):
         return super().paginate_queryset(queryset, request, view)
 
 
+class SODARCursorPagination(CursorPagination):
+    """
+    Override of CursorPagination to provide optional keyset pagination.
+
+    If the "cursor" query string is not present, results will be provided as a
+    full unpaginated list. Provide an empty "cursor" query string to retrieve
+    the first page.
+
+    If the "cursor" query string is included, results will be presented in the
+    default ``CursorPagination`` dict format, with ``next`` and ``previous``
+    links containing the cursor for the adjacent pages. As pages are retrieved
+    by filtering on the ordering field instead of an offset, retrieving later
+    pages is as fast as retrieving the first one.
+
+    Set ``cursor_ordering`` in the view to override the ordering. The first
+    ordering field should be unique or nearly unique and indexed.
+
+    See: https://www.django-rest-framework.org/api-guide/pagination/#cursorpagination
+    """
+
+    ordering = ('pk',)
+
+    def get_ordering(self, request, queryset, view):
+        return getattr(view, 'cursor_ordering', None) or self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
 # SODAR Core Base Views and Mixins ---------------------------------------------
 
 
@@ -411,6 +444,16 @@ class ProjectListAPIView(ProjectrolesAPIVersioningMixin, ListAPIView):
     will return results in the Django Rest Framework ``PageNumberPagination``
     format.
 
+    Alternatively supports optional cursor pagination by providing the
+    ``cursor`` query string. Provide an empty value for the first page. This
+    will return results in the Django Rest Framework ``CursorPagination``
+    format, ordered by full title. Retrieve the following pages using the
+    ``next`` URL in the results. If both are provided, ``cursor`` is used.
+
+    Supports conditional requests: the response includes an ``ETag`` header,
+    and if the ``If-None-Match`` header matches it, ``304 Not Modified`` is
+    returned without content.
+
     **URL:** ``/project/api/list``
 
     **Methods:** ``GET``
@@ -418,6 +461,7 @@ class ProjectListAPIView(ProjectrolesAPIVersioningMixin, ListAPIView):
     **Parameters:**
 
     - ``page``: Page number for paginated results (int, optional)
+    - ``cursor``: Cursor for cursor paginated results (string, optional)
 
     **Returns:**
 
@@ -425,38 +469,52 @@ class ProjectListAPIView(ProjectrolesAPIVersioningMixin, ListAPIView):
     finder role, only lists title and UUID of projects.
     """
 
+    cursor_ordering = ('full_title', 'pk')
     pagination_class = SODARPageNumberPagination
     permission_classes = [IsAuthenticated]
     serializer_class = ProjectSerializer
 
+    @property
+    def paginator(self):
+        """Return cursor paginator if cursor query string is present"""
+        if not hasattr(self, '_paginator'):
+            request = getattr(self, 'request', None)
+            if (
+                request
+                and SODARCursorPagination.cursor_query_param
+                in request.query_params
+            ):
+                self._paginator = SODARCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    @method_decorator(condition(etag_func=get_project_list_etag))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def get_queryset(self):
         """
         Override get_queryset() to return categories and projects to which the
-        user has access. NOTE: Returns a list, not a QuerySet.
+        user has access: projects with a local role for the user in the
+        project or any of its parent categories, as well as projects with
+        public access.
 
-        :return: List of Project objects
+        :return: QuerySet of Project objects
         """
-        projects_all = Project.objects.all().order_by('full_title')
+        projects = ProjectSerializer.setup_eager_loading(
+            Project.objects.all(), self.request
+        ).order_by('full_title', 'pk')
         if self.request.user.is_superuser:
-            qs = projects_all
-        else:
-            qs = []
-            role_cats = []
-            projects_local = [
-                a.project
-                for a in RoleAssignment.objects.filter(user=self.request.user)
-            ]
-            for p in projects_all:
-                local_role = p in projects_local
-                if (
-                    local_role
-                    or p.public_access
-                    or any(p.full_title.startswith(c) for c in role_cats)
-                ):
-                    qs.append(p)
-                if local_role and p.is_category():
-                    role_cats.append(p.full_title + CAT_DELIMITER)
-        return qs
+            return projects
+        return projects.filter(
+            Q(public_access__isnull=False)
+            | Q(
+                pk__in=ProjectAncestor.objects.filter(
+                    ancestor__local_roles__user=self.request.user
+                ).values('descendant')
+            )
+        )
 
 
 class ProjectRetrieveAPIView(
@@ -498,6 +556,11 @@ class ProjectRetrieveAPIView(
     permission_required = 'projectroles.view_project'
     serializer_class = ProjectSerializer
 
+    def get_queryset(self):
+        return ProjectSerializer.setup_eager_loading(
+            Project.objects.all(), self.request
+        )
+
 
 class ProjectCreateAPIView(
     ProjectrolesAPIVersioningMixin, ProjectAccessMixin, CreateAPIView
@@ -640,6 +703,48 @@ class RoleAssignmentCreateAPIView(
     serializer_class = RoleAssignmentSerializer
 
 
+class RoleAssignmentBulkCreateAPIView(
+    ProjectrolesAPIVersioningMixin, CreateAPIView
+):
+    """
+    Create multiple role assignments in one or more projects.
+
+    All entries are validated together. If any entry is invalid, no role
+    assignments are created and errors are returned for each invalid entry.
+    The requesting user must have the permission to modify members in each
+    project. Assignments are created in a single transaction. Notifications
+    are aggregated, so each user receives at most one email.
+
+    **URL:** ``/project/api/roles/bulk-create``
+
+    **Methods:** ``POST``
+
+    **Parameters:**
+
+    - ``roles``: List of role assignments (list of dicts)
+        * ``project``: Project UUID (string)
+        * ``user``: User UUID (string)
+        * ``role``: Desired role for user (string, e.g. "project contributor")
+
+    **Returns:**
+
+    - ``roles``: Created role assignments (list of dicts)
+
+    **Version Changes:**
+
+    - ``2.1``: Add view
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = RoleAssignmentBulkCreateSerializer
+
+    def post(self, request, *args, **kwargs):
+        """Override post() to check for API version"""
+        if parse_version(request.version) < VERSION_2_1:
+            raise NotAcceptable(VIEW_NOT_ACCEPTABLE_VERSION_MSG)
+        return super().post(request, *args, **kwargs)
+
+
 class RoleAssignmentUpdateAPIView(
     ProjectrolesAPIVersioningMixin, SODARAPIGenericProjectMixin, UpdateAPIView
 ):
@@ -1539,7 +1644,9 @@ class UserListAPIView(ProjectrolesAPIVersioningMixin, ListAPIView):
         version = parse_version(self.request.version)
         if inc_system and version < VERSION_1_1:
             raise NotAcceptable(USER_LIST_INCLUDE_VERSION_MSG)
-        qs = User.objects.all().order_by('pk')
+        qs = SODARUserSerializer.setup_eager_loading(
+            User.objects.all(), self.request
+        ).order_by('pk')
         if self.request.user.is_superuser or inc_system:
             return qs
         return qs.exclude(groups__name=SODAR_CONSTANTS['SYSTEM_USER_GROUP'])
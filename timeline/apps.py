@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class TimelineConfig(AppConfig):
     name = 'timeline'
+
+    def ready(self):
+        import timeline.signals  # noqa
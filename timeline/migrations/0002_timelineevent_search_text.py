@@ -0,0 +1,79 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:58
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Concat
+
+
+def populate_search_text(apps, schema_editor):
+    """Populate TimelineEvent search_text fields"""
+    TimelineEvent = apps.get_model('timeline', 'TimelineEvent')
+    TimelineEventObjectRef = apps.get_model(
+        'timeline', 'TimelineEventObjectRef'
+    )
+    names = (
+        TimelineEventObjectRef.objects.filter(event=OuterRef('pk'))
+        .values('event')
+        .annotate(
+            names=StringAgg(
+                Concat(
+                    Value('\n', output_field=models.TextField()),
+                    Cast('name', models.TextField()),
+                    output_field=models.TextField(),
+                ),
+                delimiter='',
+                order_by='pk',
+            )
+        )
+        .values('names')
+    )
+    TimelineEvent.objects.update(
+        search_text=Concat(
+            Cast('event_name', models.TextField()),
+            Value('\n', output_field=models.TextField()),
+            Cast('description', models.TextField()),
+            Coalesce(
+                Subquery(names, output_field=models.TextField()),
+                Value('', output_field=models.TextField()),
+            ),
+            output_field=models.TextField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('projectroles', '0049_project_trigram_indexes'),
+        ('timeline', '0001_squashed_0015_make_uuid_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='timelineevent',
+            name='search_text',
+            field=models.TextField(
+                default='',
+                editable=False,
+                help_text='Event name, description and object names for '
+                'search (auto-generated)',
+            ),
+        ),
+        migrations.RunPython(
+            code=populate_search_text,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name='timelineevent',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('search_text'),
+                    name='gin_trgm_ops',
+                ),
+                name='timelineevent_search_trgm',
+            ),
+        ),
+    ]
@@ -7,8 +7,11 @@ from datetime import datetime
 from typing import Any, Optional, Union
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db.models import Max, Q, QuerySet
+from django.db.models.functions import Upper
 
 # Projectroles dependency
 from projectroles.models import Project
@@ -42,6 +45,7 @@ DEFAULT_MESSAGES = {
     TL_STATUS_CANCEL: 'Action cancelled',
 }
 OBJ_REF_UNNAMED = '(unnamed)'
+SEARCH_TEXT_DELIMITER = '\n'
 
 
 class TimelineEventManager(models.Manager):
@@ -76,7 +80,8 @@ class TimelineEventManager(models.Manager):
         keywords: Optional[dict] = None,
     ) -> QuerySet:
         """
-        Return events matching the query.
+        Return events matching the query. Event names, descriptions and object
+        names are looked up using the trigram indexed search_text field.
 
         :param search_terms: Search terms (list of strings)
         :param projects: QuerySet of projects where the terms are searched
@@ -90,13 +95,16 @@ class TimelineEventManager(models.Manager):
             .filter(Q(project__in=projects) | Q(project__isnull=True))
         )
         term_query = Q()
+        user_query = Q()
         for t in search_terms:
-            term_query.add(Q(event_name__icontains=t), Q.OR)
-            term_query.add(Q(event_name__icontains=t.replace(' ', '_')), Q.OR)
-            term_query.add(Q(description__icontains=t), Q.OR)
-            term_query.add(Q(event_objects__name__icontains=t), Q.OR)
-            term_query.add(Q(user__name__icontains=t), Q.OR)
-            term_query.add(Q(user__username__icontains=t), Q.OR)
+            term_query.add(Q(search_text__icontains=t), Q.OR)
+            term_query.add(Q(search_text__icontains=t.replace(' ', '_')), Q.OR)
+            user_query.add(Q(name__icontains=t), Q.OR)
+            user_query.add(Q(username__icontains=t), Q.OR)
+        if user_query:
+            # Filter users in a subquery to avoid joining the user table
+            users = get_user_model().objects.filter(user_query).values('pk')
+            term_query.add(Q(user__in=users), Q.OR)
         items = (
             objects.filter(term_query)
             .annotate(timestamp=Max('status_changes__timestamp'))
@@ -168,9 +176,26 @@ class TimelineEvent(models.Model):
         default=uuid.uuid4, unique=True, help_text='Event SODAR UUID'
     )
 
+    #: Event name, description and object names for search (auto-generated)
+    search_text = models.TextField(
+        default='',
+        editable=False,
+        help_text='Event name, description and object names for search '
+        '(auto-generated)',
+    )
+
     # Set manager for custom queries
     objects = TimelineEventManager()
 
+    class Meta:
+        # Trigram index for case-insensitive partial matching in find()
+        indexes = [
+            GinIndex(
+                OpClass(Upper('search_text'), name='gin_trgm_ops'),
+                name='timelineevent_search_trgm',
+            ),
+        ]
+
     def __str__(self):
         return '{}{}{}'.format(
             (self.project.title + ': ') if self.project else '',
@@ -190,6 +215,32 @@ class TimelineEvent(models.Model):
             self.user.username if self.user else 'N/A',
         ]
 
+    def save(self, *args, **kwargs):
+        """Custom field populating for TimelineEvent"""
+        self.search_text = self._get_search_text()
+        super().save(*args, **kwargs)
+
+    def _get_search_text(self) -> str:
+        """Return search text from event name, description and objects"""
+        names = (
+            list(self.event_objects.values_list('name', flat=True))
+            if self.pk
+            else []
+        )
+        return SEARCH_TEXT_DELIMITER.join(
+            [self.event_name, self.description] + names
+        )
+
+    def update_search_text(self):
+        """
+        Update search text of the event in the database. Called when object
+        references are added to or deleted from an existing event.
+        """
+        self.search_text = self._get_search_text()
+        TimelineEvent.objects.filter(pk=self.pk).update(
+            search_text=self.search_text
+        )
+
     def get_status(self) -> Optional['TimelineEventStatus']:
         """Return the current event status"""
         return self.status_changes.order_by('-timestamp').first()
@@ -350,6 +401,11 @@ class TimelineEventObjectRef(models.Model):
             ', '.join(repr(v) for v in values)
         )
 
+    def save(self, *args, **kwargs):
+        """Custom saving for TimelineEventObjectRef"""
+        super().save(*args, **kwargs)
+        self.event.update_search_text()
+
     def get_project(self) -> Project:
         """Return the project for the event"""
         return self.event.project
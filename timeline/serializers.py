@@ -20,6 +20,8 @@ class ExtraDataRepresentationMixin:
 
     def to_representation(self, instance):
         ret = super().to_representation(instance)
+        if 'extra_data' not in ret:
+            return ret
         user = self.context['request'].user
         project = instance.get_project()
         if (
@@ -0,0 +1,15 @@
+"""Signal handlers for the timeline app"""
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from timeline.models import TimelineEvent, TimelineEventObjectRef
+
+
+@receiver(post_delete, sender=TimelineEventObjectRef)
+def update_event_search_text(sender, instance, **kwargs):
+    """Update event search text on object reference deletion"""
+    # Event may already be deleted if the reference was removed in cascade
+    event = TimelineEvent.objects.filter(pk=instance.event_id).first()
+    if event:
+        event.update_search_text()
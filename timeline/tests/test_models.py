@@ -353,6 +353,31 @@ class TestTimelineEvent(
         new_obj = self.event.add_object(obj=new_as, label='new_label', name='')
         self.assertEqual(new_obj.name, OBJ_REF_UNNAMED)
 
+    def test_search_text(self):
+        """Test search_text populating"""
+        self.event.refresh_from_db()
+        self.assertEqual(
+            self.event.search_text, 'test_event\ndescription\ntest_object_name'
+        )
+
+    def test_search_text_add_object(self):
+        """Test search_text populating with add_object()"""
+        self.event.add_object(
+            obj=self.assignment_owner, label='new_label', name='new_name'
+        )
+        self.event.refresh_from_db()
+        self.assertIn('new_name', self.event.search_text.split('\n'))
+
+    def test_search_text_delete_object(self):
+        """Test search_text populating after deleting object reference"""
+        self.obj_ref.delete()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.search_text, 'test_event\ndescription')
+        objects = TimelineEvent.objects.find(
+            ['test_object_name'], Project.objects.all()
+        )
+        self.assertEqual(len(objects), 0)
+
     def test_find_event_name(self):
         """Test TimelineEvent.find() with event name"""
         objects = TimelineEvent.objects.find(
@@ -361,6 +386,13 @@ class TestTimelineEvent(
         self.assertEqual(len(objects), 1)
         self.assertEqual(objects[0], self.event)
 
+    def test_find_event_name_space(self):
+        """Test find() with event name separated by space"""
+        objects = TimelineEvent.objects.find(
+            ['test event'], Project.objects.all()
+        )
+        self.assertEqual(list(objects), [self.event])
+
     def test_find_description(self):
         """Test find() with event description"""
         objects = TimelineEvent.objects.find(
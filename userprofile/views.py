@@ -108,13 +108,13 @@ class UserAppSettingsView(
 
     def form_valid(self, form):
         result = super().form_valid(form)
+        values = {}
         for k, v in form.cleaned_data.items():
             if k.startswith('settings.'):
                 _, plugin_name, setting_name = k.split('.', 3)
                 # TODO: Omit global USER settings (#1329)
-                app_settings.set(
-                    plugin_name, setting_name, v, user=self.request.user
-                )
+                values[(plugin_name, setting_name)] = v
+        app_settings.set_many(values, user=self.request.user)
         messages.success(self.request, SETTING_UPDATE_MSG)
         return result
 